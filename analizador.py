@@ -0,0 +1,78 @@
+# analizador.py
+# Tubería completa en memoria: léxico -> sintáctico sin pasar por Tokens.txt.
+# Las tablas en disco (Tokens.txt, Errores.txt, Errores_Sintácticos.txt)
+# quedan como una exportación opcional.
+from dataclasses import dataclass, field
+
+from lexer import scan
+from sintactic import escribir_reporte, MAX_ERRORES
+from parser_codigos import ParserCodigos
+from parser_iterativo import ParserCodigosIterativo
+from instrumentacion import fase
+from tablas import escribir_tabla_tokens, escribir_tabla_errores  # reexportadas
+
+
+@dataclass
+class Resultado:
+    tokens: list                                    # lexer.Token
+    errores_lexicos: list                           # lexer.ErrorLexico
+    errores_sintacticos: list = field(default_factory=list)  # mensajes del Parser
+    errores_semanticos: list = None                 # None: sin análisis semántico
+
+
+def parsear(tokens, iterativo=False, max_errores=MAX_ERRORES):
+    """
+    Errores sintácticos de `tokens` (mensajes de ParserCodigos). Se intenta
+    primero con el parser recursivo, el más rápido; si el anidamiento del
+    fuente rebasa el límite de recursión de Python se repite el análisis con
+    ParserCodigosIterativo, que da los mismos mensajes sin ese límite. Con
+    iterativo=True se usa la variante iterativa desde el principio.
+    """
+    if not iterativo:
+        parser = ParserCodigos(tokens, max_errores)
+        try:
+            return parser.parse(reporte=False)
+        except RecursionError:
+            pass
+    return ParserCodigosIterativo(tokens, max_errores).parse(reporte=False)
+
+
+def analyze(codigo, motor="regex", iterativo=False, semantico=False):
+    """
+    Analiza léxica y sintácticamente el código fuente, sin E/S. Los
+    lexer.Token van directo a ParserCodigos, la subclase de sintactic.Parser
+    que trabaja sobre los códigos enteros (mismos mensajes que Parser, sin
+    convertir cada token con tokens_desde_lexer); ver parsear(): ningún
+    anidamiento lo detiene. Con iterativo=True se usa siempre su variante
+    iterativa. Con semantico=True se construye el árbol (ParserAST)
+    y se hace también el análisis semántico.
+    """
+    with fase("scan"):
+        tokens, errores = scan(codigo, motor=motor)
+    if semantico:
+        from semantico import analizar_semantica
+        from arbol import construir_arbol
+        with fase("parse"):
+            arbol, sintacticos = construir_arbol(tokens)
+        with fase("semantico"):
+            return Resultado(tokens, errores, sintacticos, analizar_semantica(arbol))
+    with fase("parse"):
+        sintacticos = parsear(tokens, iterativo)
+    return Resultado(tokens, errores, sintacticos)
+
+
+def exportar(resultado, ruta_tokens="Tokens.txt", ruta_errores="Errores.txt",
+             ruta_sintacticos="Errores_Sintácticos.txt", ruta_semanticos="Errores_Semánticos.txt"):
+    """
+    Escribe las tablas del resultado; una ruta en None omite esa tabla.
+    Errores_Semánticos.txt solo se escribe si hubo análisis semántico.
+    """
+    if ruta_tokens:
+        escribir_tabla_tokens(resultado.tokens, ruta_tokens)
+    if ruta_errores:
+        escribir_tabla_errores(resultado.errores_lexicos, ruta_errores)
+    if ruta_sintacticos:
+        escribir_reporte(resultado.errores_sintacticos, ruta_sintacticos)
+    if ruta_semanticos and resultado.errores_semanticos is not None:
+        from semantico import escribir_reporte as escribir_reporte_semantico
+        escribir_reporte_semantico(resultado.errores_semanticos, ruta_semanticos)
@@ -0,0 +1,290 @@
+# arbol.py
+# Árbol de sintaxis abstracta en una arena compacta: cada nodo es un índice y
+# sus datos viven en arreglos paralelos (tipo, línea, primer hijo, siguiente
+# hermano) en lugar de un objeto por nodo. ParserAST lo construye mientras
+# analiza, con los mismos mensajes de error que Parser.
+from array import array
+
+from sintactic import TOKEN_MAP, MAX_ERRORES
+from parser_codigos import (ParserCodigos, IDS, CTES, OP_ARIT, OP_REL, OP_LOG, OP_ASIG,
+                            TIPOS_RETORNO, C)
+from parser_iterativo import ParserCodigosIterativo
+
+# Tipos de nodo: > 0 producción (índice en PRODUCCIONES + 1), < 0 token hoja
+# (su código de TokenCodes.MAP).
+PRODUCCIONES = ParserCodigos.PRODUCCIONES
+_TIPO_PRODUCCION = {nombre: k + 1 for k, nombre in enumerate(PRODUCCIONES)}
+
+# Tokens que se guardan como hojas; palabras clave y puntuación solo dan forma
+# al árbol. 'sino' se conserva como marca: en un nodo SI separa los estatutos
+# del bloque verdadero de los del bloque 'sino'.
+HOJAS = (IDS | CTES | OP_ARIT | OP_REL | OP_LOG | OP_ASIG | TIPOS_RETORNO
+         | {C["!"], C["sino"]})
+
+# Producciones que, con un solo hijo, se reemplazan por ese hijo
+# (p. ej. OPERANDO -> ID_ARREGLO -> $x queda como la hoja $x). Una llamada a
+# método siempre queda como nodo OPERANDO, aunque no tenga argumentos.
+COLAPSABLES = frozenset(_TIPO_PRODUCCION[p] for p in ("ESTATUTO", "OPERANDO", "ID_ARREGLO", "EXP_ARIT"))
+_OPERANDO = _TIPO_PRODUCCION["OPERANDO"]
+_ID_ARROBA, _PAR_AP = C["@identificador"], C["("]
+
+NINGUNO = -1
+
+PASO_AVANCE = 1 << 14     # tokens entre llamadas a avance(pos) (ver ParserAST)
+
+
+def nombre_tipo(tipo):
+    if tipo > 0:
+        return PRODUCCIONES[tipo - 1]
+    return TOKEN_MAP.get(tipo, f"DESCONOCIDO_{tipo}")
+
+
+class Arbol:
+    """Arena de nodos: el nodo i es la posición i de cada arreglo."""
+
+    def __init__(self):
+        self.tipos = array('b')
+        self.lineas = array('i')
+        self.primer_hijo = array('i')
+        self.siguiente = array('i')     # siguiente hermano
+        self.lexemas = []               # lexema de las hojas, None en producciones
+
+    def nuevo(self, tipo, linea, lexema=None):
+        self.tipos.append(tipo)
+        self.lineas.append(linea)
+        self.primer_hijo.append(NINGUNO)
+        self.siguiente.append(NINGUNO)
+        self.lexemas.append(lexema)
+        return len(self.tipos) - 1
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def nombre(self, nodo):
+        return nombre_tipo(self.tipos[nodo])
+
+    def es_hoja(self, nodo):
+        return self.tipos[nodo] < 0
+
+    def hijos(self, nodo):
+        h = self.primer_hijo[nodo]
+        while h != NINGUNO:
+            yield h
+            h = self.siguiente[h]
+
+    def recorrer(self, nodo=0):
+        """Preorden iterativo (sin recursión) desde `nodo`."""
+        if not len(self):
+            return
+        primer_hijo, siguiente = self.primer_hijo, self.siguiente
+        pila = [nodo]
+        while pila:
+            n = pila.pop()
+            yield n
+            h = primer_hijo[n]
+            if h != NINGUNO:
+                inicio = len(pila)
+                while h != NINGUNO:
+                    pila.append(h)
+                    h = siguiente[h]
+                pila[inicio:] = pila[inicio:][::-1]  # invertir solo los hijos recién agregados
+
+    def a_texto(self, nodo=0):
+        """Vista indentada del subárbol (para depuración y la línea de comandos)."""
+        if not len(self):
+            return ""
+        lineas = []
+        pila = [(nodo, 0)]
+        while pila:
+            n, nivel = pila.pop()
+            texto = self.nombre(n)
+            if self.lexemas[n] is not None:
+                texto += f" {self.lexemas[n]}"
+            lineas.append(f"{'  ' * nivel}{texto}  [L{self.lineas[n]}]")
+            pila.extend((h, nivel + 1) for h in reversed(list(self.hijos(n))))
+        return "\n".join(lineas) + "\n"
+
+
+class Visitante:
+    """
+    Recorrido iterativo del árbol con despacho por tipo de nodo: se llama
+    visitar_<NOMBRE>(arbol, nodo) al entrar y salir_<NOMBRE>(arbol, nodo) al
+    salir (NOMBRE es la producción, p. ej. SI, o el tipo de token, p. ej.
+    ID_DOLAR). Si visitar_* devuelve False no se visitan los hijos.
+    """
+
+    def visitar(self, arbol, nodo=0):
+        if not len(arbol):
+            return
+        # Despacho por tipo ya resuelto; se conserva entre llamadas anidadas
+        entradas = self.__dict__.setdefault("_entradas", {})
+        salidas = self.__dict__.setdefault("_salidas", {})
+        tipos, primer_hijo, siguiente = arbol.tipos, arbol.primer_hijo, arbol.siguiente
+        pila = [(nodo, False)]
+        while pila:
+            n, saliendo = pila.pop()
+            tipo = tipos[n]
+            if saliendo:
+                fn = salidas.get(tipo)
+                if fn is None:
+                    fn = salidas[tipo] = getattr(self, "salir_" + nombre_tipo(tipo), self.salir)
+                fn(arbol, n)
+                continue
+            fn = entradas.get(tipo)
+            if fn is None:
+                fn = entradas[tipo] = getattr(self, "visitar_" + nombre_tipo(tipo), self.generico)
+            if fn(arbol, n) is False:
+                continue
+            pila.append((n, True))
+            h = primer_hijo[n]
+            inicio = len(pila)
+            while h != NINGUNO:
+                pila.append((h, False))
+                h = siguiente[h]
+            pila[inicio:] = pila[inicio:][::-1]
+
+    def generico(self, arbol, nodo):
+        """Nodo sin visitar_<NOMBRE>: se visitan sus hijos."""
+        return None
+
+    def salir(self, arbol, nodo):
+        return None
+
+
+class ParserAST(ParserCodigos):
+    """
+    ParserCodigos que además construye el árbol en self.arbol (nodo raíz 0,
+    la producción PROG). Los errores se reportan igual; ante errores el
+    árbol contiene lo que se pudo reconocer.
+    """
+
+    def __init__(self, tokens, max_errores=MAX_ERRORES, avance=None):
+        super().__init__(tokens, max_errores)
+        self.arbol = Arbol()
+        self._abiertos = []   # [nodo, último hijo, tipo, línea] de las producciones en curso
+        if avance is not None:
+            # avance(pos) cada PASO_AVANCE tokens (informar, o cancelar con
+            # una excepción); sin él, advance() no paga ninguna revisión
+            self._avance = avance
+            self.advance = self._advance_con_avance
+
+    def _advance_con_avance(self):
+        type(self).advance(self)
+        if not self.pos % PASO_AVANCE:
+            self._avance(self.pos)
+
+    def advance(self):
+        if self.cod in HOJAS and not self.descartando and self.pos < self.n and self._abiertos:
+            self._enlazar(self.arbol.nuevo(self.cod, self._linea(self.pos), self._lexema(self.pos)))
+        super().advance()
+
+    def _enlazar(self, hijo):
+        arbol = self.arbol
+        marco = self._abiertos[-1]
+        nodo, ultimo = marco[0], marco[1]
+        if ultimo == NINGUNO:
+            if nodo != NINGUNO:
+                arbol.primer_hijo[nodo] = hijo
+        elif nodo == NINGUNO:
+            # Producción colapsable con un segundo hijo: ahora sí se crea
+            nodo = marco[0] = arbol.nuevo(marco[2], marco[3])
+            arbol.primer_hijo[nodo] = ultimo
+            arbol.siguiente[ultimo] = hijo
+        else:
+            arbol.siguiente[ultimo] = hijo
+        marco[1] = hijo
+
+    def _abrir(self, tipo):
+        linea = -1 if self.pos == self.n else self._linea(self.pos)
+        # Las colapsables se crean hasta tener dos hijos (ver _enlazar)
+        if tipo in COLAPSABLES and not (tipo == _OPERANDO and self.cod == _ID_ARROBA
+                                        and self.pos + 1 < self.n
+                                        and self.codigos[self.pos + 1] == _PAR_AP):
+            nodo = NINGUNO
+        else:
+            nodo = self.arbol.nuevo(tipo, linea)
+        self._abiertos.append([nodo, NINGUNO, tipo, linea])
+
+    def _cerrar(self):
+        nodo, ultimo, tipo, linea = self._abiertos.pop()
+        if nodo == NINGUNO:
+            # Colapsable con un solo hijo: queda el hijo; sin hijos (error), vacía
+            nodo = ultimo if ultimo != NINGUNO else self.arbol.nuevo(tipo, linea)
+        if self._abiertos:
+            self._enlazar(nodo)
+
+
+def _envolver(nombre):
+    original = getattr(ParserCodigos, nombre)
+    tipo = _TIPO_PRODUCCION[nombre]
+
+    def produccion(self, *args, **kwargs):
+        self._abrir(tipo)
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            self._cerrar()
+
+    produccion.__name__ = nombre
+    return produccion
+
+
+def _envolver_generador(nombre):
+    original = getattr(ParserCodigosIterativo, nombre)
+    tipo = _TIPO_PRODUCCION[nombre]
+
+    def produccion(self, *args, **kwargs):
+        self._abrir(tipo)
+        try:
+            gen = original(self, *args, **kwargs)
+            if gen is not None:
+                yield from gen
+        finally:
+            self._cerrar()
+
+    produccion.__name__ = nombre
+    return produccion
+
+
+class ParserASTIterativo(ParserAST, ParserCodigosIterativo):
+    """ParserAST sobre la pila explícita de ParserCodigosIterativo (sin recursión)."""
+
+
+for _nombre in PRODUCCIONES:
+    setattr(ParserAST, _nombre, _envolver(_nombre))
+    setattr(ParserASTIterativo, _nombre, _envolver_generador(_nombre))
+
+
+def construir_arbol(tokens, max_errores=MAX_ERRORES, avance=None):
+    """
+    Devuelve (arbol, errores sintácticos) para tokens del lexer o un
+    TokenStream. Si el anidamiento rebasa el límite de recursión se vuelve a
+    construir con ParserASTIterativo (mismo árbol, mismos errores). avance,
+    si se da, se llama con la posición del parser cada PASO_AVANCE tokens.
+    """
+    parser = ParserAST(tokens, max_errores, avance)
+    try:
+        parser.parse(reporte=False)
+    except RecursionError:
+        parser = ParserASTIterativo(tokens, max_errores, avance)
+        parser.parse(reporte=False)
+    return parser.arbol, parser.errores
+
+
+def main():
+    import sys
+    from lexer import scan
+
+    if len(sys.argv) < 2:
+        print("Uso: python arbol.py <programa.txt>")
+        sys.exit(1)
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        tokens, _ = scan(f.read(), motor="regex")
+    arbol, errores = construir_arbol(tokens)
+    sys.stdout.write(arbol.a_texto())
+    for err in errores:
+        print(err)
+
+
+if __name__ == "__main__":
+    main()
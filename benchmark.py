@@ -0,0 +1,283 @@
+# benchmark.py
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from lexer import scan, MOTORES, OPERADORES_ORD, _simbolo
+from token_type import TokenCodes
+from sintactic import cargar_tokens_desde_tabla, tokens_desde_lexer, Parser
+from analizador import escribir_tabla_tokens
+from generador import generar_programa
+from parser_codigos import ParserCodigos
+from parser_iterativo import ParserIterativo
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _mejor_tiempo(fn, rondas):
+    """Ejecuta fn varias veces y devuelve (mejor tiempo, último resultado)."""
+    mejor = None
+    resultado = None
+    for _ in range(rondas):
+        t0 = time.perf_counter()
+        resultado = fn()
+        dt = time.perf_counter() - t0
+        if mejor is None or dt < mejor:
+            mejor = dt
+    return mejor, resultado
+
+
+def _huella(resultado):
+    tokens, errores = resultado
+    return (
+        [(t.lexema, t.codigo, t.linea, t.columna) for t in tokens],
+        [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores],
+    )
+
+
+def pico_rss_mb():
+    """Pico de memoria residente del proceso en MB (None si no se puede medir)."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB; macOS reporta bytes
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+def medir_memoria(codigo, motor="regex"):
+    """
+    Memoria que retiene el resultado de scan() (medida con tracemalloc) y la
+    que ocuparía sin el internado de lexemas, es decir, con una copia propia
+    del lexema en cada token (los de un carácter siempre son compartidos).
+    """
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        tokens, _ = scan(codigo, motor=motor)
+        retenida = tracemalloc.get_traced_memory()[0] - antes
+    finally:
+        tracemalloc.stop()
+
+    vistos = set()
+    copias = 0
+    for t in tokens:
+        if id(t.lexema) in vistos:
+            if len(t.lexema) > 1:
+                copias += sys.getsizeof(t.lexema)
+        else:
+            vistos.add(id(t.lexema))
+    mb = 1024 * 1024
+    return {
+        "motor": motor,
+        "tokens": len(tokens),
+        "lexemas_distintos": len(vistos),
+        "mb": retenida / mb,
+        "mb_sin_internar": (retenida + copias) / mb,
+    }
+
+
+def comparar_motores(codigo, rondas=3):
+    """
+    Mide cada motor de scan() sobre el mismo código y verifica que todos
+    produzcan exactamente la misma salida que el motor clásico.
+    """
+    filas = []
+    referencia = None
+    t_clasico = None
+    for motor in MOTORES:
+        dt, res = _mejor_tiempo(lambda: scan(codigo, motor=motor), rondas)
+        huella = _huella(res)
+        if referencia is None:
+            referencia = huella
+            t_clasico = dt
+        filas.append({
+            "motor": motor,
+            "segundos": dt,
+            "tokens": len(res[0]),
+            "errores": len(res[1]),
+            "identico": huella == referencia,
+            "aceleracion": t_clasico / dt if dt else 0.0,
+        })
+    return filas
+
+
+def _simbolo_recorriendo(linea, i):
+    """Búsqueda anterior al trie: probar cada operador con startswith y luego los especiales."""
+    for op in OPERADORES_ORD:
+        if linea.startswith(op, i):
+            return op, TokenCodes.MAP[op]
+    if linea[i] in TokenCodes.ESPECIALES:
+        return linea[i], TokenCodes.MAP[linea[i]]
+    return None
+
+
+def comparar_despacho(codigo, rondas=3):
+    """
+    Mide la búsqueda de operadores y especiales en cada carácter no blanco
+    del código: recorriendo OPERADORES_ORD (como lo hacía el motor clásico)
+    contra el trie de lexer._simbolo, y verifica que ambas den lo mismo.
+    """
+    posiciones = [(linea, i) for linea in codigo.splitlines()
+                  for i, c in enumerate(linea) if not c.isspace()]
+    filas = []
+    referencia = None
+    for nombre, buscar in (("recorrido", _simbolo_recorriendo), ("trie", _simbolo)):
+        dt, res = _mejor_tiempo(lambda: [buscar(linea, i) for linea, i in posiciones], rondas)
+        if referencia is None:
+            referencia = (res, dt)
+        filas.append({
+            "busqueda": nombre,
+            "segundos": dt,
+            "posiciones": len(posiciones),
+            "identico": res == referencia[0],
+            "aceleracion": referencia[1] / dt if dt else 0.0,
+        })
+    return filas
+
+
+def medir_fases(codigo, rondas=3, motor="regex"):
+    """
+    Mide por separado scan(), cargar_tokens_desde_tabla() y el parse con
+    Parser, ParserIterativo y ParserCodigos sobre el mismo código. Devuelve
+    un dict por fase con segundos, tokens/seg y líneas/seg.
+    """
+    num_lineas = len(codigo.splitlines())
+    fases = {}
+
+    def registrar(nombre, segundos, n_tokens):
+        fases[nombre] = {
+            "segundos": segundos,
+            "tokens_seg": n_tokens / segundos if segundos else 0.0,
+            "lineas_seg": num_lineas / segundos if segundos else 0.0,
+        }
+
+    dt, (tokens, _) = _mejor_tiempo(lambda: scan(codigo, motor=motor), rondas)
+    registrar(f"scan_{motor}", dt, len(tokens))
+
+    fd, ruta = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        escribir_tabla_tokens(tokens, ruta)
+        with contextlib.redirect_stdout(io.StringIO()):
+            dt, _ = _mejor_tiempo(lambda: cargar_tokens_desde_tabla(ruta), rondas)
+        registrar("cargar_tabla", dt, len(tokens))
+    finally:
+        os.remove(ruta)
+
+    tokens_parser = tokens_desde_lexer(tokens)
+    dt, _ = _mejor_tiempo(lambda: Parser(tokens_parser).parse(reporte=False), rondas)
+    registrar("parse", dt, len(tokens))
+    dt, _ = _mejor_tiempo(lambda: ParserIterativo(tokens_parser).parse(reporte=False), rondas)
+    registrar("parse_iterativo", dt, len(tokens))
+    dt, _ = _mejor_tiempo(lambda: ParserCodigos(tokens).parse(reporte=False), rondas)
+    registrar("parse_codigos", dt, len(tokens))
+
+    return {
+        "caracteres": len(codigo),
+        "lineas": num_lineas,
+        "tokens": len(tokens),
+        "fases": fases,
+        "pico_rss_mb": pico_rss_mb(),
+    }
+
+
+def comparar_con_base(resultado, base, tolerancia):
+    """
+    Lista de regresiones: fases cuyo tokens/seg cayó más de `tolerancia`
+    (fracción) respecto a la línea base.
+    """
+    regresiones = []
+    for fase, datos in resultado["fases"].items():
+        previo = base.get("fases", {}).get(fase)
+        if not previo or not previo.get("tokens_seg"):
+            continue
+        relacion = datos["tokens_seg"] / previo["tokens_seg"]
+        if relacion < 1.0 - tolerancia:
+            regresiones.append(f"{fase}: {datos['tokens_seg']:.0f} tokens/seg "
+                               f"vs base {previo['tokens_seg']:.0f} ({relacion:.2f}x)")
+    return regresiones
+
+
+def _leer_corpus(args):
+    if args.generar:
+        return generar_programa(metodos=args.generar, tasa_errores=args.tasa_errores,
+                                semilla=args.semilla)
+    rutas = args.fuentes or sorted(glob.glob("ejemplos/*.txt"))
+    partes = []
+    for ruta in rutas:
+        with open(ruta, "r", encoding="utf-8") as f:
+            partes.append(f.read())
+    return "\n".join(partes) * args.repeticiones
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark del analizador léxico y sintáctico")
+    ap.add_argument("fuentes", nargs="*", help="Archivos fuente (por defecto ejemplos/*.txt)")
+    ap.add_argument("--repeticiones", type=int, default=200,
+                    help="Veces que se concatena el corpus de archivos (default 200)")
+    ap.add_argument("--generar", type=int, metavar="METODOS",
+                    help="Usar un programa sintético con ese número de métodos")
+    ap.add_argument("--tasa-errores", type=float, default=0.0,
+                    help="Fracción de estatutos mutados en el programa sintético")
+    ap.add_argument("--semilla", type=int, default=1)
+    ap.add_argument("--rondas", type=int, default=3, help="Rondas por medición; se toma la mejor")
+    ap.add_argument("--motores", action="store_true",
+                    help="Solo comparar los motores de scan() (salida idéntica y aceleración)")
+    ap.add_argument("--despacho", action="store_true",
+                    help="Solo comparar la búsqueda de operadores (recorrido vs trie)")
+    ap.add_argument("--json", help="Guardar el resultado en este archivo JSON")
+    ap.add_argument("--base", help="Archivo JSON de línea base para detectar regresiones")
+    ap.add_argument("--tolerancia", type=float, default=0.15,
+                    help="Caída de tokens/seg permitida respecto a la base (default 0.15)")
+    args = ap.parse_args()
+
+    codigo = _leer_corpus(args)
+
+    if args.motores:
+        print(f"Corpus: {len(codigo)} caracteres\n")
+        print(f"{'Motor':<12}{'Segundos':<12}{'Tokens':<10}{'Errores':<10}{'Idéntico':<10}{'Aceleración':<12}")
+        for fila in comparar_motores(codigo, args.rondas):
+            print(f"{fila['motor']:<12}{fila['segundos']:<12.4f}{fila['tokens']:<10}{fila['errores']:<10}"
+                  f"{'sí' if fila['identico'] else 'NO':<10}{fila['aceleracion']:<12.2f}")
+        return
+
+    if args.despacho:
+        print(f"Corpus: {len(codigo)} caracteres\n")
+        print(f"{'Búsqueda':<12}{'Segundos':<12}{'Posiciones':<12}{'Idéntico':<10}{'Aceleración':<12}")
+        for fila in comparar_despacho(codigo, args.rondas):
+            print(f"{fila['busqueda']:<12}{fila['segundos']:<12.4f}{fila['posiciones']:<12}"
+                  f"{'sí' if fila['identico'] else 'NO':<10}{fila['aceleracion']:<12.2f}")
+        return
+
+    resultado = medir_fases(codigo, args.rondas)
+    resultado["memoria"] = medir_memoria(codigo)
+    print(json.dumps(resultado, indent=2))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, indent=2)
+
+    if args.base:
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        regresiones = comparar_con_base(resultado, base, args.tolerancia)
+        if regresiones:
+            print("\nREGRESIONES respecto a la línea base:")
+            for r in regresiones:
+                print("  " + r)
+            sys.exit(1)
+        print("\nSin regresiones respecto a la línea base.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+# cache.py
+# Caché persistente de resultados: si el mismo fuente ya se analizó con la
+# misma versión del lexer/gramática, se devuelven tokens y errores guardados
+# en lugar de volver a analizar. Cada entrada es un archivo marshal+zlib cuyo
+# nombre es el hash del contenido; se desalojan las menos usadas (mtime)
+# cuando el directorio pasa de `tam_maximo` bytes.
+import hashlib
+import importlib.util
+import marshal
+import os
+import tempfile
+import zlib
+from array import array
+
+import lexer
+from analizador import Resultado, analyze
+from token_stream import TokenStream
+
+# Cambiar al modificar el formato de las entradas
+FORMATO = 3
+
+DIR_DEFAULT = os.environ.get("ANALIZADOR_CACHE") or os.path.join(
+    os.path.expanduser("~"), ".cache", "analizador")
+TAM_MAXIMO = 128 * 1024 * 1024
+
+# Con ANALIZADOR_SIN_CACHE=1 ninguna herramienta usa la caché
+DESACTIVADA = os.environ.get("ANALIZADOR_SIN_CACHE", "") not in ("", "0")
+
+_version = None
+
+# Tamaño de cada directorio de caché según este proceso:
+# directorio -> [bytes totales, bytes escritos desde el último recuento]
+_tamanos = {}
+# Otros procesos escriben en el mismo directorio sin que este lo vea: tras
+# escribir esta fracción de tam_maximo se vuelve a recorrer el directorio
+FRACCION_RECUENTO = 16
+
+
+# Módulos que determinan el resultado del análisis (todo lo que está en el
+# camino de analyze() y de los motores del lexer). Se lee el archivo de cada
+# uno sin importarlo: lexer_numpy cuenta aunque NumPy no esté instalado.
+MODULOS_ANALISIS = ("lexer", "lexer_numpy", "token_type", "token_stream", "sintactic",
+                    "parser_codigos", "parser_iterativo", "parser_iterativo_generado",
+                    "arbol", "semantico", "analizador")
+
+
+def version():
+    """Hash de los módulos que determinan el resultado del análisis."""
+    global _version
+    if _version is None:
+        h = hashlib.sha256(str(FORMATO).encode())
+        for nombre in MODULOS_ANALISIS:
+            spec = importlib.util.find_spec(nombre)
+            if spec is None or not spec.origin:
+                continue
+            h.update(nombre.encode())
+            with open(spec.origin, "rb") as f:
+                h.update(f.read())
+        _version = h.hexdigest()
+    return _version
+
+
+class ClaveIncremental:
+    """clave() calculada por partes: actualizar() con trozos consecutivos del texto."""
+
+    def __init__(self, tipo="fuente"):
+        self._h = hashlib.sha256(f"{version()}:{tipo}:".encode())
+
+    def actualizar(self, texto):
+        self._h.update(texto.encode("utf-8", "surrogatepass"))
+
+    def valor(self):
+        return self._h.hexdigest()
+
+
+def clave(texto, tipo="fuente"):
+    """Clave de una entrada: hash del contenido + tipo de entrada + versión."""
+    c = ClaveIncremental(tipo)
+    c.actualizar(texto)
+    return c.valor()
+
+
+def clave_archivo(f, tipo="fuente", tam_bloque=1 << 20):
+    """clave() del resto de un archivo abierto en modo texto, leído por bloques."""
+    c = ClaveIncremental(tipo)
+    for bloque in iter(lambda: f.read(tam_bloque), ""):
+        c.actualizar(bloque)
+    return c.valor()
+
+
+def _empaquetar(res, texto):
+    tokens = res.tokens
+    if not isinstance(tokens, TokenStream):
+        tokens = TokenStream.desde_tokens(tokens, texto)
+    datos = (
+        FORMATO,
+        tokens.codigos.tobytes(),
+        tokens.lineas.tobytes(),
+        tokens.columnas.tobytes(),
+        tokens.inicios.tobytes(),
+        tokens.longitudes.tobytes(),
+        [(e.lexema, e.descripcion, e.linea, e.columna) for e in res.errores_lexicos],
+        list(res.errores_sintacticos),
+        res.errores_semanticos,
+    )
+    return zlib.compress(marshal.dumps(datos), 1)
+
+
+def _desempaquetar(blob, texto):
+    """
+    Los tokens vuelven como token_stream.TokenStream sobre `texto`: un
+    acierto no paga la creación de un objeto por token (ParserCodigos y las
+    tablas leen las columnas directo) y los lexemas no se guardan, se sacan
+    del mismo fuente.
+    """
+    datos = marshal.loads(zlib.decompress(blob))
+    if datos[0] != FORMATO:
+        return None
+    _, codigos, lineas, columnas, inicios, longitudes, errores, sintacticos, semanticos = datos
+    tokens = TokenStream(texto, array('b', codigos), array('i', lineas), array('i', columnas),
+                         array('q', inicios), array('i', longitudes))
+    errores = [lexer.ErrorLexico(*e) for e in errores]
+    return Resultado(tokens, errores, sintacticos, semanticos)
+
+
+class CacheResultados:
+    def __init__(self, directorio=None, tam_maximo=TAM_MAXIMO):
+        self.directorio = directorio or DIR_DEFAULT
+        self.tam_maximo = tam_maximo
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _ruta(self, k):
+        return os.path.join(self.directorio, k[:2], k + ".bin")
+
+    def obtener(self, texto, tipo="fuente"):
+        """Resultado guardado para `texto`, o None si no está (o está dañado)."""
+        return self.obtener_clave(clave(texto, tipo), texto)
+
+    def contiene(self, k):
+        return os.path.exists(self._ruta(k))
+
+    def obtener_clave(self, k, texto):
+        ruta = self._ruta(k)
+        try:
+            with open(ruta, "rb") as f:
+                res = _desempaquetar(f.read(), texto)
+            os.utime(ruta)  # marca de uso para el desalojo LRU
+        except (OSError, ValueError, EOFError, TypeError, zlib.error):
+            res = None
+        if res is None:
+            self.fallos += 1
+        else:
+            self.aciertos += 1
+        return res
+
+    def guardar(self, texto, resultado, tipo="fuente"):
+        self.guardar_clave(clave(texto, tipo), resultado, texto)
+
+    def guardar_clave(self, k, resultado, texto):
+        ruta = self._ruta(k)
+        blob = _empaquetar(resultado, texto)
+        try:
+            anterior = os.path.getsize(ruta)    # entrada dañada que se reemplaza
+        except OSError:
+            anterior = 0
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            # Escritura atómica: otro proceso nunca ve una entrada a medias
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, ruta)
+        except OSError:
+            return  # la caché es opcional: un disco lleno no detiene el análisis
+        self._sumar(len(blob) - anterior)
+
+    def _sumar(self, delta):
+        """
+        Lleva la cuenta del tamaño del directorio sin recorrerlo en cada
+        escritura; solo se poda (y se recuenta) al pasar de tam_maximo.
+        """
+        estado = _tamanos.get(self.directorio)
+        if estado is None or estado[1] > self.tam_maximo // FRACCION_RECUENTO:
+            self.podar()    # primera escritura de este proceso o cuenta vieja
+            return
+        estado[0] += delta
+        estado[1] += max(delta, 0)
+        if estado[0] > self.tam_maximo:
+            self.podar()
+
+    def entradas(self):
+        """Lista de (mtime, tamaño, ruta) de las entradas guardadas."""
+        salida = []
+        for raiz, _, archivos in os.walk(self.directorio):
+            for nombre in archivos:
+                if nombre.endswith(".bin"):
+                    ruta = os.path.join(raiz, nombre)
+                    try:
+                        st = os.stat(ruta)
+                    except OSError:
+                        continue
+                    salida.append((st.st_mtime, st.st_size, ruta))
+        return salida
+
+    def podar(self):
+        """
+        Si el directorio pasa de tam_maximo, desaloja las entradas usadas hace
+        más tiempo hasta dejar libre 1/FRACCION_RECUENTO de tam_maximo (así
+        las escrituras siguientes no vuelven a podar enseguida).
+        """
+        entradas = self.entradas()
+        total = sum(tam for _, tam, _ in entradas)
+        if total > self.tam_maximo:
+            meta = self.tam_maximo - self.tam_maximo // FRACCION_RECUENTO
+            for _, tam, ruta in sorted(entradas):
+                try:
+                    os.remove(ruta)
+                except OSError:
+                    continue
+                total -= tam
+                if total <= meta:
+                    break
+        _tamanos[self.directorio] = [total, 0]
+
+    def limpiar(self):
+        for _, _, ruta in self.entradas():
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+        _tamanos.pop(self.directorio, None)
+
+
+def analizar_con_cache(codigo, cache=None, motor="regex", semantico=False, sintactico=True):
+    """
+    analyze() con caché: en un acierto no se vuelve a analizar. Con
+    cache=None se usa la caché por omisión (salvo ANALIZADOR_SIN_CACHE);
+    con cache=False se analiza sin consultarla. Con sintactico=False solo se
+    hace (y se guarda) el análisis léxico.
+    """
+    def analizar():
+        if not sintactico:
+            return Resultado(*lexer.scan(codigo, motor=motor))
+        return analyze(codigo, motor=motor, semantico=semantico)
+
+    if cache is None and not DESACTIVADA:
+        cache = CacheResultados()
+    if not cache:
+        return analizar()
+    # Solo léxico, con y sin análisis semántico son entradas distintas
+    tipo = "lexico" if not sintactico else "semantico" if semantico else "fuente"
+    res = cache.obtener(codigo, tipo)
+    if res is None:
+        res = analizar()
+        cache.guardar(codigo, res, tipo)
+    return res
@@ -0,0 +1,122 @@
+# cliente.py
+# Cliente del servidor de análisis (servidor.py). Para consultar al servidor
+# solo usa la biblioteca estándar y no importa el lexer ni el parser: arranca
+# rápido y deja el trabajo al servidor, que ya los tiene cargados. La
+# excepción es --tablas: para escribir los archivos con el mismo formato de
+# siempre importa tablas.py y los reportes de sintactic.py (y semantico.py con
+# --semantico), que a su vez cargan el parser.
+import argparse
+import http.client
+import json
+import socket
+import sys
+from collections import namedtuple
+
+HOST_DEFAULT = "127.0.0.1"
+PUERTO_DEFAULT = 8765
+
+TokenRemoto = namedtuple("TokenRemoto", "lexema codigo linea columna")
+ErrorRemoto = namedtuple("ErrorRemoto", "lexema descripcion linea columna")
+
+
+class ErrorServidor(Exception):
+    pass
+
+
+def _peticion(codigo, motor, tokens, semantico):
+    return json.dumps({"codigo": codigo, "motor": motor, "tokens": tokens, "semantico": semantico},
+                      ensure_ascii=False).encode("utf-8")
+
+
+def analizar_http(codigo, host=HOST_DEFAULT, puerto=PUERTO_DEFAULT, motor="regex", tokens=False,
+                  semantico=False):
+    conexion = http.client.HTTPConnection(host, puerto)
+    try:
+        conexion.request("POST", "/analizar", _peticion(codigo, motor, tokens, semantico),
+                         {"Content-Type": "application/json"})
+        r = conexion.getresponse()
+        datos = json.loads(r.read())
+    finally:
+        conexion.close()
+    if r.status != 200:
+        raise ErrorServidor(datos.get("error", f"HTTP {r.status}"))
+    return datos
+
+
+def analizar_socket(codigo, ruta, motor="regex", tokens=False, semantico=False):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(ruta)
+        s.sendall(_peticion(codigo, motor, tokens, semantico) + b"\n")
+        with s.makefile("rb") as f:
+            datos = json.loads(f.readline())
+    if "error" in datos:
+        raise ErrorServidor(datos["error"])
+    return datos
+
+
+def escribir_tablas_remotas(datos, ruta_tokens="Tokens.txt", ruta_errores="Errores.txt",
+                            ruta_sintacticos="Errores_Sintácticos.txt",
+                            ruta_semanticos="Errores_Semánticos.txt"):
+    """Escribe las tablas de siempre a partir de una respuesta con "tabla"."""
+    from tablas import escribir_tablas
+    from sintactic import escribir_reporte
+
+    tabla = datos["tabla"]
+    escribir_tablas([TokenRemoto(*t) for t in zip(tabla["lexemas"], tabla["codigos"],
+                                                  tabla["lineas"], tabla["columnas"])],
+                    [ErrorRemoto(*e) for e in datos["errores_lexicos"]],
+                    ruta_tokens, ruta_errores)
+    escribir_reporte(datos["errores_sintacticos"], ruta_sintacticos)
+    if "errores_semanticos" in datos:
+        from semantico import escribir_reporte as escribir_reporte_semantico
+        escribir_reporte_semantico(datos["errores_semanticos"], ruta_semanticos)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Cliente del servidor de análisis")
+    ap.add_argument("fuentes", nargs="+", help="Archivos fuente")
+    ap.add_argument("--host", default=HOST_DEFAULT)
+    ap.add_argument("--puerto", type=int, default=PUERTO_DEFAULT)
+    ap.add_argument("--socket", help="Usar el socket Unix del servidor en lugar de HTTP")
+    ap.add_argument("--motor", default="regex", help="Motor del lexer (default regex)")
+    ap.add_argument("--semantico", action="store_true", help="Incluir el análisis semántico")
+    ap.add_argument("--json", action="store_true", help="Imprimir la respuesta JSON completa")
+    ap.add_argument("--tablas", action="store_true",
+                    help="Escribir Tokens.txt, Errores.txt y Errores_Sintácticos.txt (un solo fuente)")
+    args = ap.parse_args()
+
+    if args.tablas and len(args.fuentes) > 1:
+        ap.error("--tablas admite un solo archivo fuente")
+
+    fallos = 0
+    for ruta in args.fuentes:
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                codigo = f.read()
+            tokens = args.tablas or args.json
+            if args.socket:
+                datos = analizar_socket(codigo, args.socket, args.motor, tokens, args.semantico)
+            else:
+                datos = analizar_http(codigo, args.host, args.puerto, args.motor, tokens, args.semantico)
+        except (OSError, UnicodeDecodeError, ErrorServidor, ValueError) as e:
+            print(f"{ruta}: ERROR {e}", file=sys.stderr)
+            fallos += 1
+            continue
+
+        if args.json:
+            json.dump({"archivo": ruta, **datos}, sys.stdout, ensure_ascii=False)
+            print()
+        else:
+            resumen = (f"{ruta}: {datos['tokens']} tokens, "
+                       f"{len(datos['errores_lexicos'])} errores léxicos, "
+                       f"{len(datos['errores_sintacticos'])} errores sintácticos")
+            if "errores_semanticos" in datos:
+                resumen += f", {len(datos['errores_semanticos'])} errores semánticos"
+            print(resumen)
+        if args.tablas:
+            escribir_tablas_remotas(datos)
+    sys.exit(1 if fallos else 0)
+
+
+if __name__ == "__main__":
+    main()
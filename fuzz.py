@@ -0,0 +1,557 @@
+# fuzz.py
+# Fuzzing diferencial del lexer y del parser. Genera fuentes al azar (piezas
+# sueltas que tocan los casos frontera del lexer) y programas de la gramática
+# con mutaciones, y para cada uno verifica que:
+#   - todos los motores de scan() (lexer.MOTORES), scan_bloques() con bloques
+#     pequeños y LexerIncremental den exactamente la salida del motor clásico,
+#   - todas las variantes del parser den los mismos errores,
+#   - nada tarde más que el límite por caso: cada caso corre en un proceso
+#     aparte que se mata si se cuelga.
+# Además mide cada fase con entradas que crecen al doble y ajusta
+# log(tiempo) contra log(tamaño): una pendiente cercana a 1 es tiempo lineal.
+# Toda entrada que falla se reduce con ddmin antes de guardarse.
+import argparse
+import gc
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+
+from lexer import scan, scan_bloques, MOTORES
+from token_type import TokenCodes
+from incremental import LexerIncremental
+from sintactic import Parser, tokens_desde_lexer, MAX_ERRORES
+from parser_codigos import ParserCodigos
+from parser_iterativo import ParserIterativo, ParserCodigosIterativo
+from arbol import ParserAST, ParserASTIterativo
+from generador import GeneradorProgramas
+
+# Piezas de las entradas al azar: caracteres sueltos y fragmentos que
+# ejercitan los casos frontera del lexer (prefijos, números, strings sin
+# cerrar, comentarios, saltos de línea que solo splitlines() reconoce...)
+PIEZAS = (
+    list("abcxyzXYZ0123456789 \t\n@$&%.+-*/=!<>|;,:(){}[]\"#_~?\\'")
+    + ["\r\n", "\r", "\x0b", "\x0c", "\x1c", "\x85", " ", "\x00", "é", "ñ", "€"]
+    + ["//", "++", "--", "+=", "&&", "||", "==", "!=", "<=", "1.5", ".5", "1.", "1.2.3", "-7",
+       "+.3", "32768", "-32769", '"s"', '"sin cerrar', "@abcdefgh", "$x", "&&x", "%%", "%r"]
+    + sorted(TokenCodes.RESERVADAS)
+)
+
+BLOQUE_PEQUENO = 64     # caracteres por bloque al comparar scan_bloques()
+PRESUPUESTOS = (MAX_ERRORES, 3)     # max_errores con que se comparan los parsers
+
+
+# ================================================================
+# Generación de entradas
+# ================================================================
+def entrada_aleatoria(rnd, tam):
+    """Piezas al azar concatenadas hasta tener `tam` caracteres."""
+    partes = []
+    total = 0
+    while total < tam:
+        pieza = rnd.choice(PIEZAS)
+        partes.append(pieza)
+        total += len(pieza)
+    return "".join(partes)
+
+
+def mutar(rnd, texto, veces=3):
+    """Borra, duplica o mueve tramos del texto, inserta piezas o lo corta."""
+    for _ in range(veces):
+        n = len(texto)
+        if not n:
+            return entrada_aleatoria(rnd, 8)
+        i = rnd.randrange(n)
+        j = min(n, i + rnd.randint(1, 40))
+        r = rnd.random()
+        if r < 0.3:
+            texto = texto[:i] + texto[j:]
+        elif r < 0.5:
+            texto = texto[:j] + texto[i:j] + texto[j:]
+        elif r < 0.8:
+            texto = texto[:i] + rnd.choice(PIEZAS) + texto[i:]
+        elif r < 0.95:
+            tramo, resto = texto[i:j], texto[:i] + texto[j:]
+            k = rnd.randint(0, len(resto))
+            texto = resto[:k] + tramo + resto[k:]
+        else:
+            texto = texto[:i]
+    return texto
+
+
+def entrada_gramatica(rnd, tam):
+    """Programa de la gramática (a veces con errores) recortado a `tam` y mutado."""
+    gen = GeneradorProgramas(metodos=rnd.randint(1, 3), estatutos=rnd.randint(1, 8),
+                             variables=rnd.randint(1, 4), tasa_errores=rnd.choice((0.0, 0.1, 0.3)),
+                             semilla=rnd.getrandbits(32))
+    return mutar(rnd, gen.programa()[:tam], rnd.randint(0, 6))
+
+
+GENERADORES = {"aleatorio": entrada_aleatoria, "gramatica": entrada_gramatica}
+
+
+# ================================================================
+# Comparación diferencial
+# ================================================================
+def _huella(resultado):
+    tokens, errores = resultado
+    return (
+        [(t.lexema, t.codigo, t.linea, t.columna) for t in tokens],
+        [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores],
+    )
+
+
+def _excepcion(e):
+    marco = traceback.extract_tb(e.__traceback__)[-1]
+    return f"{type(e).__name__}: {e} ({os.path.basename(marco.filename)}:{marco.lineno})"
+
+
+def _primera_diferencia(obtenido, esperado):
+    for k, (a, b) in enumerate(zip(obtenido, esperado)):
+        if a != b:
+            return f"#{k}: {a!r} en lugar de {b!r}"
+    return f"{len(obtenido)} elementos en lugar de {len(esperado)}"
+
+
+def _por_bloques(texto):
+    tokens, errores = [], []
+    for t, e, _ in scan_bloques(texto, motor="regex", tam_bloque=BLOQUE_PEQUENO):
+        tokens += t
+        errores += e
+    return tokens, errores
+
+
+def _errores_ast(clase, tokens, limite):
+    # Sin construir_arbol: su respaldo iterativo ocultaría la variante recursiva
+    parser = clase(tokens, limite)
+    parser.parse(reporte=False)
+    return parser.errores
+
+
+def _variantes_parser(tokens, limite):
+    # La primera es la referencia: la iterativa no tiene límite de profundidad
+    return (
+        ("ParserCodigosIterativo", lambda: ParserCodigosIterativo(tokens, limite).parse(reporte=False)),
+        ("ParserCodigos", lambda: ParserCodigos(tokens, limite).parse(reporte=False)),
+        ("ParserIterativo", lambda: ParserIterativo(tokens_desde_lexer(tokens), limite).parse(reporte=False)),
+        ("Parser", lambda: Parser(tokens_desde_lexer(tokens), limite).parse(reporte=False)),
+        ("ParserAST", lambda: _errores_ast(ParserAST, tokens, limite)),
+        ("ParserASTIterativo", lambda: _errores_ast(ParserASTIterativo, tokens, limite)),
+    )
+
+
+def diferencias(texto, motores=None):
+    """
+    Discrepancias entre implementaciones al analizar `texto`, como lista de
+    (clave, detalle); vacía si todas coinciden. La clave dice qué se comparó
+    ("regex:tokens", "Parser", "excepcion:numpy"...) y es lo que se conserva
+    al reducir la entrada con ddmin.
+    """
+    salida = []
+
+    def probar(nombre, fn):
+        try:
+            return fn()
+        except Exception as e:
+            salida.append((f"excepcion:{nombre}", _excepcion(e)))
+            return None
+
+    referencia = probar("clasico", lambda: scan(texto, motor="clasico"))
+    if referencia is None:
+        return salida
+    esperado = _huella(referencia)
+
+    alternativas = [(m, lambda m=m: scan(texto, motor=m)) for m in motores or MOTORES if m != "clasico"]
+    alternativas.append(("bloques", lambda: _por_bloques(texto)))
+    alternativas.append(("incremental", lambda: LexerIncremental(texto).scan()))
+    for nombre, fn in alternativas:
+        res = probar(nombre, fn)
+        if res is None:
+            continue
+        for parte, obtenido, bueno in zip(("tokens", "errores"), _huella(res), esperado):
+            if obtenido != bueno:
+                salida.append((f"{nombre}:{parte}", _primera_diferencia(obtenido, bueno)))
+
+    for limite in PRESUPUESTOS:
+        esperados = None
+        for nombre, fn in _variantes_parser(referencia[0], limite):
+            try:
+                errores = fn()
+            except RecursionError:
+                continue    # límite conocido de las variantes recursivas
+            except Exception as e:
+                salida.append((f"excepcion:{nombre}", _excepcion(e)))
+                continue
+            if esperados is None:
+                esperados = errores
+            elif errores != esperados:
+                salida.append((nombre, _primera_diferencia(errores, esperados)))
+    return salida
+
+
+# ================================================================
+# Ejecución aislada con límite de tiempo
+# ================================================================
+def _trabajador(conexion):
+    while True:
+        try:
+            fn, args = conexion.recv()
+        except EOFError:
+            return
+        try:
+            conexion.send((True, fn(*args)))
+        except Exception as e:
+            conexion.send((False, _excepcion(e)))
+
+
+class EjecutorAislado:
+    """
+    Ejecuta funciones de este módulo en un proceso hijo con límite de
+    tiempo. Si una no termina a tiempo el hijo se mata y se crea otro para
+    la siguiente: un ciclo infinito en el lexer no cuelga el fuzzing.
+    """
+
+    def __init__(self):
+        self._proceso = None
+        self._conexion = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def _iniciar(self):
+        padre, hijo = multiprocessing.Pipe()
+        self._proceso = multiprocessing.Process(target=_trabajador, args=(hijo,), daemon=True)
+        self._proceso.start()
+        hijo.close()
+        self._conexion = padre
+
+    def cerrar(self):
+        if self._proceso is None:
+            return
+        self._proceso.kill()
+        self._proceso.join()
+        self._conexion.close()
+        self._proceso = self._conexion = None
+
+    def ejecutar(self, limite, fn, *args):
+        """
+        (estado, resultado): estado "ok" con lo que devolvió fn, "excepcion"
+        con su descripción, "tiempo" si pasó de `limite` segundos o "caida"
+        si el proceso hijo terminó solo.
+        """
+        if self._proceso is None:
+            self._iniciar()
+        try:
+            self._conexion.send((fn, args))
+            if not self._conexion.poll(limite):
+                self.cerrar()
+                return "tiempo", None
+            bien, resultado = self._conexion.recv()
+        except (EOFError, OSError):
+            self.cerrar()
+            return "caida", None
+        return ("ok" if bien else "excepcion"), resultado
+
+
+# ================================================================
+# Reducción de entradas (ddmin)
+# ================================================================
+def ddmin(elementos, falla):
+    """
+    ddmin de Zeller: reduce la lista `elementos` (para la que falla() es
+    verdadero) a una sublista 1-mínima: quitar cualquier elemento más hace
+    que deje de fallar.
+    """
+    n = 2
+    while len(elementos) >= 2:
+        tam = math.ceil(len(elementos) / n)
+        partes = [elementos[i:i + tam] for i in range(0, len(elementos), tam)]
+        for parte in partes:
+            if falla(parte):
+                elementos, n = parte, 2
+                break
+        else:
+            for k in range(len(partes)):
+                complemento = [x for i, p in enumerate(partes) if i != k for x in p]
+                if falla(complemento):
+                    elementos, n = complemento, max(n - 1, 2)
+                    break
+            else:
+                if n >= len(elementos):
+                    break
+                n = min(2 * n, len(elementos))
+    return elementos
+
+
+def minimizar(texto, falla):
+    """Reduce texto con ddmin, primero por líneas y luego por caracteres."""
+    vistos = {}
+
+    def falla_texto(t):
+        if t not in vistos:
+            vistos[t] = falla(t)
+        return vistos[t]
+
+    lineas = ddmin(texto.splitlines(keepends=True), lambda ls: falla_texto("".join(ls)))
+    return "".join(ddmin(list("".join(lineas)), lambda cs: falla_texto("".join(cs))))
+
+
+# ================================================================
+# Fuzzing
+# ================================================================
+def _firma(estado, resultado):
+    """Qué falló: el estado si no fue "ok", o la clave de la primera discrepancia."""
+    if estado != "ok":
+        return estado
+    return resultado[0][0] if resultado else None
+
+
+def probar_entrada(ejecutor, texto, limite, motores=None):
+    """(firma, detalle) de texto; firma None si no falló."""
+    estado, res = ejecutor.ejecutar(limite, diferencias, texto, motores)
+    firma = _firma(estado, res)
+    if estado == "tiempo":
+        detalle = [f"más de {limite} s"]
+    elif estado == "caida":
+        detalle = ["el proceso de análisis terminó inesperadamente"]
+    elif estado == "excepcion":
+        detalle = [res]
+    else:
+        detalle = [f"{clave}: {d}" for clave, d in res]
+    return firma, detalle
+
+
+def reducir(ejecutor, texto, firma, limite, motores=None):
+    """Entrada mínima (ddmin) que sigue fallando con la misma firma."""
+    return minimizar(texto, lambda t: probar_entrada(ejecutor, t, limite, motores)[0] == firma)
+
+
+def fuzzear(ejecutor, casos, semilla=1, tam_max=2000, limite=5.0, motores=None, salida=None,
+            informar=print):
+    """
+    Corre `casos` entradas generadas y devuelve la lista de fallos (dicts).
+    Solo se reduce el primer fallo de cada firma; los demás se guardan tal
+    cual (un error frecuente no debe multiplicar el tiempo de ddmin).
+    """
+    rnd = random.Random(semilla)
+    nombres = sorted(GENERADORES)
+    fallos = []
+    primeros = {}   # firma -> caso donde se redujo
+    for caso in range(casos):
+        generador = rnd.choice(nombres)
+        texto = GENERADORES[generador](rnd, rnd.randint(1, tam_max))
+        firma, detalle = probar_entrada(ejecutor, texto, limite, motores)
+        if firma is None:
+            continue
+        fallo = {"caso": caso, "generador": generador, "firma": firma, "detalle": detalle,
+                 "texto": texto, "minimo": None}
+        fallos.append(fallo)
+        if firma in primeros:
+            informar(f"caso {caso} ({generador}): {firma} (misma firma que el caso {primeros[firma]})")
+        else:
+            primeros[firma] = caso
+            fallo["minimo"] = reducir(ejecutor, texto, firma, limite, motores)
+            informar(f"caso {caso} ({generador}): {firma} — mínimo {fallo['minimo']!r}")
+            for d in detalle[:3]:
+                informar(f"    {d}")
+        if salida:
+            os.makedirs(salida, exist_ok=True)
+            for sufijo, contenido in (("", texto), ("_min", fallo["minimo"])):
+                if contenido is not None:
+                    ruta = os.path.join(salida, f"caso_{semilla}_{caso}{sufijo}.txt")
+                    with open(ruta, "w", encoding="utf-8", newline="") as f:
+                        f.write(contenido)
+    return fallos
+
+
+# ================================================================
+# Verificación de tiempo lineal
+# ================================================================
+def _repetir(unidad, cierre=""):
+    return lambda n: unidad * max(1, n // len(unidad)) + cierre
+
+
+def _programa(tasa_errores):
+    def construir(n):
+        gen = GeneradorProgramas(estatutos=30, tasa_errores=tasa_errores, semilla=1)
+        metodo = "\n".join(gen.metodo("@m")) + "\n"
+        return "clase @Prueba {\n" + metodo * max(1, n // len(metodo)) + "}\n"
+    return construir
+
+
+def _anidado(abrir, cerrar):
+    def construir(n):
+        k = max(1, n // (len(abrir) + len(cerrar)))
+        return "clase @A {\n metodo vacio @m() {\n" + abrir * k + cerrar * k + "\n }\n}\n"
+    return construir
+
+
+# Entradas que crecen: nombre -> función(n) que da un texto de unos n caracteres
+PATRONES = {
+    "programa": _programa(0.0),
+    "programa_errores": _programa(0.3),
+    "aleatorio": _repetir(entrada_aleatoria(random.Random(1), 4096)),
+    "errores_una_linea": _repetir("9abc @@x $1 1.2.3 # & "),
+    "strings_una_linea": _repetir('"x '),
+    "strings_sin_cerrar": _repetir('x"\n', '"'),
+    "saltos_raros": _repetir("é x\r\x85 "),
+    "comentarios": _repetir("// comentario\n"),
+    "estatutos_rotos": _anidado("$a = = ;\n", ""),
+    "anidamiento": _anidado("si (1 < 2) {\n", "}\n"),
+    "parentesis": _anidado("escribir(", ");"),
+}
+FASES = list(MOTORES) + ["parser"]
+# Si la entrada más grande tarda menos que esto el ajuste es solo ruido
+MIN_SEGUNDOS_AJUSTE = 0.005
+
+
+def _cronometrar(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def medir(fase, texto, rondas=3):
+    """
+    Mejor tiempo de `rondas` ejecuciones de la fase ("parser" o un motor de
+    scan) sobre texto, con el recolector de basura apagado como timeit.
+    El parser se mide sin presupuesto de errores y sin contar el lexer.
+    """
+    if fase == "parser":
+        tokens = scan(texto, motor="regex")[0]
+        fn = lambda: ParserCodigosIterativo(tokens, 0).parse(reporte=False)
+    else:
+        fn = lambda: scan(texto, motor=fase)
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        return min(_cronometrar(fn) for _ in range(rondas))
+    finally:
+        if activo:
+            gc.enable()
+
+
+def pendiente(tamanos, tiempos):
+    """Pendiente de la recta de mínimos cuadrados de log(tiempo) contra log(tamaño)."""
+    xs = [math.log(n) for n in tamanos]
+    ys = [math.log(max(t, 1e-9)) for t in tiempos]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    return (sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+            / sum((x - mx) ** 2 for x in xs))
+
+
+def verificar_linealidad(ejecutor, patrones=None, fases=None, tam_inicial=20000, duplicaciones=4,
+                         rondas=3, umbral=1.15, limite=60.0):
+    """
+    Mide cada fase sobre cada patrón con tamaños tam_inicial * 2**k y
+    devuelve una fila (dict) por combinación; "lineal" es falso si la
+    pendiente del ajuste pasa de `umbral` o alguna medición pasó de `limite`
+    (pendiente None: la fase fue demasiado rápida para ajustar).
+    """
+    filas = []
+    for patron in patrones or PATRONES:
+        textos = [PATRONES[patron](tam_inicial << k) for k in range(duplicaciones + 1)]
+        tamanos = [len(t) for t in textos]
+        for fase in fases or FASES:
+            tiempos = []
+            for texto in textos:
+                estado, t = ejecutor.ejecutar(limite, medir, fase, texto, rondas)
+                if estado != "ok":
+                    break
+                tiempos.append(t)
+            if len(tiempos) == len(textos) and tiempos[-1] < MIN_SEGUNDOS_AJUSTE:
+                m, lineal = None, True
+            elif len(tiempos) == len(textos):
+                m = pendiente(tamanos, tiempos)
+                lineal = m <= umbral
+            else:
+                m, lineal = math.inf, False
+            filas.append({"patron": patron, "fase": fase, "tamanos": tamanos, "segundos": tiempos,
+                          "pendiente": m, "lineal": lineal})
+    return filas
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Fuzzing diferencial y verificación de tiempo lineal "
+                                             "del lexer y el parser")
+    ap.add_argument("--casos", type=int, default=300, help="Entradas generadas (default 300)")
+    ap.add_argument("--semilla", type=int, default=1)
+    ap.add_argument("--tam", type=int, default=2000, help="Tamaño máximo de cada entrada en caracteres")
+    ap.add_argument("--limite", type=float, default=5.0, help="Segundos por entrada (default 5)")
+    ap.add_argument("--motores", help="Motores a comparar con el clásico, separados por comas "
+                                      "(por defecto todos)")
+    ap.add_argument("--salida", default="fuzz_fallos",
+                    help="Directorio donde guardar las entradas que fallan y su versión mínima")
+    ap.add_argument("--caso", help="Solo probar (y reducir, si falla) este archivo fuente")
+    ap.add_argument("--sin-linealidad", action="store_true", help="No medir el crecimiento del tiempo")
+    ap.add_argument("--solo-linealidad", action="store_true", help="Solo medir el crecimiento del tiempo")
+    ap.add_argument("--patrones", help="Patrones de crecimiento a medir, separados por comas "
+                                       "(por defecto todos)")
+    ap.add_argument("--tam-inicial", type=int, default=20000,
+                    help="Caracteres de la entrada más chica al medir el crecimiento")
+    ap.add_argument("--duplicaciones", type=int, default=4, help="Veces que se duplica el tamaño")
+    ap.add_argument("--umbral", type=float, default=1.15,
+                    help="Pendiente log-log máxima aceptada (1 = lineal, 2 = cuadrático)")
+    args = ap.parse_args()
+
+    motores = args.motores.split(",") if args.motores else None
+    for m in motores or ():
+        if m not in MOTORES:
+            ap.error(f"motor desconocido: {m!r} (hay: {', '.join(MOTORES)})")
+    patrones = args.patrones.split(",") if args.patrones else None
+    for p in patrones or ():
+        if p not in PATRONES:
+            ap.error(f"patrón desconocido: {p!r} (hay: {', '.join(PATRONES)})")
+
+    malos = 0
+    with EjecutorAislado() as ejecutor:
+        if args.caso:
+            with open(args.caso, "r", encoding="utf-8", newline="") as f:
+                texto = f.read()
+            firma, detalle = probar_entrada(ejecutor, texto, args.limite, motores)
+            if firma is None:
+                print("Sin discrepancias.")
+                return
+            for d in detalle:
+                print(d)
+            minimo = reducir(ejecutor, texto, firma, args.limite, motores)
+            print(f"\nEntrada mínima ({firma}): {minimo!r}")
+            sys.exit(1)
+
+        if not args.solo_linealidad:
+            t0 = time.perf_counter()
+            fallos = fuzzear(ejecutor, args.casos, args.semilla, args.tam, args.limite, motores,
+                             args.salida)
+            print(f"Fuzzing: {args.casos} entradas, {len(fallos)} con fallos "
+                  f"({time.perf_counter() - t0:.1f} s)\n")
+            malos += len(fallos)
+
+        if not args.sin_linealidad:
+            print(f"{'Patrón':<20}{'Fase':<10}{'Segundos (menor → mayor)':<26}{'Pendiente':<11}")
+            fases = [m for m in MOTORES if m == "clasico" or not motores or m in motores] + ["parser"]
+            for fila in verificar_linealidad(ejecutor, patrones, fases, tam_inicial=args.tam_inicial,
+                                             duplicaciones=args.duplicaciones, umbral=args.umbral):
+                s = fila["segundos"]
+                segundos = f"{s[0]:.3f} → {s[-1]:.3f}" if s else "-"
+                m = fila["pendiente"]
+                if fila["lineal"]:
+                    marca = ""
+                elif math.isinf(m):
+                    marca = "  TIEMPO AGOTADO"
+                else:
+                    marca = "  SUPERLINEAL"
+                m = "-" if m is None else f"{m:.2f}"
+                print(f"{fila['patron']:<20}{fila['fase']:<10}{segundos:<26}{m:<11}{marca}")
+                malos += not fila["lineal"]
+    sys.exit(1 if malos else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# generador.py
+# Generador de programas sintéticos que respetan la gramática del lenguaje
+# (o que la rompen a propósito) para benchmarks y pruebas de estrés.
+import random
+import string
+
+TIPOS_RETORNO = ("entero", "real", "cadena", "vacio")
+OPS_ARIT = ("+", "-", "*", "/", "%")
+OPS_ASIG = ("=", "+=", "-=", "*=", "/=")
+OPS_REL = ("<", "<=", ">", ">=", "==", "!=")
+OPS_LOG = ("&&", "||")
+
+
+def _nombre(prefijo, n):
+    """Identificador válido: prefijo + letras (n en base 26), 8 caracteres como máximo."""
+    letras = ""
+    n += 1
+    while n and len(prefijo) + len(letras) < 8:
+        n, r = divmod(n - 1, 26)
+        letras = string.ascii_lowercase[r] + letras
+    return prefijo + letras
+
+
+class GeneradorProgramas:
+    """
+    Construye un programa: una clase con `variables` declaraciones y
+    `metodos` métodos de `estatutos` estatutos cada uno, con anidamiento
+    hasta `profundidad` (si/mientras/repite/switch) y expresiones de hasta
+    `long_expr` operandos. Con `tasa_errores` > 0 cada estatuto puede salir
+    mutado (falta ';', falta ')', lexema inválido, operador faltante).
+    """
+
+    def __init__(self, metodos=10, estatutos=20, variables=8, profundidad=3,
+                 long_expr=5, tasa_errores=0.0, semilla=None):
+        self.metodos = metodos
+        self.estatutos = estatutos
+        self.variables = variables
+        self.profundidad = profundidad
+        self.long_expr = long_expr
+        self.tasa_errores = tasa_errores
+        self.rnd = random.Random(semilla)
+        self.vars = [_nombre(p, i) for i in range(max(1, variables)) for p in "$%"]
+        self.vars_amp = [_nombre("&", i) for i in range(max(1, variables))]
+        self.nombres_metodos = [_nombre("@m", i) for i in range(max(1, metodos))]
+
+    # ---------------- Expresiones ----------------
+    def operando(self, nivel=0):
+        r = self.rnd.random()
+        if r < 0.35:
+            return self.rnd.choice(self.vars + self.vars_amp)
+        if r < 0.55:
+            return str(self.rnd.randint(0, 500))
+        if r < 0.65:
+            return f"{self.rnd.randint(0, 99)}.{self.rnd.randint(0, 99)}"
+        if r < 0.72:
+            return '"txt"'
+        if r < 0.86 and nivel < 3:
+            return "(" + self.expresion(nivel + 1) + ")"
+        if nivel < 3:
+            args = ", ".join(self.expresion(nivel + 1) for _ in range(self.rnd.randint(0, 2)))
+            return f"{self.rnd.choice(self.nombres_metodos)}({args})"
+        return self.rnd.choice(self.vars)
+
+    def expresion(self, nivel=0):
+        n = self.rnd.randint(1, max(1, self.long_expr))
+        partes = [self.operando(nivel)]
+        for _ in range(n - 1):
+            partes.append(self.rnd.choice(OPS_ARIT))
+            partes.append(self.operando(nivel))
+        return " ".join(partes)
+
+    def condicion(self):
+        partes = []
+        for k in range(self.rnd.randint(1, 2)):
+            if k:
+                partes.append(self.rnd.choice(OPS_LOG))
+            neg = "! " if self.rnd.random() < 0.2 else ""
+            partes.append(f"{neg}{self.expresion()} {self.rnd.choice(OPS_REL)} {self.expresion()}")
+        return " ".join(partes)
+
+    # ---------------- Estatutos ----------------
+    def bloque(self, sangria, nivel, n=None):
+        n = self.rnd.randint(1, 4) if n is None else n
+        return [linea for _ in range(n) for linea in self.estatuto(sangria, nivel)]
+
+    def estatuto(self, sangria, nivel):
+        s = " " * sangria
+        r = self.rnd.random()
+        anidar = nivel < self.profundidad
+        if anidar and r < 0.12:
+            lineas = [f"{s}si ({self.condicion()}) {{"] + self.bloque(sangria + 4, nivel + 1) + [f"{s}}}"]
+            if self.rnd.random() < 0.5:
+                lineas += [f"{s}sino {{"] + self.bloque(sangria + 4, nivel + 1) + [f"{s}}}"]
+        elif anidar and r < 0.20:
+            lineas = [f"{s}mientras ({self.condicion()}) {{"] + self.bloque(sangria + 4, nivel + 1) + [f"{s}}}"]
+        elif anidar and r < 0.25:
+            lineas = ([f"{s}repite {{"] + self.bloque(sangria + 4, nivel + 1) +
+                      [f"{s}}} mientras ({self.condicion()});"])
+        elif anidar and r < 0.30:
+            lineas = [f"{s}switch ({self.rnd.choice(self.vars_amp)}) {{"]
+            for k in range(self.rnd.randint(1, 3)):
+                lineas.append(f"{s}    encaso {k + 1}:")
+                lineas += self.bloque(sangria + 8, nivel + 1)
+            lineas.append(f"{s}}}")
+        elif r < 0.55:
+            destino = self.rnd.choice(self.vars + self.vars_amp)
+            if self.rnd.random() < 0.15:
+                lineas = [f"{s}{destino}{self.rnd.choice(('++', '--'))};"]
+            else:
+                lineas = [f"{s}{destino} {self.rnd.choice(OPS_ASIG)} {self.expresion()};"]
+        elif r < 0.65:
+            lineas = [f"{s}leer({self.rnd.choice(self.vars + self.vars_amp)});"]
+        elif r < 0.80:
+            args = ", ".join(self.expresion() for _ in range(self.rnd.randint(0, 2)))
+            lineas = [f"{s}escribir({args});"]
+        elif r < 0.90:
+            args = ", ".join(self.expresion() for _ in range(self.rnd.randint(0, 2)))
+            lineas = [f"{s}ejecutar {self.rnd.choice(self.vars)} = {self.rnd.choice(self.nombres_metodos)}({args});"]
+        elif r < 0.97:
+            lineas = [f"{s}regresar({self.expresion()});"]
+        else:
+            lineas = [f"{s}salir;"]
+
+        if self.tasa_errores and self.rnd.random() < self.tasa_errores:
+            lineas[0] = self.mutar(lineas[0])
+        return lineas
+
+    def mutar(self, linea):
+        """Introduce un error léxico o sintáctico en la línea."""
+        r = self.rnd.random()
+        if r < 0.25 and ";" in linea:
+            return linea.replace(";", "", 1)
+        if r < 0.45 and ")" in linea:
+            return linea.replace(")", "", 1)
+        if r < 0.65:
+            for op in OPS_ASIG:
+                if f" {op} " in linea:
+                    return linea.replace(f" {op} ", " ", 1)
+        if r < 0.85:
+            basura = self.rnd.choice(("9abc", "@@x", "$a1", "1.2.3", "#", "%__", "abc"))
+            return linea + " " + basura
+        return linea.replace("(", "((", 1)
+
+    # ---------------- Programa ----------------
+    def metodo(self, nombre):
+        params = ", ".join(self.rnd.sample(self.vars_amp, min(len(self.vars_amp), self.rnd.randint(0, 3))))
+        lineas = [f"    metodo {self.rnd.choice(TIPOS_RETORNO)} {nombre}({params}) {{"]
+        if self.rnd.random() < 0.5:
+            lineas.append(f"        var {self.rnd.choice(self.vars)}, {self.rnd.choice(self.vars)};")
+        lineas += self.bloque(8, 0, n=self.estatutos)
+        lineas.append("    }")
+        return lineas
+
+    def programa(self):
+        lineas = ["clase @Prueba {"]
+        todas = self.vars + self.vars_amp
+        for k in range(0, len(todas), 4):
+            lineas.append("    var " + ", ".join(todas[k:k + 4]) + ";")
+        for nombre in self.nombres_metodos[:self.metodos]:
+            lineas += self.metodo(nombre)
+        lineas.append("}")
+        return "\n".join(lineas) + "\n"
+
+
+def generar_programa(**opciones):
+    """Atajo: generar_programa(metodos=50, tasa_errores=0.05, semilla=1)."""
+    return GeneradorProgramas(**opciones).programa()
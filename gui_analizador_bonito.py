@@ -1,12 +1,213 @@
 # gui_analizador_bonito.py
 import os
+import queue
+import threading
+import time
 import tkinter as tk
+from array import array
 from tkinter import filedialog, messagebox
 from tkinter import scrolledtext
 from tkinter import ttk
 
-from lexer import scan
-from sintactic import cargar_tokens_desde_tabla, Parser
+import cache
+from analizador import Resultado
+from arbol import construir_arbol
+from lexer import scan_bloques
+from sintactic import cargar_tokens_desde_tabla, texto_reporte, escribir_reporte, TOKEN_MAP
+import semantico
+from tablas import escribir_tablas
+
+# Cada cuánto (ms) el hilo de Tk revisa los avisos del hilo de trabajo
+INTERVALO_AVISOS = 50
+
+
+class Cancelado(Exception):
+    """El usuario canceló el análisis en curso."""
+
+
+class TablaTokens(ttk.Frame):
+    """
+    Tabla de tokens virtualizada: el Treeview solo contiene las filas que se
+    ven y al desplazarse se reemplazan por las siguientes. Ordenar y filtrar
+    trabajan sobre un arreglo de índices en memoria, sin releer Tokens.txt.
+    """
+    COLUMNAS = ("Lexema", "Token", "PTS", "Línea")
+    CODIGOS_ID = (-55, -56, -57, -58)
+
+    def __init__(self, padre):
+        super().__init__(padre, style="Main.TFrame")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+
+        # Filtros
+        filtros = ttk.Frame(self, style="Main.TFrame")
+        filtros.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 6))
+        ttk.Label(filtros, text="Código:", style="Status.TLabel").pack(side=tk.LEFT)
+        self.ent_codigo = ttk.Entry(filtros, width=12)
+        self.ent_codigo.pack(side=tk.LEFT, padx=(4, 12))
+        ttk.Label(filtros, text="Línea (n o a-b):", style="Status.TLabel").pack(side=tk.LEFT)
+        self.ent_linea = ttk.Entry(filtros, width=12)
+        self.ent_linea.pack(side=tk.LEFT, padx=(4, 12))
+        ttk.Button(filtros, text="Filtrar", command=self.filtrar).pack(side=tk.LEFT)
+        ttk.Button(filtros, text="Limpiar", command=self.limpiar_filtro).pack(side=tk.LEFT, padx=(4, 0))
+        self.lbl_filas = ttk.Label(filtros, text="", style="Status.TLabel")
+        self.lbl_filas.pack(side=tk.RIGHT)
+        for entrada in (self.ent_codigo, self.ent_linea):
+            entrada.bind("<Return>", lambda e: self.filtrar())
+
+        self.arbol = ttk.Treeview(self, columns=self.COLUMNAS, show="headings",
+                                  selectmode="browse", style="Tokens.Treeview")
+        for col, ancho in zip(self.COLUMNAS, (260, 120, 80, 100)):
+            self.arbol.heading(col, text=col, command=lambda c=col: self.ordenar(c))
+            self.arbol.column(col, width=ancho, anchor="w", stretch=(col == "Lexema"))
+        self.arbol.grid(row=1, column=0, sticky="nsew")
+
+        # La barra no desplaza el Treeview: mueve la ventana sobre los índices
+        self.barra = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._desplazar)
+        self.barra.grid(row=1, column=1, sticky="ns")
+
+        self.arbol.bind("<Configure>", self._al_redimensionar)
+        self.arbol.bind("<MouseWheel>", self._rueda)
+        self.arbol.bind("<Button-4>", lambda e: self._mover(-3))
+        self.arbol.bind("<Button-5>", lambda e: self._mover(3))
+        self.arbol.bind("<Prior>", lambda e: self._mover(-self.visibles))
+        self.arbol.bind("<Next>", lambda e: self._mover(self.visibles))
+        self.arbol.bind("<Home>", lambda e: self._mover(-len(self.indices)))
+        self.arbol.bind("<End>", lambda e: self._mover(len(self.indices)))
+
+        self.tokens = []
+        self.indices = range(0)     # filas a mostrar (índices en self.tokens), ya filtradas y ordenadas
+        self.inicio = 0             # primera fila visible
+        self.visibles = 25
+        self.orden = None           # (columna, descendente)
+
+    # ---------- Datos ----------
+    def mostrar(self, tokens):
+        """Muestra una secuencia de lexer.Token (o un token_stream.TokenStream)."""
+        self.tokens = tokens
+        if hasattr(tokens, "codigos"):
+            self.codigos, self.lineas = tokens.codigos, tokens.lineas
+            self._lexema = tokens.lexema
+        else:
+            self.codigos = array('b', [t.codigo for t in tokens])
+            self.lineas = array('i', [t.linea for t in tokens])
+            self._lexema = lambda i: tokens[i].lexema
+        self.orden = None
+        self.limpiar_filtro()
+
+    def _fila(self, i):
+        codigo = self.codigos[i]
+        pts = -2 if codigo in self.CODIGOS_ID else -1
+        return (self._lexema(i), codigo, pts, self.lineas[i])
+
+    # ---------- Filtrar y ordenar ----------
+    def limpiar_filtro(self):
+        self.ent_codigo.delete(0, tk.END)
+        self.ent_linea.delete(0, tk.END)
+        self.indices = range(len(self.codigos))
+        self._aplicar_orden()
+
+    def filtrar(self):
+        codigo = self._leer_codigo(self.ent_codigo.get().strip())
+        lineas = self._leer_lineas(self.ent_linea.get().strip())
+        if codigo is False or lineas is False:
+            return
+        codigos, num_lineas = self.codigos, self.lineas
+        seleccion = range(len(codigos))
+        if codigo is not None:
+            seleccion = [i for i in seleccion if codigos[i] == codigo]
+        if lineas is not None:
+            desde, hasta = lineas
+            seleccion = [i for i in seleccion if desde <= num_lineas[i] <= hasta]
+        self.indices = array('i', seleccion)
+        self._aplicar_orden()
+
+    def _leer_codigo(self, texto):
+        """Código numérico (-56) o nombre (ID_DOLAR); None sin filtro, False si no es válido."""
+        if not texto:
+            return None
+        try:
+            return int(texto)
+        except ValueError:
+            pass
+        for codigo, nombre in TOKEN_MAP.items():
+            if nombre == texto.upper():
+                return codigo
+        messagebox.showwarning("Filtro inválido", f"Código de token desconocido: {texto}")
+        return False
+
+    def _leer_lineas(self, texto):
+        if not texto:
+            return None
+        try:
+            if "-" in texto[1:]:
+                desde, hasta = texto.split("-", 1)
+                return int(desde), int(hasta)
+            return int(texto), int(texto)
+        except ValueError:
+            messagebox.showwarning("Filtro inválido", "La línea debe ser un número o un rango a-b.")
+            return False
+
+    def ordenar(self, columna):
+        descendente = self.orden == (columna, False)
+        self.orden = (columna, descendente)
+        self._aplicar_orden()
+
+    def _aplicar_orden(self):
+        if self.orden is not None:
+            columna, descendente = self.orden
+            claves = {
+                "Lexema": self._lexema,
+                "Token": self.codigos.__getitem__,
+                "PTS": lambda i: -2 if self.codigos[i] in self.CODIGOS_ID else -1,
+                "Línea": self.lineas.__getitem__,
+            }
+            self.indices = array('i', sorted(self.indices, key=claves[columna], reverse=descendente))
+            for col in self.COLUMNAS:
+                marca = (" ▼" if descendente else " ▲") if col == columna else ""
+                self.arbol.heading(col, text=col + marca)
+        self.inicio = 0
+        self._pintar()
+
+    # ---------- Ventana visible ----------
+    def _pintar(self):
+        self.arbol.delete(*self.arbol.get_children())
+        total = len(self.indices)
+        fin = min(total, self.inicio + self.visibles)
+        for k in range(self.inicio, fin):
+            self.arbol.insert("", tk.END, values=self._fila(self.indices[k]))
+        if total:
+            self.barra.set(self.inicio / total, fin / total)
+            self.lbl_filas.config(text=f"Filas {self.inicio + 1:,}-{fin:,} de {total:,}")
+        else:
+            self.barra.set(0, 1)
+            self.lbl_filas.config(text="Sin filas")
+
+    def _mover(self, filas):
+        maximo = max(0, len(self.indices) - self.visibles)
+        nuevo = min(max(0, self.inicio + filas), maximo)
+        if nuevo != self.inicio:
+            self.inicio = nuevo
+            self._pintar()
+        return "break"
+
+    def _desplazar(self, accion, cantidad, unidad=None):
+        if accion == "moveto":
+            self._mover(int(float(cantidad) * len(self.indices)) - self.inicio)
+        elif accion == "scroll":
+            paso = self.visibles if unidad == "pages" else 1
+            self._mover(int(cantidad) * paso)
+
+    def _rueda(self, evento):
+        return self._mover(-3 if evento.delta > 0 else 3)
+
+    def _al_redimensionar(self, evento):
+        alto_fila = int(ttk.Style().lookup("Tokens.Treeview", "rowheight") or 20)
+        visibles = max(1, (evento.height - alto_fila) // alto_fila)  # menos el encabezado
+        if visibles != self.visibles:
+            self.visibles = visibles
+            self._mover(0)
+            self._pintar()
 
 
 class AnalizadorGUI:
@@ -21,6 +222,18 @@ class AnalizadorGUI:
         self.ruta_tokens = "Tokens.txt"
         self.ruta_errores_lex = "Errores.txt"
         self.ruta_errores_sint = "Errores_Sintácticos.txt"
+        self.ruta_errores_sem = "Errores_Semánticos.txt"
+
+        # Resultado del último análisis léxico (se pasa al parser en memoria)
+        self.tokens_lex = None
+        self.resultado = None   # analizador.Resultado del último archivo analizado
+
+        # Trabajo en segundo plano (un solo análisis a la vez)
+        self._hilo = None
+        self._avisos = queue.Queue()
+        self._cancelar = threading.Event()
+        self._al_terminar = None
+        self._t_inicio = 0.0
 
         self._configurar_estilos()
         self._crear_layout()
@@ -75,6 +288,22 @@ class AnalizadorGUI:
             font=("Segoe UI", 9)
         )
 
+        # Tabla de tokens
+        style.configure(
+            "Tokens.Treeview",
+            background="#020617",
+            fieldbackground="#020617",
+            foreground=self.color_texto,
+            font=("Consolas", 10),
+            rowheight=20
+        )
+        style.configure(
+            "Tokens.Treeview.Heading",
+            background=self.color_panel,
+            foreground=self.color_texto,
+            font=("Segoe UI", 9, "bold")
+        )
+
         # Botones de menú
         style.configure(
             "Menu.TButton",
@@ -180,6 +409,9 @@ class AnalizadorGUI:
         for btn in (btn2, btn3, btn4, btn5):
             btn.pack(fill=tk.X, padx=18, pady=4)
 
+        # Se deshabilitan mientras hay un análisis en curso
+        self._botones_trabajo = (btn1, btn4)
+
         # Créditos / info abajo
         side_bottom = ttk.Label(
             side,
@@ -217,6 +449,11 @@ class AnalizadorGUI:
         self.txt_salida.grid(row=1, column=0, sticky="nsew", padx=16, pady=(0, 10))
         self.txt_salida.configure(state=tk.DISABLED)
 
+        # Tabla de tokens (ocupa el mismo lugar que el área de texto)
+        self.tabla_tokens = TablaTokens(content)
+        self.tabla_tokens.grid(row=1, column=0, sticky="nsew", padx=16, pady=(0, 10))
+        self.tabla_tokens.grid_remove()
+
         # ------- Barra de estado -------
         status_frame = ttk.Frame(main, style="Main.TFrame")
         status_frame.grid(row=1, column=0, columnspan=2, sticky="ew")
@@ -230,7 +467,18 @@ class AnalizadorGUI:
         )
         self.lbl_status.grid(row=0, column=0, sticky="ew", padx=16, pady=(0, 8))
 
+        self.btn_cancelar = ttk.Button(
+            status_frame,
+            text="Cancelar",
+            style="Menu.TButton",
+            command=self.cancelar,
+            state=tk.DISABLED
+        )
+        self.btn_cancelar.grid(row=0, column=1, sticky="e", padx=16, pady=(0, 8))
+
     def _escribir_salida(self, texto, titulo="Salida del analizador"):
+        self.tabla_tokens.grid_remove()
+        self.txt_salida.grid()
         self.txt_salida.configure(state=tk.NORMAL)
         self.txt_salida.delete(1.0, tk.END)
         self.txt_salida.insert(tk.END, texto)
@@ -240,6 +488,113 @@ class AnalizadorGUI:
     def _actualizar_status(self, texto):
         self.lbl_status.config(text=texto)
 
+    # ---------------- Trabajo en segundo plano ----------------
+    # El análisis corre en un hilo aparte; ese hilo nunca toca widgets: deja
+    # avisos en una cola que el hilo de Tk revisa con root.after.
+    def _iniciar_trabajo(self, trabajo, al_terminar, texto):
+        """
+        Ejecuta trabajo(avisar, cancelado) en otro hilo. avisar(fase, fraccion,
+        tokens) informa el avance; al terminar se llama al_terminar(resultado)
+        en el hilo de Tk.
+        """
+        if self._hilo is not None:
+            return
+        self._cancelar = threading.Event()
+        self._avisos = queue.Queue()
+        avisos, cancelado = self._avisos, self._cancelar
+
+        def avisar(fase, fraccion, tokens):
+            avisos.put(("avance", (fase, fraccion, tokens)))
+
+        def correr():
+            try:
+                avisos.put(("fin", trabajo(avisar, cancelado)))
+            except Cancelado:
+                avisos.put(("cancelado", None))
+            except Exception as e:
+                avisos.put(("error", e))
+
+        self._t_inicio = time.perf_counter()
+        self._al_terminar = al_terminar
+        self._ocupado(True)
+        self._actualizar_status(texto)
+        self._hilo = threading.Thread(target=correr, daemon=True)
+        self._hilo.start()
+        self.root.after(INTERVALO_AVISOS, self._revisar_avisos)
+
+    def _revisar_avisos(self):
+        avance = None
+        while True:
+            try:
+                tipo, dato = self._avisos.get_nowait()
+            except queue.Empty:
+                break
+            if tipo == "avance":
+                avance = dato  # solo interesa el más reciente
+                continue
+            self._hilo = None
+            self._ocupado(False)
+            if tipo == "fin":
+                self._al_terminar(dato)
+            elif tipo == "cancelado":
+                self._actualizar_status("Análisis cancelado.")
+            else:
+                messagebox.showerror("Error", f"Error durante el análisis:\n{dato}")
+                self._actualizar_status("Error durante el análisis.")
+            return
+
+        if avance is not None:
+            fase, fraccion, tokens = avance
+            transcurrido = time.perf_counter() - self._t_inicio
+            velocidad = tokens / transcurrido if transcurrido > 0 else 0
+            self._actualizar_status(f"{fase}... {fraccion:.0%}  ·  {tokens:,} tokens  ·  "
+                                    f"{velocidad:,.0f} tokens/s")
+        self.root.after(INTERVALO_AVISOS, self._revisar_avisos)
+
+    def _ocupado(self, ocupado):
+        estado = tk.DISABLED if ocupado else tk.NORMAL
+        for btn in self._botones_trabajo:
+            btn.config(state=estado)
+        self.btn_cancelar.config(state=tk.NORMAL if ocupado else tk.DISABLED)
+
+    def cancelar(self):
+        if self._hilo is not None:
+            self._cancelar.set()
+            self._actualizar_status("Cancelando...")
+
+    def _analizar_en_hilo(self, ruta, avisar, cancelado):
+        """Trabajo de la opción 1 (corre fuera del hilo de Tk): solo el léxico."""
+        with open(ruta, "r", encoding="utf-8") as f:
+            codigo = f.read()
+
+        # Si el archivo no cambió, el resultado sale de la caché (entrada solo
+        # léxica: el sintáctico se hace en la opción 4)
+        almacen = None if cache.DESACTIVADA else cache.CacheResultados()
+        res = almacen.obtener(codigo, "lexico") if almacen else None
+        if res is None:
+            tokens, errores = [], []
+            total = len(codigo) or 1
+            for tokens_bloque, errores_bloque, hecho in scan_bloques(codigo, motor="regex"):
+                if cancelado.is_set():
+                    raise Cancelado()
+                tokens.extend(tokens_bloque)
+                errores.extend(errores_bloque)
+                avisar("Análisis léxico", hecho / total, len(tokens))
+            res = Resultado(tokens, errores)
+            if almacen:
+                almacen.guardar(codigo, res, "lexico")
+
+        n = len(res.tokens) or 1
+
+        def al_escribir(filas):
+            if cancelado.is_set():
+                raise Cancelado()
+            avisar("Escribiendo Tokens.txt y Errores.txt", filas / n, filas)
+
+        escribir_tablas(res.tokens, res.errores_lexicos, self.ruta_tokens, self.ruta_errores_lex,
+                        avance=al_escribir)
+        return res
+
     # ---------- Opción 1: Analizar archivo ----------
     def analizar_archivo(self):
         ruta = filedialog.askopenfilename(
@@ -250,48 +605,21 @@ class AnalizadorGUI:
             return
 
         self.ruta_fuente = ruta
+        self._iniciar_trabajo(
+            lambda avisar, cancelado: self._analizar_en_hilo(ruta, avisar, cancelado),
+            self._analisis_terminado,
+            "Analizando léxicamente el archivo seleccionado..."
+        )
 
-        try:
-            with open(ruta, "r", encoding="utf-8") as f:
-                codigo = f.read()
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo leer el archivo:\n{e}")
-            return
-
-        self._actualizar_status("Analizando léxicamente el archivo seleccionado...")
-
-        # Analizador léxico
-        tokens, errores = scan(codigo)
-
-        # Escribir Tokens.txt
-        try:
-            with open(self.ruta_tokens, "w", encoding="utf-8") as f:
-                f.write(f"{'Lexema':<25}{'Token':<15}{'PTS':<10}{'Línea':<10}\n")
-                for t in tokens:
-                    if t.codigo in [-55, -56, -57, -58]:
-                        pts = -2
-                    else:
-                        pts = -1
-                    f.write(f"{t.lexema:<25}{t.codigo:<15}{pts:<10}{t.linea:<10}\n")
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo escribir Tokens.txt:\n{e}")
-            self._actualizar_status("Error al escribir Tokens.txt.")
-            return
-
-        # Escribir Errores.txt
-        try:
-            with open(self.ruta_errores_lex, "w", encoding="utf-8") as f:
-                f.write(f"{'Lexema':<25}{'Descripción':<80}{'Línea':<10}\n")
-                for e in errores:
-                    f.write(f"{e.lexema:<25}{e.descripcion:<80}{e.linea:<10}\n")
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo escribir Errores.txt:\n{e}")
-            self._actualizar_status("Error al escribir Errores.txt.")
-            return
+    def _analisis_terminado(self, resultado):
+        self.resultado = resultado
+        self.tokens_lex = tokens = resultado.tokens
+        errores = resultado.errores_lexicos
+        segundos = time.perf_counter() - self._t_inicio
 
         resumen = (
             "✔ Análisis léxico completado\n\n"
-            f"Archivo fuente   : {os.path.basename(ruta)}\n"
+            f"Archivo fuente   : {os.path.basename(self.ruta_fuente)}\n"
             f"Tokens generados : {len(tokens)}\n"
             f"Errores léxicos  : {len(errores)}\n\n"
             f"Se generaron los archivos:\n"
@@ -300,11 +628,22 @@ class AnalizadorGUI:
         )
 
         self._escribir_salida(resumen, titulo="Resumen del análisis léxico")
-        self._actualizar_status("Análisis léxico completado correctamente.")
+        self._actualizar_status(f"Análisis léxico completado correctamente "
+                                f"({len(tokens):,} tokens en {segundos:.2f} s).")
         messagebox.showinfo("Éxito", "Análisis léxico completado.\nSe generaron Tokens.txt y Errores.txt.")
 
     # ---------- Opción 2: Ver tabla de tokens ----------
     def ver_tokens(self):
+        if self.tokens_lex is not None:
+            # Tabla virtual sobre los tokens en memoria: no se lee Tokens.txt
+            self.txt_salida.grid_remove()
+            self.tabla_tokens.grid()
+            self.tabla_tokens.mostrar(self.tokens_lex)
+            self.lbl_seccion.config(text="Tabla de tokens")
+            self._actualizar_status(f"Mostrando {len(self.tokens_lex):,} tokens "
+                                    "(clic en un encabezado para ordenar).")
+            return
+
         if not os.path.exists(self.ruta_tokens):
             messagebox.showwarning(
                 "Tokens.txt no encontrado",
@@ -343,45 +682,71 @@ class AnalizadorGUI:
 
     # ---------- Opción 4: Analizar sintaxis ----------
     def analizar_sintaxis(self):
-        if not os.path.exists(self.ruta_tokens):
+        if self.tokens_lex is None and not os.path.exists(self.ruta_tokens):
             messagebox.showwarning(
                 "Tokens.txt no encontrado",
                 "Primero debes generar la tabla de tokens (opción 1)."
             )
             return
 
-        self._actualizar_status("Realizando análisis sintáctico...")
+        res = self.resultado
+        if res is not None and res.errores_semanticos is not None:
+            # Ya analizado antes (o recuperado de la caché)
+            self._sintaxis_terminada((res.errores_sintacticos, res.errores_semanticos))
+            return
 
+        def trabajo(avisar, cancelado):
+            if self.tokens_lex is not None:
+                # Tokens del último análisis léxico, sin releer Tokens.txt
+                tokens = self.tokens_lex
+            else:
+                avisar("Leyendo Tokens.txt", 0.0, 0)
+                tokens = cargar_tokens_desde_tabla(self.ruta_tokens)
+                if cancelado.is_set():
+                    raise Cancelado()
+            total = len(tokens) or 1
+
+            def al_parsear(pos):
+                if cancelado.is_set():
+                    raise Cancelado()
+                avisar("Análisis sintáctico", pos / total, pos)
+
+            avisar("Análisis sintáctico", 0.0, 0)
+            # ParserAST da los mismos errores sintácticos y además el árbol
+            arbol, sintacticos = construir_arbol(tokens, avance=al_parsear)
+            nodos = len(arbol) or 1
+
+            def al_analizar(nodo):
+                if cancelado.is_set():
+                    raise Cancelado()
+                avisar("Análisis semántico", nodo / nodos, len(tokens))
+
+            avisar("Análisis semántico", 0.0, len(tokens))
+            return sintacticos, semantico.analizar_semantica(arbol, avance=al_analizar)
+
+        self._iniciar_trabajo(trabajo, self._sintaxis_terminada, "Realizando análisis sintáctico...")
+
+    def _sintaxis_terminada(self, errores):
+        sintacticos, semanticos = errores
+        if self.resultado is not None:
+            self.resultado.errores_sintacticos = sintacticos
+            self.resultado.errores_semanticos = semanticos
+
+        # Exportar Errores_Sintácticos.txt y Errores_Semánticos.txt
+        # (opcional: la salida ya está en memoria)
         try:
-            tokens = cargar_tokens_desde_tabla(self.ruta_tokens)
-            parser = Parser(tokens)
-            parser.parse()  # genera Errores_Sintácticos.txt
+            escribir_reporte(sintacticos, self.ruta_errores_sint)
+            semantico.escribir_reporte(semanticos, self.ruta_errores_sem)
         except Exception as e:
-            messagebox.showerror("Error", f"Error durante el análisis sintáctico:\n{e}")
-            self._actualizar_status("Error durante el análisis sintáctico.")
-            return
+            messagebox.showerror("Error", f"No se pudieron escribir los reportes de errores:\n{e}")
 
         # Mostrar resultado
-        if os.path.exists(self.ruta_errores_sint):
-            try:
-                with open(self.ruta_errores_sint, "r", encoding="utf-8") as f:
-                    contenido = f.read()
-            except Exception as e:
-                messagebox.showerror("Error", f"No se pudo leer Errores_Sintácticos.txt:\n{e}")
-                self._actualizar_status("Error al leer Errores_Sintácticos.txt.")
-                return
-
-            titulo = "Errores sintácticos (Errores_Sintácticos.txt)"
-            if "SIN ERRORES" in contenido.upper():
-                titulo = "Análisis sintáctico sin errores"
-            self._escribir_salida(contenido, titulo=titulo)
+        contenido = texto_reporte(sintacticos) + "\n" + semantico.texto_reporte(semanticos)
+        if not sintacticos and not semanticos:
+            self._escribir_salida(contenido, titulo="Análisis sintáctico y semántico sin errores")
         else:
-            if not getattr(parser, "errores", []):
-                self._escribir_salida("Análisis sintáctico completado SIN ERRORES.\n",
-                                      titulo="Análisis sintáctico sin errores")
-            else:
-                texto = "ANÁLISIS SINTÁCTICO\n\n" + "\n".join(parser.errores)
-                self._escribir_salida(texto, titulo="Errores sintácticos")
+            self._escribir_salida(contenido, titulo="Errores sintácticos y semánticos "
+                                                    "(Errores_Sintácticos.txt, Errores_Semánticos.txt)")
 
         self._actualizar_status("Análisis sintáctico finalizado.")
         messagebox.showinfo("Listo", "Análisis sintáctico terminado.\nRevisa la salida en la ventana.")
@@ -0,0 +1,96 @@
+# incremental.py
+# Re-análisis léxico incremental por rangos de líneas.
+#
+# scan() no arrastra estado entre líneas (los strings cierran en la misma
+# línea y los comentarios // terminan en el salto), así que al editar un rango
+# basta con volver a analizar SOLO las líneas nuevas. Los tokens se guardan
+# por línea y sin número de línea: las líneas posteriores a la edición se
+# "desplazan" con un simple recorte de listas, sin volver a construirse.
+from lexer import MOTORES, Token, ErrorLexico
+from token_stream import TokenStream
+
+
+class LexerIncremental:
+    def __init__(self, codigo="", motor="regex"):
+        if motor not in MOTORES:
+            raise ValueError(f"Motor de análisis léxico desconocido: {motor!r}")
+        self.motor = motor
+        self._lineas = []    # texto de cada línea
+        self._tokens = []    # por línea: [(lexema, codigo, columna), ...]
+        self._errores = []   # por línea: [(lexema, descripcion, columna), ...]
+        self.editar(1, 0, codigo)
+
+    def __len__(self):
+        return len(self._lineas)
+
+    def _analizar_linea(self, linea):
+        tokens, errores = [], []
+        MOTORES[self.motor](linea, 1, tokens, errores)
+        return ([(t.lexema, t.codigo, t.columna) for t in tokens],
+                [(e.lexema, e.descripcion, e.columna) for e in errores])
+
+    def editar(self, inicio, fin, texto):
+        """
+        Reemplaza las líneas inicio..fin (1-based, inclusivas) por las líneas
+        de `texto`. Con fin = inicio - 1 solo inserta; con texto "" solo borra.
+        Devuelve el número de líneas nuevas analizadas.
+        """
+        if inicio < 1 or fin < inicio - 1 or fin > len(self._lineas):
+            raise IndexError(f"Rango de líneas inválido: {inicio}..{fin} (hay {len(self._lineas)})")
+
+        nuevas = texto.splitlines()
+        toks, errs = [], []
+        for linea in nuevas:
+            t, e = self._analizar_linea(linea)
+            toks.append(t)
+            errs.append(e)
+
+        a, b = inicio - 1, fin
+        self._lineas[a:b] = nuevas
+        self._tokens[a:b] = toks
+        self._errores[a:b] = errs
+        return len(nuevas)
+
+    def texto(self):
+        return "\n".join(self._lineas)
+
+    def linea(self, num_linea):
+        return self._lineas[num_linea - 1]
+
+    def tokens_linea(self, num_linea):
+        return [Token(lex, cod, num_linea, col) for lex, cod, col in self._tokens[num_linea - 1]]
+
+    def errores_linea(self, num_linea):
+        return [ErrorLexico(lex, desc, num_linea, col) for lex, desc, col in self._errores[num_linea - 1]]
+
+    def tokens(self):
+        for num_linea, fila in enumerate(self._tokens, start=1):
+            for lex, cod, col in fila:
+                yield Token(lex, cod, num_linea, col)
+
+    def errores(self):
+        for num_linea, fila in enumerate(self._errores, start=1):
+            for lex, desc, col in fila:
+                yield ErrorLexico(lex, desc, num_linea, col)
+
+    def scan(self):
+        """Mismo resultado que lexer.scan(self.texto())."""
+        return list(self.tokens()), list(self.errores())
+
+    def columnas(self):
+        """
+        Los tokens como token_stream.TokenStream sobre texto(), sin crear un
+        Token por lexema: ParserCodigos y las tablas los leen directo.
+        """
+        stream = TokenStream(self.texto())
+        inicio_linea = 0
+        for num_linea, (linea, fila) in enumerate(zip(self._lineas, self._tokens), start=1):
+            if fila:
+                lx, cd, cl = zip(*fila)
+                stream.codigos.extend(cd)
+                stream.columnas.extend(cl)
+                stream.lineas.extend([num_linea] * len(fila))
+                stream.inicios.extend([inicio_linea + c - 1 for c in cl])
+                stream.longitudes.extend([len(x) for x in lx])
+            inicio_linea += len(linea) + 1    # texto() une las líneas con '\n'
+        return stream
@@ -0,0 +1,323 @@
+# instrumentacion.py
+# Perfilado opcional por fase, por rama del lexer y por producción del Parser.
+#
+# Desactivado no cuesta nada: no hay ganchos en los caminos calientes. Al
+# entrar en `with Instrumentos() as ins:` se envuelven _paso_clasico (ramas
+# del lexer) y las producciones (PRODUCCIONES) de cada clase de parser; al
+# salir se restauran.
+#
+# Las envolturas se instalan en las clases y el módulo (son globales), pero
+# solo miden en el hilo que entró al `with`: en cualquier otro hilo (p. ej.
+# el GUI o el servidor analizando a la vez) llaman directo al original, así
+# que ni se mezclan sus llamadas en la pila de medición ni cambian de
+# resultado.
+import argparse
+import inspect
+import json
+import marshal
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import lexer
+import sintactic
+
+# Instrumentos activos (None = instrumentación desactivada)
+_activos = None
+
+
+@contextmanager
+def fase(nombre):
+    """Marca una fase del análisis; no hace nada sin instrumentos activos en este hilo."""
+    if _activos is None or _activos.hilo != threading.get_ident():
+        yield
+    else:
+        with _activos.medir(("<fase>", 0, nombre)):
+            yield
+
+
+def _rama(tokens, errores, n_tok, n_err, nueva_pos):
+    """Clasifica un paso de _paso_clasico según lo que produjo."""
+    if len(tokens) > n_tok:
+        codigo = tokens[-1].codigo
+        if codigo >= -20:
+            return "reservada"
+        if codigo >= -41:
+            return "operador"
+        if codigo >= -50:
+            return "especial"
+        if codigo >= -58:
+            return "identificador"
+        if codigo >= -60:
+            return "numero"
+        return "string"
+    if len(errores) > n_err:
+        desc = errores[-1].descripcion
+        if desc.startswith("Identificador") or desc.startswith("Longitud"):
+            return "identificador"
+        if "String" in desc:
+            return "string"
+        if desc.startswith("Palabra"):
+            return "reservada"
+        if desc.startswith("Símbolo"):
+            return "otro"
+        return "numero"
+    return "comentario" if nueva_pos < 0 else "espacio"
+
+
+class _Contador:
+    __slots__ = ("llamadas", "primitivas", "pared", "cpu", "propio", "llamadores")
+
+    def __init__(self):
+        self.llamadas = 0      # total de llamadas (incluye recursivas)
+        self.primitivas = 0    # llamadas no recursivas
+        self.pared = 0.0       # tiempo acumulado (sin contar recursión doble)
+        self.cpu = 0.0
+        self.propio = 0.0      # tiempo sin contar subllamadas medidas
+        self.llamadores = {}   # clave llamador -> [primitivas, llamadas, propio, pared]
+
+
+def clases_parser():
+    """
+    Clases de parser que se instrumentan por omisión: todas las de la
+    tubería. Las producciones de ParserIterativo y ParserCodigosIterativo
+    están en sus clases de parser_iterativo_generado.
+    """
+    from parser_codigos import ParserCodigos
+    from parser_iterativo_generado import ProduccionesParser, ProduccionesParserCodigos
+    from arbol import ParserAST, ParserASTIterativo
+    return (sintactic.Parser, ProduccionesParser, ParserCodigos, ProduccionesParserCodigos,
+            ParserAST, ParserASTIterativo)
+
+
+class Instrumentos:
+    def __init__(self, lexer_ramas=True, producciones=True, parsers=None):
+        self.lexer_ramas = lexer_ramas
+        self.producciones = producciones
+        self.parsers = parsers   # clases cuyas producciones se miden (None: clases_parser())
+        self.contadores = {}   # (archivo, línea, nombre) -> _Contador
+        self._pila = []        # [clave, t0_pared, t0_cpu, pared_hijos]
+        self._activas = {}     # clave -> llamadas en curso (detecta recursión)
+        self._originales = []
+        self.hilo = None       # threading.get_ident() del hilo que se mide
+
+    # ---------------- Medición ----------------
+    def _entrar(self, clave):
+        self._pila.append([clave, time.perf_counter(), time.process_time(), 0.0])
+        self._activas[clave] = self._activas.get(clave, 0) + 1
+
+    def _salir(self, clave_final=None):
+        clave, t0, c0, hijos = self._pila.pop()
+        dt = time.perf_counter() - t0
+        dc = time.process_time() - c0
+        self._activas[clave] -= 1
+        if clave_final is not None:
+            clave = clave_final
+        c = self.contadores.get(clave)
+        if c is None:
+            c = self.contadores[clave] = _Contador()
+        # Una llamada recursiva no suma al acumulado (ya lo hace la externa)
+        recursiva = self._activas.get(clave, 0) > 0
+        c.llamadas += 1
+        c.propio += dt - hijos
+        if not recursiva:
+            c.primitivas += 1
+            c.pared += dt
+            c.cpu += dc
+        if self._pila:
+            padre = self._pila[-1]
+            padre[3] += dt
+            ll = c.llamadores.setdefault(padre[0], [0, 0, 0.0, 0.0])
+            ll[0] += 0 if recursiva else 1
+            ll[1] += 1
+            ll[2] += dt - hijos
+            ll[3] += 0.0 if recursiva else dt
+
+    @contextmanager
+    def medir(self, clave):
+        self._entrar(clave)
+        try:
+            yield
+        finally:
+            self._salir()
+
+    # ---------------- Activación ----------------
+    def __enter__(self):
+        global _activos
+        if _activos is not None:
+            raise RuntimeError("Ya hay instrumentos activos")
+        self.hilo = threading.get_ident()
+        _activos = self
+        if self.lexer_ramas:
+            self._envolver_lexer()
+        if self.producciones:
+            self._envolver_parser()
+        return self
+
+    def __exit__(self, *exc):
+        global _activos
+        for objeto, nombre, original in reversed(self._originales):
+            setattr(objeto, nombre, original)
+        self._originales = []
+        _activos = None
+        return False
+
+    def _envolver_lexer(self):
+        original = lexer._paso_clasico
+        entrar, salir = self._entrar, self._salir
+        hilo, get_ident = self.hilo, threading.get_ident
+        claves = {}
+
+        def paso(linea, i, num_linea, tokens, errores):
+            if get_ident() != hilo:
+                return original(linea, i, num_linea, tokens, errores)
+            n_tok, n_err = len(tokens), len(errores)
+            entrar(None)  # la rama se conoce hasta ver qué produjo el paso
+            j = -1
+            try:
+                j = original(linea, i, num_linea, tokens, errores)
+            finally:
+                rama = _rama(tokens, errores, n_tok, n_err, j)
+                clave = claves.get(rama)
+                if clave is None:
+                    clave = claves[rama] = ("lexer.py", original.__code__.co_firstlineno, "rama:" + rama)
+                salir(clave)
+            return j
+
+        self._originales.append((lexer, "_paso_clasico", original))
+        lexer._paso_clasico = paso
+
+    def _envolver_parser(self):
+        for clase in self.parsers or clases_parser():
+            for nombre in sintactic.Parser.PRODUCCIONES:
+                # Solo lo definido en la clase: lo heredado ya se mide en la base
+                original = vars(clase).get(nombre)
+                if original is None:
+                    continue
+                codigo = original.__code__
+                clave = (os.path.basename(codigo.co_filename), codigo.co_firstlineno,
+                         f"{clase.__name__}.{nombre}")
+                self._originales.append((clase, nombre, original))
+                setattr(clase, nombre, self._envoltura(original, clave))
+
+    def _envoltura(self, original, clave):
+        entrar, salir = self._entrar, self._salir
+        hilo, get_ident = self.hilo, threading.get_ident
+
+        if inspect.isgeneratorfunction(original):
+            # Producción de un parser iterativo: se mide de su primer paso a
+            # su último; las subproducciones corren mientras está suspendida
+            def envuelta(*args, **kwargs):
+                if get_ident() != hilo:
+                    return (yield from original(*args, **kwargs))
+                entrar(clave)
+                try:
+                    return (yield from original(*args, **kwargs))
+                finally:
+                    salir()
+        else:
+            def envuelta(*args, **kwargs):
+                if get_ident() != hilo:
+                    return original(*args, **kwargs)
+                entrar(clave)
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    salir()
+
+        envuelta.__name__ = original.__name__
+        return envuelta
+
+    # ---------------- Exportación ----------------
+    def a_dict(self):
+        grupos = {"fases": {}, "ramas_lexer": {}, "producciones": {}}
+        for (archivo, _, nombre), c in sorted(self.contadores.items(), key=lambda kv: -kv[1].pared):
+            if archivo == "<fase>":
+                grupo, clave = "fases", nombre
+            elif nombre.startswith("rama:"):
+                grupo, clave = "ramas_lexer", nombre[5:]
+            else:
+                grupo, clave = "producciones", nombre.split(".", 1)[-1]
+            # La misma producción en varias clases (p. ej. el respaldo
+            # iterativo de analizador.parsear) se suma en una sola fila
+            fila = grupos[grupo].setdefault(clave, {"llamadas": 0, "pared_seg": 0.0,
+                                                    "cpu_seg": 0.0, "propio_seg": 0.0})
+            fila["llamadas"] += c.llamadas
+            fila["pared_seg"] += c.pared
+            fila["cpu_seg"] += c.cpu
+            fila["propio_seg"] += c.propio
+        return grupos
+
+    def guardar_json(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.a_dict(), f, ensure_ascii=False, indent=2)
+
+    def guardar_pstats(self, ruta):
+        """Archivo compatible con pstats.Stats(ruta) / snakeviz."""
+        stats = {}
+        for clave, c in self.contadores.items():
+            llamadores = {k: tuple(v) for k, v in c.llamadores.items()}
+            stats[clave] = (c.primitivas, c.llamadas, c.propio, c.pared, llamadores)
+        with open(ruta, "wb") as f:
+            marshal.dump(stats, f)
+
+
+def perfilar_archivo(ruta_fuente, motor="clasico", directorio=None):
+    """
+    Ejecuta la tubería clásica completa (leer, scan, escribir tabla, recargar
+    tabla, parse) midiendo cada fase. Tokens.txt y Errores.txt se escriben
+    en `directorio` (por omisión, uno temporal que se borra al terminar: el
+    perfil no pisa las tablas del directorio actual). Devuelve los
+    Instrumentos usados.
+    """
+    if directorio is None:
+        with tempfile.TemporaryDirectory(prefix="perfil-") as temporal:
+            return perfilar_archivo(ruta_fuente, motor, temporal)
+
+    from analizador import escribir_tabla_tokens, escribir_tabla_errores
+
+    ruta_tokens = os.path.join(directorio, "Tokens.txt")
+    with Instrumentos() as ins:
+        with fase("lectura"):
+            with open(ruta_fuente, "r", encoding="utf-8") as f:
+                codigo = f.read()
+        with fase("scan"):
+            tokens, errores = lexer.scan(codigo, motor=motor)
+        with fase("escritura_tablas"):
+            escribir_tabla_tokens(tokens, ruta_tokens)
+            escribir_tabla_errores(errores, os.path.join(directorio, "Errores.txt"))
+        with fase("recarga_tabla"):
+            tokens_parser = sintactic.cargar_tokens_desde_tabla(ruta_tokens)
+        with fase("parse"):
+            sintactic.Parser(tokens_parser).parse(reporte=False)
+    return ins
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Perfil por fase / rama del lexer / producción")
+    ap.add_argument("fuente", help="Archivo fuente a analizar")
+    ap.add_argument("--motor", default="clasico", choices=sorted(lexer.MOTORES),
+                    help="Motor de scan (las ramas del lexer se detallan con 'clasico')")
+    ap.add_argument("--json", help="Guardar el resumen en JSON")
+    ap.add_argument("--pstats", help="Guardar estadísticas compatibles con pstats")
+    ap.add_argument("--tablas", metavar="DIR",
+                    help="Dejar Tokens.txt y Errores.txt en DIR (por omisión, en un temporal)")
+    args = ap.parse_args()
+
+    ins = perfilar_archivo(args.fuente, args.motor, args.tablas)
+    datos = ins.a_dict()
+    for grupo, filas in datos.items():
+        print(f"\n{grupo.upper()}")
+        print(f"{'Nombre':<20}{'Llamadas':<12}{'Pared (s)':<14}{'CPU (s)':<14}{'Propio (s)':<14}")
+        for nombre, d in filas.items():
+            print(f"{nombre:<20}{d['llamadas']:<12}{d['pared_seg']:<14.6f}{d['cpu_seg']:<14.6f}{d['propio_seg']:<14.6f}")
+    if args.json:
+        ins.guardar_json(args.json)
+    if args.pstats:
+        ins.guardar_pstats(args.pstats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# lexer_numpy.py
+# Motor "numpy" del lexer (opcional: solo se registra si NumPy está
+# instalado). Primero convierte el texto en un arreglo de clases de
+# carácter (espacio, salto, letra, dígito, resto) y encuentra con
+# operaciones vectorizadas dónde empieza cada "corrida" de caracteres de la
+# misma clase; cada carácter de la clase "resto" (operadores, prefijos,
+# comillas, no ASCII...) es una corrida propia. El ciclo en Python ya no
+# prueba carácter por carácter: decide un token por corrida, con las mismas
+# reglas que la expresión maestra del motor "regex" (despachando los
+# símbolos con las tablas compartidas de lexer: _CATEGORIA y el trie de
+# _simbolo), y todo caso raro se delega en _paso_clasico, así que la salida
+# es idéntica por construcción.
+import numpy as np
+
+from lexer import (Token, ErrorLexico, _paso_clasico, _FIJOS, _COD_IDENT, _COD_ENTERA, _COD_REAL,
+                   _COD_STRING, _SALTOS_RAROS, internar, _CATEGORIA, _TRIE_SIMBOLOS, _simbolo as simbolo,
+                   CAT_OPERADOR, CAT_BARRA, CAT_SIGNO, CAT_PUNTO, CAT_PREFIJO, CAT_COMILLA)
+
+ESPACIO, SALTO, LETRA, DIGITO, RESTO = range(5)
+
+# Clase de cada carácter ASCII; la posición 128 es la de todo lo no ASCII
+_CLASE_DE = np.full(129, RESTO, dtype=np.uint8)
+_CLASE_DE[[ord(" "), ord("\t")]] = ESPACIO
+_CLASE_DE[ord("\n")] = SALTO
+_CLASE_DE[ord("A"):ord("Z") + 1] = LETRA
+_CLASE_DE[ord("a"):ord("z") + 1] = LETRA
+_CLASE_DE[ord("0"):ord("9") + 1] = DIGITO
+
+
+def _rangos(*pares):
+    return frozenset(chr(c) for a, b in pares for c in range(ord(a), ord(b) + 1))
+
+
+# Caracteres que pueden seguir a cada lexema (los lookahead de lexer._MAESTRO);
+# '\n' representa también el fin del texto
+_SIG_DELIM = frozenset(' \t\r;[],:(){}+-*/%=!&|<>".\n')
+_SIG_NUM = _rangos("\t\t", "\r\r", " -", "//", ":@", "[`", "{~", "\n\n")
+_SIG_PAL = _rangos("\t\t", "\r\r", " @", "[`", "{~", "\n\n")
+_SIG_SIGNO = _rangos("\t\t", "\r\r", " -", "//", ":~", "\n\n")
+
+
+def corridas(texto):
+    """(inicios, clases) de las corridas de texto; inicios termina con len(texto)."""
+    cp = np.frombuffer(texto.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    clase = _CLASE_DE[np.minimum(cp, 128)]
+    cambio = np.empty(len(clase), dtype=bool)
+    cambio[0] = True
+    np.not_equal(clase[1:], clase[:-1], out=cambio[1:])
+    cambio |= clase == RESTO
+    inicios = np.flatnonzero(cambio)
+    clases = clase[inicios].tolist()
+    inicios = inicios.tolist()
+    inicios.append(len(texto))
+    return inicios, clases
+
+
+def _scan_texto_numpy(texto, primera_linea, tokens, errores):
+    """Motor vectorizado: corridas con NumPy, un paso de Python por token."""
+    if _SALTOS_RAROS.search(texto):
+        # Normalizar a '\n' conservando exactamente las líneas de splitlines()
+        texto = "\n".join(texto.splitlines())
+    n = len(texto)
+    if not n:
+        return
+    inicios, clases = corridas(texto)
+    texto_fin = texto + "\n"    # texto_fin[n] es el "fin del texto"
+
+    agregar = tokens.append
+    fijos = _FIJOS.get
+    categorias = _CATEGORIA.get
+    trie = _TRIE_SIMBOLOS
+    num_linea = primera_linea
+    ini = 0     # inicio de la línea actual
+    fin_de = -1     # `ini` de la línea cuyo fin está en fin_linea
+    linea_de = -1   # `ini` de la línea ya recortada en `linea`
+    pos = 0
+    r = 0       # corrida que contiene pos
+    while pos < n:
+        while inicios[r + 1] <= pos:
+            r += 1
+        fin = inicios[r + 1]
+        c = clases[r]
+        col = pos - ini + 1
+
+        if pos == inicios[r]:
+            if c == ESPACIO:
+                pos = fin
+                continue
+            if c == SALTO:
+                num_linea += fin - pos
+                pos = ini = fin
+                continue
+
+            if c == LETRA:
+                if texto_fin[fin] in _SIG_PAL:
+                    lex = texto[pos:fin]
+                    fijo = fijos(lex)
+                    if fijo is not None:
+                        agregar(Token(fijo[0], fijo[1], num_linea, col))
+                    else:
+                        errores.append(ErrorLexico(lex, "Palabra no reconocida", num_linea, col))
+                    pos = fin
+                    continue
+
+            elif c == DIGITO:
+                fin, real = _fin_numero(texto_fin, inicios, clases, r)
+                if fin > 0:
+                    pos = _numero(texto, pos, fin, real, num_linea, col, agregar)
+                    continue
+
+            else:
+                ch = texto[pos]
+                cat = categorias(ch)
+                sig = texto_fin[pos + 1]
+                if cat == CAT_OPERADOR or cat == CAT_BARRA:
+                    if sig == "/" and ch == "/":
+                        # Comentario hasta el fin de la línea
+                        pos = texto.find("\n", pos)
+                        if pos < 0:
+                            pos = n
+                        continue
+                    # Operadores y especiales: el más largo según el trie; solo
+                    # se recorre si el siguiente carácter puede alargarlo
+                    nodo = trie[ch]
+                    fijo = simbolo(texto, pos) if sig in nodo else nodo.get(None)
+                    if fijo is not None:
+                        agregar(Token(fijo[0], fijo[1], num_linea, col))
+                        pos += len(fijo[0])
+                        continue
+                elif cat == CAT_SIGNO:
+                    fijo = simbolo(texto, pos)
+                    if len(fijo[0]) > 1 or sig in _SIG_SIGNO:
+                        agregar(Token(fijo[0], fijo[1], num_linea, col))
+                        pos += len(fijo[0])
+                        continue
+                    # Signo pegado a un número: [+-] [0-9]* \.? [0-9]+
+                    fin, real = _fin_numero(texto_fin, inicios, clases, r + 1)
+                    if fin > 0:
+                        pos = _numero(texto, pos, fin, real, num_linea, col, agregar)
+                        continue
+                elif cat == CAT_PUNTO:
+                    fin, real = _fin_numero(texto_fin, inicios, clases, r)
+                    if fin > 0:
+                        pos = _numero(texto, pos, fin, real, num_linea, col, agregar)
+                        continue
+                    if sig in _SIG_SIGNO:
+                        pos += 1    # punto suelto
+                        continue
+                elif cat == CAT_PREFIJO:
+                    if ch == "&" and sig == "&" or ch == "%" and sig in _SIG_DELIM:
+                        fijo = simbolo(texto, pos)
+                        agregar(Token(fijo[0], fijo[1], num_linea, col))
+                        pos += len(fijo[0])
+                        continue
+                    # Prefijo + 1 a 7 letras + delimitador
+                    if r + 1 < len(clases) and clases[r + 1] == LETRA:
+                        fin = inicios[r + 2]
+                        if fin - pos <= 8 and texto_fin[fin] in _SIG_DELIM:
+                            agregar(Token(internar(texto[pos:fin]), _COD_IDENT[ch], num_linea, col))
+                            pos = fin
+                            continue
+                elif cat == CAT_COMILLA:
+                    if fin_de != ini:
+                        fin_linea = texto.find("\n", pos)
+                        if fin_linea < 0:
+                            fin_linea = n
+                        fin_de = ini
+                    cierre = texto.find('"', pos + 1, fin_linea)
+                    if cierre >= 0:
+                        agregar(Token(texto[pos:cierre + 1], _COD_STRING, num_linea, col))
+                        pos = cierre + 1
+                        continue
+
+        # Caso raro o error (o una posición a media corrida tras un caso
+        # raro) → delegar en el motor clásico. El fin de la línea se busca y
+        # la línea se recorta una sola vez por línea, no en cada caso raro
+        if fin_de != ini:
+            fin_linea = texto.find("\n", pos)
+            if fin_linea < 0:
+                fin_linea = n
+            fin_de = ini
+        if linea_de != ini:
+            linea = texto[ini:fin_linea]
+            linea_de = ini
+        j = _paso_clasico(linea, pos - ini, num_linea, tokens, errores)
+        pos = fin_linea if j < 0 else ini + j
+
+
+def _fin_numero(texto_fin, inicios, clases, k):
+    """
+    Fin del número [0-9]* \\.? [0-9]+ que empieza en la corrida k y si es
+    real; fin = -1 si no hay número o no lo sigue un carácter de _SIG_NUM.
+    """
+    total = len(clases)
+    if k >= total:
+        return -1, False
+    digitos = clases[k] == DIGITO
+    if digitos:
+        k += 1
+    fin = inicios[k]
+    real = texto_fin[fin] == "."
+    if real:
+        # '.' es una corrida propia; la siguiente deben ser dígitos
+        if k + 1 < total and clases[k + 1] == DIGITO:
+            fin = inicios[k + 2]
+        else:
+            return -1, False
+    elif not digitos:
+        return -1, False
+    if texto_fin[fin] not in _SIG_NUM:
+        return -1, False
+    return fin, real
+
+
+def _numero(texto, pos, fin, real, num_linea, col, agregar):
+    lex = texto[pos:fin]
+    if real:
+        cod = _COD_REAL
+    else:
+        val = int(lex)
+        cod = _COD_REAL if val < -32768 or val > 32767 else _COD_ENTERA
+    agregar(Token(internar(lex), cod, num_linea, col))
+    return fin
@@ -0,0 +1,107 @@
+# lote.py
+# Análisis por lotes: muchos archivos fuente repartidos entre procesos.
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from analizador import exportar
+from cache import analizar_con_cache
+
+# Archivos que se toman al recibir un directorio
+PATRON_DEFAULT = "*.txt"
+
+
+def expandir_entradas(entradas, patron=PATRON_DEFAULT):
+    """
+    Convierte directorios, patrones glob y rutas de archivo en una lista
+    ordenada y sin repetidos de archivos a analizar.
+    """
+    rutas = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            rutas.extend(glob.glob(os.path.join(entrada, "**", patron), recursive=True))
+        elif glob.has_magic(entrada):
+            rutas.extend(glob.glob(entrada, recursive=True))
+        else:
+            rutas.append(entrada)
+    vistas = set()
+    unicas = []
+    for ruta in sorted(rutas):
+        clave = os.path.normpath(ruta)
+        if clave not in vistas and os.path.isfile(ruta):
+            vistas.add(clave)
+            unicas.append(ruta)
+    return unicas
+
+
+def carpeta_salida(ruta, dir_salida):
+    """
+    Carpeta propia de cada fuente dentro de dir_salida, con la extensión en
+    el nombre (p. ej. salida/ejemplos/prueba1.txt/): a.txt y a.md no se
+    pisan. Se quitan la unidad, la raíz y los '..' de la ruta, así que la
+    carpeta nunca queda fuera de dir_salida.
+    """
+    relativa = os.path.splitdrive(os.path.normpath(ruta))[1]
+    partes = [p for p in relativa.split(os.sep) if p not in ("", os.curdir, os.pardir)]
+    carpeta = os.path.join(dir_salida, *partes)
+    base = os.path.abspath(dir_salida)
+    if not partes or os.path.commonpath([base, os.path.abspath(carpeta)]) != base:
+        raise ValueError(f"Ruta de salida fuera de {dir_salida}: {ruta}")
+    return carpeta
+
+
+def analizar_ruta(ruta, dir_salida=None, motor="regex", usar_cache=True):
+    """
+    Trabajo de un proceso: analiza un archivo y devuelve un resumen
+    serializable. Si hay dir_salida, escribe ahí sus propias tablas. Un
+    archivo que falla (lectura, análisis o escritura) da {"archivo", "error"}
+    y no detiene el resto del lote.
+    """
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            codigo = f.read()
+        res = analizar_con_cache(codigo, None if usar_cache else False, motor=motor)
+
+        if dir_salida:
+            carpeta = carpeta_salida(ruta, dir_salida)
+            os.makedirs(carpeta, exist_ok=True)
+            exportar(res,
+                     os.path.join(carpeta, "Tokens.txt"),
+                     os.path.join(carpeta, "Errores.txt"),
+                     os.path.join(carpeta, "Errores_Sintácticos.txt"))
+    except (OSError, UnicodeDecodeError) as e:
+        return {"archivo": ruta, "error": str(e)}
+    except Exception as e:
+        return {"archivo": ruta, "error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "archivo": ruta,
+        "tokens": len(res.tokens),
+        "errores_lexicos": [[e.lexema, e.descripcion, e.linea, e.columna]
+                            for e in res.errores_lexicos],
+        "errores_sintacticos": res.errores_sintacticos,
+    }
+
+
+def analizar_lote(rutas, trabajadores=None, tam_lote=8, dir_salida=None, motor="regex",
+                  usar_cache=True):
+    """
+    Reparte los archivos entre `trabajadores` procesos, enviándolos en
+    grupos de `tam_lote` para amortizar la comunicación. Produce los
+    resúmenes en el mismo orden que `rutas`.
+    """
+    trabajo = partial(analizar_ruta, dir_salida=dir_salida, motor=motor, usar_cache=usar_cache)
+    if trabajadores == 1:
+        # Sin procesos extra (útil para depurar)
+        yield from map(trabajo, rutas)
+        return
+    with ProcessPoolExecutor(max_workers=trabajadores) as ex:
+        yield from ex.map(trabajo, rutas, chunksize=max(1, tam_lote))
+
+
+def escribir_reporte_lote(resumenes, ruta):
+    """Reporte agregado de todo el lote en un solo archivo JSON."""
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump({"archivos": resumenes}, f, ensure_ascii=False, indent=1)
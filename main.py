@@ -1,39 +1,176 @@
 # main.py
-from lexer import scan
-import sys
+from analizador import Resultado
+from lexer import iter_scan, ErrorLexico
+from tabla_binaria import EscritorTablaBinaria, escribir_tabla_binaria
+from tablas import EscritorTablas, escribir_tablas, escribir_tabla_errores
+import argparse
+import contextlib
+import os
 
+# Fuentes más grandes que esto se analizan por bloques, sin caché
+MAX_FUENTE_CACHE = 32 * 1024 * 1024
 
-def main():
-    # Default file if no argument provided
-    if len(sys.argv) > 1:
-        ruta_fuente = sys.argv[1]
-    else:
-        ruta_fuente = "ejemplos/prueba5.txt"
-        
-    with open(ruta_fuente, "r", encoding="utf-8") as f:
-        codigo = f.read()
-
-    tokens, errores = scan(codigo)
-
-    # Tabla de tokens: Lexema, Token (código), Línea
-    with open("Tokens.txt", "w", encoding="utf-8") as f:
-        f.write(f"{'Lexema':<25}{'Token':<15}{'PTS':<10}{'Línea':<10}\n")
-        for t in tokens:
-            # Identificar si es un identificador (según el código de token)
-            if t.codigo in [-55, -56, -57, -58]:
-                pts = -2
-            else:
-                pts = -1
-            f.write(f"{t.lexema:<25}{t.codigo:<15}{pts:<10}{t.linea:<10}\n")
-
-    # Tabla de errores: Lexema, Descripción breve, Línea
-    with open("Errores.txt", "w", encoding="utf-8") as f:
-        f.write(f"{'Lexema':<25}{'Descripción':<80}{'Línea':<10}\n")
-        for e in errores:
-            f.write(f"{e.lexema:<25}{e.descripcion:<80}{e.linea:<10}\n")
 
+def analizar_archivo(ruta_fuente, usar_cache=True, formato="texto", paralelo=False, trabajadores=None):
+    # formato de la tabla de tokens: "texto" (Tokens.txt), "binario"
+    # (Tokens.bin, ver tabla_binaria.py) o "ambos"
+    texto = formato in ("texto", "ambos")
+    binario = formato in ("binario", "ambos")
+
+    if paralelo:
+        # Un solo archivo grande repartido por rangos de líneas entre procesos
+        from paralelo import scan_paralelo
+        tokens, errores = scan_paralelo(ruta_fuente, trabajadores)
+        if texto:
+            escribir_tablas(tokens, errores)
+        else:
+            escribir_tabla_errores(errores)
+        if binario:
+            escribir_tabla_binaria(tokens, "Tokens.bin")
+        print("Análisis léxico completado.")
+        return
+
+    cache = clave = None
+    if usar_cache and os.path.getsize(ruta_fuente) <= MAX_FUENTE_CACHE:
+        import cache as modulo_cache
+        if not modulo_cache.DESACTIVADA:
+            # Solo el léxico: el parser no tiene nada que ver con estas tablas.
+            # La clave se calcula leyendo por bloques, sin cargar el archivo.
+            cache = modulo_cache.CacheResultados()
+            with open(ruta_fuente, "r", encoding="utf-8") as f:
+                clave = modulo_cache.clave_archivo(f, "lexico")
+            res = None
+            if cache.contiene(clave):
+                # Los lexemas guardados son posiciones en el fuente: hace falta el texto
+                with open(ruta_fuente, "r", encoding="utf-8") as f:
+                    res = cache.obtener(f.read(), "lexico")
+            if res is not None:
+                if texto:
+                    escribir_tablas(res.tokens, res.errores_lexicos)
+                else:
+                    escribir_tabla_errores(res.errores_lexicos)
+                if binario:
+                    escribir_tabla_binaria(res.tokens, "Tokens.bin")
+                print("Análisis léxico completado.")
+                return
+
+    # Se lee el fuente por bloques y cada token/error se escribe en su tabla
+    # conforme se produce: la memoria no crece con el tamaño del archivo.
+    # Solo si hay que llenar la caché se juntan los tokens (el archivo no
+    # pasa de MAX_FUENTE_CACHE), y se vuelve a calcular la clave sobre lo que
+    # realmente se analizó por si el archivo cambió entre las dos lecturas.
+    tokens, errores, lineas = [], [], []
+    with contextlib.ExitStack() as pila:
+        fuente = pila.enter_context(open(ruta_fuente, "r", encoding="utf-8"))
+        tablas = pila.enter_context(EscritorTablas("Tokens.txt" if texto else None, "Errores.txt"))
+        f_bin = pila.enter_context(EscritorTablaBinaria("Tokens.bin")) if binario else None
+        if cache:
+            leida = modulo_cache.ClaveIncremental("lexico")
+            fuente = _con_clave(fuente, leida, lineas)
+
+        for t in iter_scan(fuente):
+            if isinstance(t, ErrorLexico):
+                tablas.agregar_error(t)
+                if cache:
+                    errores.append(t)
+                continue
+            if f_bin:
+                f_bin.agregar_token(t)
+            tablas.agregar_token(t)
+            if cache:
+                tokens.append(t)
+
+    if cache and leida.valor() == clave:
+        cache.guardar_clave(clave, Resultado(tokens, errores), "".join(lineas))
     print("Análisis léxico completado.")
 
 
+def _con_clave(lineas, clave, leidas):
+    """Deja pasar las líneas actualizando la ClaveIncremental `clave` y guardándolas en `leidas`."""
+    for linea in lineas:
+        clave.actualizar(linea)
+        leidas.append(linea)
+        yield linea
+
+
+def main_lote(args):
+    from lote import expandir_entradas, analizar_lote, escribir_reporte_lote
+
+    rutas = expandir_entradas(args.fuentes)
+    if not rutas:
+        print("No se encontraron archivos fuente.")
+        return
+    if not args.salida and not args.reporte:
+        args.salida = "salida"
+
+    resumenes = []
+    for r in analizar_lote(rutas, args.trabajadores, args.tam_lote, args.salida,
+                           usar_cache=not args.sin_cache):
+        resumenes.append(r)
+        if "error" in r:
+            print(f"{r['archivo']}: ERROR {r['error']}")
+        else:
+            print(f"{r['archivo']}: {r['tokens']} tokens, "
+                  f"{len(r['errores_lexicos'])} errores léxicos, "
+                  f"{len(r['errores_sintacticos'])} errores sintácticos")
+
+    if args.reporte:
+        escribir_reporte_lote(resumenes, args.reporte)
+    print(f"\nLote completado: {len(resumenes)} archivo(s).")
+
+
+def main_vigilar(args):
+    from vigilar import Vigilante
+
+    entradas = args.fuentes or ["ejemplos"]
+    # Un solo archivo y sin --salida: las tablas de siempre en el directorio actual
+    un_archivo = len(entradas) == 1 and os.path.isfile(entradas[0])
+    vigilante = Vigilante(entradas, intervalo=args.intervalo, espera=args.espera,
+                          dir_salida=args.salida, tablas_locales=un_archivo and not args.salida)
+    try:
+        vigilante.ejecutar()
+    except KeyboardInterrupt:
+        print("\nVigilancia terminada.")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Analizador léxico")
+    ap.add_argument("fuentes", nargs="*",
+                    help="Archivo fuente (o, con --lote/--watch, directorios/globs)")
+    ap.add_argument("--lote", action="store_true",
+                    help="Analiza (léxico + sintáctico) todos los archivos en paralelo")
+    ap.add_argument("--paralelo", action="store_true",
+                    help="Analiza un archivo grande repartiéndolo por líneas entre procesos")
+    ap.add_argument("--watch", action="store_true",
+                    help="Vigila los fuentes (default 'ejemplos') y re-analiza los que cambian")
+    ap.add_argument("--intervalo", type=float, default=0.5,
+                    help="Segundos entre revisiones con --watch (default 0.5)")
+    ap.add_argument("--espera", type=float, default=0.3,
+                    help="Segundos sin cambios antes de re-analizar con --watch (default 0.3)")
+    ap.add_argument("--trabajadores", type=int, default=None,
+                    help="Procesos para --lote o --paralelo (por defecto, uno por núcleo)")
+    ap.add_argument("--tam-lote", type=int, default=8,
+                    help="Archivos enviados a cada proceso por tarea (default 8)")
+    ap.add_argument("--salida", help="Directorio para las tablas de cada archivo (default 'salida')")
+    ap.add_argument("--reporte", help="Archivo JSON con el reporte agregado del lote")
+    ap.add_argument("--formato", choices=("texto", "binario", "ambos"), default="texto",
+                    help="Tabla de tokens: Tokens.txt, Tokens.bin o ambas (default texto)")
+    ap.add_argument("--sin-cache", action="store_true",
+                    help="No consultar ni llenar la caché de resultados")
+    args = ap.parse_args()
+
+    if args.lote:
+        main_lote(args)
+        return
+    if args.watch:
+        main_vigilar(args)
+        return
+
+    # Default file if no argument provided
+    ruta_fuente = args.fuentes[0] if args.fuentes else "ejemplos/prueba5.txt"
+    analizar_archivo(ruta_fuente, usar_cache=not args.sin_cache, formato=args.formato,
+                     paralelo=args.paralelo, trabajadores=args.trabajadores)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,172 @@
+# paralelo.py
+# Análisis léxico en paralelo de UN archivo grande. scan() no guarda estado
+# entre líneas, así que el archivo (abierto con mmap) se parte en fragmentos
+# que terminan justo después de un '\n' y cada fragmento se analiza en otro
+# proceso, con su número de línea inicial. Las columnas de tokens y los
+# errores de cada fragmento se concatenan en orden: el resultado es idéntico
+# al de scan() sobre el archivo completo.
+#
+# Se hace en dos pasadas, ambas en paralelo:
+#   1. cada proceso cuenta las líneas de su fragmento (da la línea inicial
+#      de los siguientes),
+#   2. cada proceso analiza su fragmento y devuelve columnas (no objetos
+#      Token, que costaría serializarlos uno por uno); los lexemas viajan
+#      como posiciones en el fragmento y el proceso principal las traslada
+#      al archivo completo, que decodifica una sola vez.
+import mmap
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer import MOTORES, ErrorLexico
+from token_stream import TokenStream
+
+FRAGMENTOS_POR_TRABAJADOR = 4    # más fragmentos que procesos: reparte mejor la carga
+MIN_FRAGMENTO = 1 << 20          # bytes; no se parte por debajo de esto
+
+# Saltos de línea que splitlines() (y por lo tanto scan) cuenta además de '\n'
+_SALTOS_RAROS = re.compile(rb"[\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+
+def fragmentos(datos, n):
+    """Parte datos (bytes o mmap) en hasta n rangos [inicio, fin) que terminan tras un '\\n'."""
+    tam = len(datos)
+    rangos = []
+    inicio = 0
+    for k in range(1, n):
+        objetivo = tam * k // n
+        if objetivo <= inicio:
+            continue
+        fin = datos.find(b"\n", objetivo - 1) + 1
+        if not fin:
+            break   # no hay más saltos de línea: el resto es un solo fragmento
+        rangos.append((inicio, fin))
+        inicio = fin
+    if inicio < tam:
+        rangos.append((inicio, tam))
+    return rangos
+
+
+def _leer(ruta, inicio, fin):
+    with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm[inicio:fin]
+
+
+def _contar_lineas(ruta, inicio, fin):
+    """Líneas (según splitlines) de un fragmento que termina en '\\n'."""
+    datos = _leer(ruta, inicio, fin)
+    if _SALTOS_RAROS.search(datos):
+        return len(datos.decode("utf-8").splitlines())
+    return datos.count(b"\n")
+
+
+def _analizar_fragmento(ruta, inicio, fin, primera_linea, motor):
+    texto = _leer(ruta, inicio, fin).decode("utf-8")
+    tokens, errores = [], []
+    MOTORES[motor](texto, primera_linea, tokens, errores)
+    stream = TokenStream.desde_tokens(tokens, texto, primera_linea)
+    return (
+        len(texto),
+        stream.codigos,
+        stream.lineas,
+        stream.columnas,
+        stream.inicios,
+        stream.longitudes,
+        [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores],
+    )
+
+
+def scan_paralelo(ruta, trabajadores=None, motor="regex"):
+    """
+    scan() del archivo `ruta` repartido entre `trabajadores` procesos (por
+    defecto, uno por núcleo). Devuelve (tokens, errores) con los tokens en
+    columnas (token_stream.TokenStream) y los errores como lexer.ErrorLexico.
+    """
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de análisis léxico desconocido: {motor!r}")
+    trabajadores = trabajadores or os.cpu_count() or 1
+    tam = os.path.getsize(ruta)
+
+    rangos = []
+    if tam:
+        n = max(1, min(trabajadores * FRAGMENTOS_POR_TRABAJADOR, tam // MIN_FRAGMENTO))
+        with open(ruta, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rangos = fragmentos(mm, n)
+
+    if trabajadores == 1 or len(rangos) <= 1:
+        return _unir(ruta, _analizar(map, ruta, rangos, motor))
+    with ProcessPoolExecutor(max_workers=min(trabajadores, len(rangos))) as ex:
+        return _unir(ruta, _analizar(ex.map, ruta, rangos, motor))
+
+
+def _analizar(mapa, ruta, rangos, motor):
+    # Línea inicial de cada fragmento: 1 + líneas de los anteriores (el
+    # último fragmento no hace falta contarlo)
+    previos = rangos[:-1]
+    conteos = mapa(_contar_lineas, [ruta] * len(previos), [a for a, _ in previos], [b for _, b in previos])
+    primeras = [1]
+    for c in conteos:
+        primeras.append(primeras[-1] + c)
+    n = len(rangos)
+    return mapa(_analizar_fragmento, [ruta] * n, [a for a, _ in rangos], [b for _, b in rangos],
+                primeras, [motor] * n)
+
+
+def _unir(ruta, resultados):
+    # newline="": el mismo texto que decodificó cada fragmento, sin traducir saltos
+    with open(ruta, "r", encoding="utf-8", newline="") as f:
+        tokens = TokenStream(f.read())
+    errores = []
+    base = 0    # inicio del fragmento, en caracteres
+    for tam, cd, ln, cl, ini, lon, er in resultados:
+        tokens.codigos.extend(cd)
+        tokens.lineas.extend(ln)
+        tokens.columnas.extend(cl)
+        tokens.inicios.extend([base + a for a in ini] if base else ini)
+        tokens.longitudes.extend(lon)
+        errores.extend(ErrorLexico(*e) for e in er)
+        base += tam
+    return tokens, errores
+
+
+def main():
+    import argparse
+    from lexer import scan
+
+    ap = argparse.ArgumentParser(description="Análisis léxico en paralelo de un archivo grande")
+    ap.add_argument("fuente")
+    ap.add_argument("--trabajadores", type=int, default=None,
+                    help="Procesos (por defecto, uno por núcleo)")
+    ap.add_argument("--motor", default="regex", choices=sorted(MOTORES))
+    ap.add_argument("--comparar", action="store_true",
+                    help="Medir también scan() en serie y verificar que la salida sea idéntica")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    tokens, errores = scan_paralelo(args.fuente, args.trabajadores, args.motor)
+    paralelo = time.perf_counter() - t0
+    print(f"Paralelo: {len(tokens)} tokens, {len(errores)} errores en {paralelo:.2f} s")
+
+    if args.comparar:
+        t0 = time.perf_counter()
+        with open(args.fuente, "r", encoding="utf-8") as f:
+            serie_tokens, serie_errores = scan(f.read(), motor=args.motor)
+        serie = time.perf_counter() - t0
+        identico = (
+            list(tokens.lexemas()) == [t.lexema for t in serie_tokens]
+            and list(tokens.codigos) == [t.codigo for t in serie_tokens]
+            and list(tokens.lineas) == [t.linea for t in serie_tokens]
+            and list(tokens.columnas) == [t.columna for t in serie_tokens]
+            and [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores]
+            == [(e.lexema, e.descripcion, e.linea, e.columna) for e in serie_errores]
+        )
+        print(f"Serie:    {len(serie_tokens)} tokens en {serie:.2f} s "
+              f"({serie / paralelo:.2f}x) — {'idéntico' if identico else 'DIFERENTE'}")
+        if not identico:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
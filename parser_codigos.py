@@ -0,0 +1,439 @@
+# parser_codigos.py
+# Parser que trabaja sobre los códigos enteros de TokenCodes.MAP en lugar de
+# comparar lexemas y nombres de tipo. Los conjuntos PRIMEROS/SIGUIENTES de
+# cada producción se precalculan como frozensets de enteros; los lexemas solo
+# se consultan para armar los mensajes de error (idénticos a los de Parser).
+from sintactic import Parser, Token, TOKEN_MAP, SINCRONIZACION, MAX_ERRORES
+from token_type import TokenCodes
+
+C = TokenCodes.MAP
+
+EOF = 0           # código del token de fin de archivo
+DESCONOCIDO = 1   # tipo sin código conocido (p. ej. DESCONOCIDO_n de una tabla)
+
+_CODIGO_DE_TIPO = {tipo: codigo for codigo, tipo in TOKEN_MAP.items()}
+
+# Clases de tokens
+IDS = frozenset((C["@identificador"], C["$identificador"], C["&identificador"], C["%identificador"]))
+CTES = frozenset((C["constante_entera"], C["constante_real"], C["constante_string"]))
+OP_ARIT = frozenset(C[op] for op in ("+", "-", "*", "/", "%", "++", "--", "+=", "-=", "/=", "*="))
+OP_REL = frozenset(C[op] for op in ("<", "<=", ">", ">=", "==", "!="))
+OP_LOG = frozenset((C["&&"], C["||"]))
+OP_ASIG = frozenset(C[op] for op in ("=", "+=", "-=", "*=", "/="))
+INC_DEC = frozenset((C["++"], C["--"]))
+TIPOS_RETORNO = frozenset(C[t] for t in ("entero", "real", "cadena", "vacio"))
+
+# PRIMEROS de cada producción
+PRIMEROS = {
+    "ESTATUTO": IDS | frozenset(C[p] for p in ("leer", "escribir", "si", "mientras", "repite",
+                                               "switch", "ejecutar", "salir", "regresar")),
+    "OPERANDO": IDS | CTES | {C["("]},
+    "VAR": frozenset((C["var"],)),
+    "METODO": frozenset((C["metodo"],)),
+}
+PRIMEROS["EXP_ARIT"] = PRIMEROS["OPERANDO"]
+PRIMEROS["CONDICION"] = PRIMEROS["EXP_ARIT"] | {C["!"]}
+
+# SIGUIENTES usados para sincronizar en modo pánico
+SIGUIENTES = {
+    "ESTATUTO": frozenset((C[";"], C["}"])),
+}
+
+# Recuperación al final de cada producción: (terminador, siguientes) como en
+# sintactic.SINCRONIZACION
+SINCRONIZACION_COD = {prod: (C[terminador], frozenset(C[s] for s in siguientes))
+                      for prod, (terminador, siguientes) in SINCRONIZACION.items()}
+
+PUNTOYCOMA, COMA, DOS_PUNTOS = C[";"], C[","], C[":"]
+PAR_AP, PAR_CI, COR_AP, COR_CI, LLAVE_AP, LLAVE_CI = C["("], C[")"], C["["], C["]"], C["{"], C["}"]
+NOT, IGUAL = C["!"], C["="]
+ID_ARROBA, ID_AMP, CTE_ENT = C["@identificador"], C["&identificador"], C["constante_entera"]
+
+
+class ParserCodigos(Parser):
+    """
+    Mismo análisis y mismos mensajes que Parser, pero sobre códigos enteros.
+    Acepta lexer.Token (con .codigo), un token_stream.TokenStream o los
+    Token del parser (tipo en texto, p. ej. desde cargar_tokens_desde_tabla).
+    """
+
+    def __init__(self, tokens, max_errores=MAX_ERRORES):
+        if hasattr(tokens, "codigos"):
+            # token_stream.TokenStream (o TablaBinaria): se indexa su arreglo
+            # de códigos tal cual, sin copiarlo ni crear objetos
+            stream = tokens
+            self.codigos = stream.codigos
+            self._lexema = stream.lexema
+            self._linea = stream.lineas.__getitem__
+        else:
+            self.codigos = [t.codigo if hasattr(t, "codigo")
+                            else _CODIGO_DE_TIPO.get(t.type, DESCONOCIDO) for t in tokens]
+            self._lexema = lambda i: tokens[i].lexema if hasattr(tokens[i], "lexema") else tokens[i].lexeme
+            self._linea = lambda i: tokens[i].linea if hasattr(tokens[i], "linea") else tokens[i].line
+        self.n = len(self.codigos)      # posición del EOF (fuera del arreglo)
+        self.pos = 0
+        self.cod = self.codigos[0] if self.n else EOF
+        self.errores = []
+        self.en_panico = False
+        self.descartando = False
+        self.pos_error = -1
+        self.max_errores = max_errores
+
+    @property
+    def current(self):
+        """Token actual como en Parser (solo para consultas, no en el camino caliente)."""
+        if self.pos == self.n:
+            return Token("EOF", "EOF", -1)
+        return Token(TOKEN_MAP.get(self.cod, "DESCONOCIDO"), self._lexema(self.pos), self._linea(self.pos))
+
+    def advance(self):
+        if self.pos < self.n:
+            self.pos += 1
+            self.cod = self.codigos[self.pos] if self.pos < self.n else EOF
+
+    def consume_cod(self, cod, msg="Error de sintaxis"):
+        if self.cod == cod:
+            self.advance()
+            return True
+        self.reportar_error(msg)
+        return False
+
+    def reportar_error(self, msg):
+        if self.en_panico:
+            return
+        self.en_panico = True
+        if self.pos == self.pos_error:
+            return
+        self.pos_error = self.pos
+        if self.pos == self.n:
+            linea, lexema = -1, "EOF"
+        else:
+            linea, lexema = self._linea(self.pos), self._lexema(self.pos)
+        self.errores.append(f"[L{linea}] {msg} — encontrado '{lexema}'")
+        self.contar_error(linea)
+
+    def sincronizar_cod(self, sync):
+        self.en_panico = self.descartando = True
+        while self.cod not in sync and self.pos < self.n:
+            self.advance()
+        self.en_panico = self.descartando = False
+
+    def recuperar(self, produccion):
+        if not self.en_panico:
+            return
+        terminador, siguientes = SINCRONIZACION_COD[produccion]
+        if self.pos == 0 or self.codigos[self.pos - 1] != terminador:
+            self.descartando = True
+            while self.cod != terminador and self.cod not in siguientes and self.pos < self.n:
+                self.advance()
+            if self.cod == terminador:
+                self.advance()
+            self.descartando = False
+        self.en_panico = False
+
+    def es_inicio_estatuto(self):
+        return self.cod in PRIMEROS["ESTATUTO"]
+
+    # ============================================================
+    # PROGRAMA, VARIABLES Y METODOS
+    # ============================================================
+    def PROG(self):
+        self.consume_cod(C["clase"], "Se esperaba 'clase'")
+        self.consume_cod(ID_ARROBA, "Se esperaba identificador de clase (@id)")
+        self.consume_cod(LLAVE_AP, "Falta '{' después de clase")
+        self.recuperar("ENCABEZADO")
+
+        while self.cod in PRIMEROS["VAR"]:
+            self.VAR()
+
+        while self.cod in PRIMEROS["METODO"]:
+            self.METODO()
+
+        self.consume_cod(LLAVE_CI, "Falta '}' al final de la clase")
+
+    def VAR(self):
+        self.consume_cod(C["var"], "Se esperaba 'var'")
+        self.ID_ARREGLO(msg="Se esperaba identificador de variable")
+        while self.cod == COMA:
+            self.advance()
+            self.ID_ARREGLO(msg="Falta identificador después de ','")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de la declaración de variable")
+        self.recuperar("VAR")
+
+    def ID_ARREGLO(self, msg="Se esperaba identificador"):
+        if self.cod not in IDS:
+            self.reportar_error(msg)
+            return
+        self.advance()
+
+        if self.cod == COR_AP:
+            self.advance()
+            self.EXP_ARIT()
+            while self.cod == COMA:
+                self.advance()
+                self.EXP_ARIT()
+            self.consume_cod(COR_CI, "Falta ']' en índice de arreglo")
+
+    def METODO(self):
+        self.consume_cod(C["metodo"], "Se esperaba 'metodo'")
+
+        if self.cod in TIPOS_RETORNO:
+            self.advance()
+        else:
+            self.reportar_error("Tipo de retorno inválido, se esperaba 'entero', 'real', 'cadena' o 'vacio'")
+
+        self.consume_cod(ID_ARROBA, "Falta nombre del método (@id)")
+        self.consume_cod(PAR_AP, "Falta '(' en definición de método")
+
+        if self.cod != PAR_CI:
+            self.PARAM()
+
+        self.consume_cod(PAR_CI, "Falta ')' en definición de método")
+        self.consume_cod(LLAVE_AP, "Falta '{' en cuerpo del método")
+        self.recuperar("ENCABEZADO")
+
+        while self.cod in PRIMEROS["VAR"]:
+            self.VAR()
+
+        while self.cod in PRIMEROS["ESTATUTO"]:
+            self.ESTATUTO()
+
+        self.consume_cod(LLAVE_CI, "Falta '}' al final del método")
+        self.recuperar("METODO")
+
+    def PARAM(self):
+        self.ID_ARREGLO(msg="Se esperaba identificador de parámetro")
+        while self.cod == COMA:
+            self.advance()
+            self.ID_ARREGLO(msg="Se esperaba identificador de parámetro")
+
+    # ============================================================
+    # ESTATUTOS
+    # ============================================================
+    def ESTATUTO(self):
+        cod = self.cod
+        if cod in IDS:
+            self.ASIGNA()
+        elif cod == C["leer"]:
+            self.LEER()
+        elif cod == C["escribir"]:
+            self.ESCRIBIR()
+        elif cod == C["si"]:
+            self.SI()
+        elif cod == C["mientras"]:
+            self.MIENTRAS()
+        elif cod == C["repite"]:
+            self.REPITE()
+        elif cod == C["switch"]:
+            self.SWITCH()
+        elif cod == C["ejecutar"]:
+            self.EJECUTAR()
+        elif cod == C["salir"]:
+            self.SALIR()
+        elif cod == C["regresar"]:
+            self.REGRESAR()
+        else:
+            self.reportar_error("Estatuto no reconocido")
+            self.sincronizar_cod(SIGUIENTES["ESTATUTO"])
+        self.recuperar("ESTATUTO")
+
+    def ASIGNA(self):
+        self.ID_ARREGLO(msg="Se esperaba identificador en asignación")
+
+        if self.cod in OP_ASIG:
+            self.advance()
+            self.EXP_ARIT()
+            self.consume_cod(PUNTOYCOMA, "Falta ';' al final de la asignación")
+        elif self.cod in INC_DEC:
+            self.advance()
+            self.consume_cod(PUNTOYCOMA, "Falta ';' al final de la expresión")
+        else:
+            self.reportar_error("Falta operador de asignación (=, +=, -=, *=, /=, ++ o --)")
+
+    # ============================================================
+    # EXPRESIONES ARITMÉTICAS
+    # ============================================================
+    def EXP_ARIT(self):
+        self.OPERANDO()
+        while self.cod in OP_ARIT:
+            self.advance()
+            self.OPERANDO()
+
+    def OPERANDO(self):
+        cod = self.cod
+        if cod == PAR_AP:
+            self.advance()
+            self.EXP_ARIT()
+            self.consume_cod(PAR_CI, "Falta ')' en expresión")
+        elif cod in IDS:
+            if cod == ID_ARROBA and self.pos + 1 < self.n and self.codigos[self.pos + 1] == PAR_AP:
+                # Llamada a método
+                self.advance()
+                self.consume_cod(PAR_AP, "Falta '(' en llamada a método")
+                if self.cod != PAR_CI:
+                    self.EXP_ARIT()
+                    while self.cod == COMA:
+                        self.advance()
+                        self.EXP_ARIT()
+                self.consume_cod(PAR_CI, "Falta ')' en llamada a método")
+            else:
+                self.ID_ARREGLO()
+        elif cod in CTES:
+            self.advance()
+        else:
+            self.reportar_error("Se esperaba identificador, constante o '(' en expresión aritmética")
+
+    # ============================================================
+    # LEER Y ESCRIBIR
+    # ============================================================
+    def LEER(self):
+        self.consume_cod(C["leer"])
+        self.consume_cod(PAR_AP, "Falta '(' en 'leer'")
+        self.ID_ARREGLO(msg="Falta identificador válido en 'leer'")
+        self.consume_cod(PAR_CI, "Falta ')' en 'leer'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'leer'")
+
+    def ESCRIBIR(self):
+        self.consume_cod(C["escribir"])
+        self.consume_cod(PAR_AP, "Falta '(' en 'escribir'")
+        if self.cod != PAR_CI:
+            self.EXP_ARIT()
+            while self.cod == COMA:
+                self.advance()
+                self.EXP_ARIT()
+        self.consume_cod(PAR_CI, "Falta ')' en 'escribir'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'escribir'")
+
+    # ============================================================
+    # ESTRUCTURAS DE CONTROL
+    # ============================================================
+    def SI(self):
+        self.consume_cod(C["si"])
+        self.consume_cod(PAR_AP, "Falta '(' en 'si'")
+        self.CONDICION()
+        self.consume_cod(PAR_CI, "Falta ')' en 'si'")
+        self.consume_cod(LLAVE_AP, "Falta '{' en bloque 'si'")
+        self.recuperar("ENCABEZADO")
+        while self.cod in PRIMEROS["ESTATUTO"]:
+            self.ESTATUTO()
+        self.consume_cod(LLAVE_CI, "Falta '}' al final del bloque 'si'")
+
+        if self.cod == C["sino"]:
+            self.advance()
+            self.consume_cod(LLAVE_AP, "Falta '{' en bloque 'sino'")
+            self.recuperar("ENCABEZADO")
+            while self.cod in PRIMEROS["ESTATUTO"]:
+                self.ESTATUTO()
+            self.consume_cod(LLAVE_CI, "Falta '}' al final de bloque 'sino'")
+
+    def REPITE(self):
+        self.consume_cod(C["repite"])
+        self.consume_cod(LLAVE_AP, "Falta '{' en 'repite'")
+        self.recuperar("ENCABEZADO")
+        while self.cod in PRIMEROS["ESTATUTO"]:
+            self.ESTATUTO()
+        self.consume_cod(LLAVE_CI, "Falta '}' en 'repite'")
+        self.consume_cod(C["mientras"], "Falta 'mientras' después de 'repite'")
+        self.consume_cod(PAR_AP, "Falta '(' en condición de 'repite'")
+        self.CONDICION()
+        self.consume_cod(PAR_CI, "Falta ')' en condición de 'repite'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'repite'")
+
+    def MIENTRAS(self):
+        self.consume_cod(C["mientras"])
+        self.consume_cod(PAR_AP, "Falta '(' en 'mientras'")
+        self.CONDICION()
+        self.consume_cod(PAR_CI, "Falta ')' en 'mientras'")
+        self.consume_cod(LLAVE_AP, "Falta '{' en 'mientras'")
+        self.recuperar("ENCABEZADO")
+        while self.cod in PRIMEROS["ESTATUTO"]:
+            self.ESTATUTO()
+        self.consume_cod(LLAVE_CI, "Falta '}' al final de 'mientras'")
+
+    # ============================================================
+    # EJECUTAR Y SWITCH
+    # ============================================================
+    def EJECUTAR(self):
+        self.consume_cod(C["ejecutar"])
+        self.ID_ARREGLO(msg="Se esperaba identificador de variable destino en 'ejecutar'")
+        self.consume_cod(IGUAL, "Falta '=' en 'ejecutar'")
+        self.consume_cod(ID_ARROBA, "Falta nombre del método (@id) en 'ejecutar'")
+        self.consume_cod(PAR_AP, "Falta '(' en llamada a método")
+
+        if self.cod != PAR_CI:
+            self.EXP_ARIT()
+            while self.cod == COMA:
+                self.advance()
+                self.EXP_ARIT()
+
+        self.consume_cod(PAR_CI, "Falta ')' en llamada a método")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'ejecutar'")
+
+    def SWITCH(self):
+        self.consume_cod(C["switch"])
+        self.consume_cod(PAR_AP, "Falta '(' en 'switch'")
+        if self.cod != ID_AMP:
+            self.reportar_error("Se esperaba identificador con '&' en switch")
+        else:
+            self.advance()
+        self.consume_cod(PAR_CI, "Falta ')' en 'switch'")
+        self.consume_cod(LLAVE_AP, "Falta '{' en 'switch'")
+        self.recuperar("ENCABEZADO")
+
+        while self.cod == C["encaso"]:
+            self.advance()
+            if self.cod != CTE_ENT:
+                self.reportar_error("Se esperaba constante entera después de 'encaso'")
+            else:
+                self.advance()
+            self.consume_cod(DOS_PUNTOS, "Falta ':' después de 'encaso'")
+            self.recuperar("ENCASO")
+            while self.cod in PRIMEROS["ESTATUTO"]:
+                self.ESTATUTO()
+
+        # 'default' no es palabra reservada del lexer: nunca llega como token,
+        # así que la rama 'default' de Parser.SWITCH no tiene equivalente aquí.
+
+        self.consume_cod(LLAVE_CI, "Falta '}' al final de 'switch'")
+
+    # ============================================================
+    # CONDICIONES
+    # ============================================================
+    def CONDICION(self):
+        if self.cod == NOT:
+            self.advance()
+
+        self.EXP_ARIT()
+
+        if self.cod in OP_REL:
+            self.advance()
+        else:
+            self.reportar_error("Se esperaba operador relacional")
+
+        self.EXP_ARIT()
+
+        while self.cod in OP_LOG:
+            self.advance()
+            if self.cod == NOT:
+                self.advance()
+            self.EXP_ARIT()
+            if self.cod in OP_REL:
+                self.advance()
+            else:
+                self.reportar_error("Se esperaba operador relacional")
+            self.EXP_ARIT()
+
+    # ============================================================
+    # REGRESAR Y SALIR
+    # ============================================================
+    def REGRESAR(self):
+        self.consume_cod(C["regresar"])
+        self.consume_cod(PAR_AP, "Falta '(' en 'regresar'")
+        if self.cod != PAR_CI:
+            self.EXP_ARIT()
+        self.consume_cod(PAR_CI, "Falta ')' en 'regresar'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'regresar'")
+
+    def SALIR(self):
+        self.consume_cod(C["salir"])
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'salir'")
@@ -0,0 +1,191 @@
+# parser_iterativo.py
+# Variante del Parser sin recursión de Python: cada producción es un
+# generador y un ciclo con pila explícita las ejecuta. Los generadores están
+# en parser_iterativo_generado.py, que se genera a partir del código fuente
+# de Parser y ParserCodigos (transformando `self.PROD(...)` en
+# `yield ("PROD", args, kwargs)`), así que los mensajes de error y la
+# recuperación en modo pánico son exactamente los mismos. Al cambiar una
+# producción hay que regenerarlo:
+#
+#     python parser_iterativo.py --generar
+#
+# (tests/test_parser_iterativo.py falla si el archivo quedó desactualizado).
+import ast
+import builtins
+import inspect
+import os
+import textwrap
+
+from sintactic import Parser, AnalisisDetenido
+from parser_codigos import ParserCodigos
+from parser_iterativo_generado import ProduccionesParser, ProduccionesParserCodigos
+
+ARCHIVO_GENERADO = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "parser_iterativo_generado.py")
+
+
+class _PilaExplicita:
+    """Ejecución de producciones generadoras con una pila en lugar de recursión."""
+
+    def ejecutar(self, nombre, *args, **kwargs):
+        """Ejecuta la producción `nombre` hasta terminar, sin recursión."""
+        raiz = getattr(self, nombre)(*args, **kwargs)
+        if raiz is None:
+            return
+        pila = [raiz]
+        try:
+            while pila:
+                try:
+                    sub, sub_args, sub_kwargs = next(pila[-1])
+                except StopIteration:
+                    pila.pop()
+                    continue
+                gen = getattr(self, sub)(*sub_args, **sub_kwargs)
+                if gen is not None:
+                    pila.append(gen)
+        except BaseException:
+            # Cerrar las producciones en curso de adentro hacia afuera, como
+            # lo haría el desenrollado de la pila recursiva (sus `finally`)
+            while pila:
+                pila.pop().close()
+            raise
+
+    def parse(self, reporte=True):
+        try:
+            self.ejecutar("PROG")
+        except AnalisisDetenido:
+            pass
+        if reporte:
+            self.mostrar_reporte()
+        return self.errores
+
+
+class ParserIterativo(_PilaExplicita, ProduccionesParser, Parser):
+    """Parser con pila explícita (sin recursión)."""
+
+
+class ParserCodigosIterativo(_PilaExplicita, ProduccionesParserCodigos, ParserCodigos):
+    """ParserCodigos con pila explícita (sin recursión)."""
+
+
+# ================================================================
+# GENERACIÓN DE parser_iterativo_generado.py
+# ================================================================
+class _LlamadasAYield(ast.NodeTransformer):
+    """
+    Reemplaza cada estatuto `self.PROD(...)` por `yield ("PROD", (args), {kwargs})`.
+    El valor de una producción no llega al llamador en la pila explícita:
+    una llamada usada como expresión o un `return valor` es un error.
+    """
+
+    def __init__(self, producciones, nombre):
+        self.producciones = producciones
+        self.nombre = nombre
+        self.cambios = 0
+
+    def _es_produccion(self, node):
+        f = node.func
+        return (isinstance(f, ast.Attribute) and isinstance(f.value, ast.Name)
+                and f.value.id == "self" and f.attr in self.producciones)
+
+    def _error(self, node, motivo):
+        return ValueError(f"{self.nombre} (línea {node.lineno}): {motivo}; "
+                          "la variante iterativa no puede devolver valores entre producciones")
+
+    def visit_Expr(self, node):
+        if isinstance(node.value, ast.Call) and self._es_produccion(node.value):
+            llamada = node.value
+            for arg in llamada.args + [k.value for k in llamada.keywords]:
+                self.visit(arg)
+            self.cambios += 1
+            kwargs = ast.Dict(keys=[ast.Constant(k.arg) for k in llamada.keywords],
+                              values=[k.value for k in llamada.keywords])
+            valor = ast.Tuple(elts=[ast.Constant(llamada.func.attr),
+                                    ast.Tuple(elts=llamada.args, ctx=ast.Load()),
+                                    kwargs], ctx=ast.Load())
+            return ast.copy_location(ast.Expr(value=ast.Yield(value=valor)), node)
+        return self.generic_visit(node)
+
+    def visit_Call(self, node):
+        if self._es_produccion(node):
+            raise self._error(node, f"se usa el valor de self.{node.func.attr}()")
+        return self.generic_visit(node)
+
+    def visit_Return(self, node):
+        if node.value is not None:
+            raise self._error(node, "la producción devuelve un valor")
+        return node
+
+
+def _globales(funcion, espacio):
+    """Nombres globales del módulo que usa `funcion` (para importarlos)."""
+    locales = {a.arg for a in ast.walk(funcion.args) if isinstance(a, ast.arg)}
+    locales |= {n.id for n in ast.walk(funcion) if isinstance(n, ast.Name)
+                and isinstance(n.ctx, ast.Store)}
+    return {n.id for n in ast.walk(funcion) if isinstance(n, ast.Name)
+            and isinstance(n.ctx, ast.Load) and n.id not in locales
+            and n.id in espacio and not hasattr(builtins, n.id)}
+
+
+def _producciones_generadoras(cls):
+    """
+    (funciones, globales): las producciones de `cls` que llaman a otras,
+    transformadas en generadores, y los nombres del módulo que usan.
+    Las que no llaman a ninguna se quedan como están en `cls`.
+    """
+    espacio = vars(inspect.getmodule(cls))
+    funciones, globales = [], set()
+    for nombre in cls.PRODUCCIONES:
+        metodo = getattr(cls, nombre)
+        funcion = ast.parse(textwrap.dedent(inspect.getsource(metodo))).body[0]
+        transformador = _LlamadasAYield(cls.PRODUCCIONES, f"{cls.__name__}.{nombre}")
+        funcion = ast.fix_missing_locations(transformador.visit(funcion))
+        if not transformador.cambios:
+            continue
+        funcion.decorator_list = []
+        funciones.append(funcion)
+        globales |= _globales(funcion, espacio)
+    return funciones, globales
+
+
+def generar():
+    """Código fuente de parser_iterativo_generado.py."""
+    partes = [
+        "# parser_iterativo_generado.py\n"
+        "# GENERADO con `python parser_iterativo.py --generar` a partir de las\n"
+        "# producciones de sintactic.Parser y parser_codigos.ParserCodigos.\n"
+        "# No se edita a mano: ver parser_iterativo.py.\n"
+    ]
+    clases = []
+    importados = {}
+    for cls, mixin in ((Parser, "ProduccionesParser"), (ParserCodigos, "ProduccionesParserCodigos")):
+        funciones, globales = _producciones_generadoras(cls)
+        if globales:
+            importados.setdefault(cls.__module__, set()).update(globales)
+        cuerpo = [f'    """Producciones de {cls.__module__}.{cls.__name__} como generadores."""']
+        for funcion in funciones:
+            cuerpo.append("\n" + textwrap.indent(ast.unparse(funcion), "    "))
+        clases.append(f"\n\nclass {mixin}:\n" + "\n".join(cuerpo) + "\n")
+    for modulo, nombres in sorted(importados.items()):
+        lineas = textwrap.wrap(", ".join(sorted(nombres)), 88)
+        partes.append(f"from {modulo} import (\n" + "".join(f"    {l}\n" for l in lineas) + ")\n")
+    return "".join(partes + clases)
+
+
+def main():
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Parser iterativo (pila explícita)")
+    ap.add_argument("--generar", action="store_true",
+                    help=f"Regenerar {os.path.basename(ARCHIVO_GENERADO)} desde las producciones")
+    args = ap.parse_args()
+    if not args.generar:
+        ap.print_help()
+        return
+    with open(ARCHIVO_GENERADO, "w", encoding="utf-8") as f:
+        f.write(generar())
+    print(f"{ARCHIVO_GENERADO} regenerado.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+# parser_iterativo_generado.py
+# GENERADO con `python parser_iterativo.py --generar` a partir de las
+# producciones de sintactic.Parser y parser_codigos.ParserCodigos.
+# No se edita a mano: ver parser_iterativo.py.
+from parser_codigos import (
+    C, COMA, COR_AP, COR_CI, CTES, CTE_ENT, DOS_PUNTOS, IDS, ID_AMP, ID_ARROBA, IGUAL,
+    INC_DEC, LLAVE_AP, LLAVE_CI, NOT, OP_ARIT, OP_ASIG, OP_LOG, OP_REL, PAR_AP, PAR_CI,
+    PRIMEROS, PUNTOYCOMA, SIGUIENTES, TIPOS_RETORNO
+)
+
+
+class ProduccionesParser:
+    """Producciones de sintactic.Parser como generadores."""
+
+    def PROG(self):
+        self.consume(lex='clase', msg="Se esperaba 'clase'")
+        self.consume(type_='ID_ARROBA', msg='Se esperaba identificador de clase (@id)')
+        self.consume(lex='{', msg="Falta '{' después de clase")
+        self.recuperar('ENCABEZADO')
+        while self.check_lex('var'):
+            yield ('VAR', (), {})
+        while self.check_lex('metodo'):
+            yield ('METODO', (), {})
+        self.consume(lex='}', msg="Falta '}' al final de la clase")
+
+    def VAR(self):
+        self.consume(lex='var', msg="Se esperaba 'var'")
+        yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador de variable'})
+        while self.check_lex(','):
+            self.advance()
+            yield ('ID_ARREGLO', (), {'msg': "Falta identificador después de ','"})
+        self.consume(lex=';', msg="Falta ';' al final de la declaración de variable")
+        self.recuperar('VAR')
+
+    def ID_ARREGLO(self, msg='Se esperaba identificador'):
+        if not self.check_type(*self.ID_TYPES):
+            self.reportar_error(msg)
+            return
+        self.advance()
+        if self.check_lex('['):
+            self.advance()
+            yield ('EXP_ARIT', (), {})
+            while self.check_lex(','):
+                self.advance()
+                yield ('EXP_ARIT', (), {})
+            self.consume(lex=']', msg="Falta ']' en índice de arreglo")
+
+    def METODO(self):
+        self.consume(lex='metodo', msg="Se esperaba 'metodo'")
+        if self.check_lex('entero', 'real', 'cadena', 'vacio'):
+            self.advance()
+        else:
+            self.reportar_error("Tipo de retorno inválido, se esperaba 'entero', 'real', 'cadena' o 'vacio'")
+        self.consume(type_='ID_ARROBA', msg='Falta nombre del método (@id)')
+        self.consume(lex='(', msg="Falta '(' en definición de método")
+        if not self.check_lex(')'):
+            yield ('PARAM', (), {})
+        self.consume(lex=')', msg="Falta ')' en definición de método")
+        self.consume(lex='{', msg="Falta '{' en cuerpo del método")
+        self.recuperar('ENCABEZADO')
+        while self.check_lex('var'):
+            yield ('VAR', (), {})
+        while self.es_inicio_estatuto():
+            yield ('ESTATUTO', (), {})
+        self.consume(lex='}', msg="Falta '}' al final del método")
+        self.recuperar('METODO')
+
+    def PARAM(self):
+        yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador de parámetro'})
+        while self.check_lex(','):
+            self.advance()
+            yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador de parámetro'})
+
+    def ESTATUTO(self):
+        if self.check_type(*self.ID_TYPES):
+            yield ('ASIGNA', (), {})
+        elif self.check_lex('leer'):
+            yield ('LEER', (), {})
+        elif self.check_lex('escribir'):
+            yield ('ESCRIBIR', (), {})
+        elif self.check_lex('si'):
+            yield ('SI', (), {})
+        elif self.check_lex('mientras'):
+            yield ('MIENTRAS', (), {})
+        elif self.check_lex('repite'):
+            yield ('REPITE', (), {})
+        elif self.check_lex('switch'):
+            yield ('SWITCH', (), {})
+        elif self.check_lex('ejecutar'):
+            yield ('EJECUTAR', (), {})
+        elif self.check_lex('salir'):
+            yield ('SALIR', (), {})
+        elif self.check_lex('regresar'):
+            yield ('REGRESAR', (), {})
+        else:
+            self.reportar_error('Estatuto no reconocido')
+            self.sincronizar(';', '}')
+        self.recuperar('ESTATUTO')
+
+    def ASIGNA(self):
+        yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador en asignación'})
+        if self.check_lex('=', '+=', '-=', '*=', '/='):
+            self.advance()
+            yield ('EXP_ARIT', (), {})
+            self.consume(lex=';', msg="Falta ';' al final de la asignación")
+        elif self.check_lex('++', '--'):
+            self.advance()
+            self.consume(lex=';', msg="Falta ';' al final de la expresión")
+        else:
+            self.reportar_error('Falta operador de asignación (=, +=, -=, *=, /=, ++ o --)')
+
+    def EXP_ARIT(self):
+        yield ('OPERANDO', (), {})
+        while self.current.type in self.OP_ARIT_TYPES:
+            self.advance()
+            yield ('OPERANDO', (), {})
+
+    def OPERANDO(self):
+        if self.check_lex('('):
+            self.advance()
+            yield ('EXP_ARIT', (), {})
+            self.consume(lex=')', msg="Falta ')' en expresión")
+        elif self.check_type(*self.ID_TYPES):
+            if self.current.type == 'ID_ARROBA' and self.pos + 1 < len(self.tokens) and (self.tokens[self.pos + 1].lexeme == '('):
+                self.advance()
+                self.consume(lex='(', msg="Falta '(' en llamada a método")
+                if not self.check_lex(')'):
+                    yield ('EXP_ARIT', (), {})
+                    while self.check_lex(','):
+                        self.advance()
+                        yield ('EXP_ARIT', (), {})
+                self.consume(lex=')', msg="Falta ')' en llamada a método")
+            else:
+                yield ('ID_ARREGLO', (), {})
+        elif self.check_type(*self.CTE_TYPES):
+            self.advance()
+        else:
+            self.reportar_error("Se esperaba identificador, constante o '(' en expresión aritmética")
+
+    def LEER(self):
+        self.consume(lex='leer')
+        self.consume(lex='(', msg="Falta '(' en 'leer'")
+        yield ('ID_ARREGLO', (), {'msg': "Falta identificador válido en 'leer'"})
+        self.consume(lex=')', msg="Falta ')' en 'leer'")
+        self.consume(lex=';', msg="Falta ';' al final de 'leer'")
+
+    def ESCRIBIR(self):
+        self.consume(lex='escribir')
+        self.consume(lex='(', msg="Falta '(' en 'escribir'")
+        if not self.check_lex(')'):
+            yield ('EXP_ARIT', (), {})
+            while self.check_lex(','):
+                self.advance()
+                yield ('EXP_ARIT', (), {})
+        self.consume(lex=')', msg="Falta ')' en 'escribir'")
+        self.consume(lex=';', msg="Falta ';' al final de 'escribir'")
+
+    def SI(self):
+        self.consume(lex='si')
+        self.consume(lex='(', msg="Falta '(' en 'si'")
+        yield ('CONDICION', (), {})
+        self.consume(lex=')', msg="Falta ')' en 'si'")
+        self.consume(lex='{', msg="Falta '{' en bloque 'si'")
+        self.recuperar('ENCABEZADO')
+        while self.es_inicio_estatuto():
+            yield ('ESTATUTO', (), {})
+        self.consume(lex='}', msg="Falta '}' al final del bloque 'si'")
+        if self.check_lex('sino'):
+            self.advance()
+            self.consume(lex='{', msg="Falta '{' en bloque 'sino'")
+            self.recuperar('ENCABEZADO')
+            while self.es_inicio_estatuto():
+                yield ('ESTATUTO', (), {})
+            self.consume(lex='}', msg="Falta '}' al final de bloque 'sino'")
+
+    def REPITE(self):
+        self.consume(lex='repite')
+        self.consume(lex='{', msg="Falta '{' en 'repite'")
+        self.recuperar('ENCABEZADO')
+        while self.es_inicio_estatuto():
+            yield ('ESTATUTO', (), {})
+        self.consume(lex='}', msg="Falta '}' en 'repite'")
+        self.consume(lex='mientras', msg="Falta 'mientras' después de 'repite'")
+        self.consume(lex='(', msg="Falta '(' en condición de 'repite'")
+        yield ('CONDICION', (), {})
+        self.consume(lex=')', msg="Falta ')' en condición de 'repite'")
+        self.consume(lex=';', msg="Falta ';' al final de 'repite'")
+
+    def MIENTRAS(self):
+        self.consume(lex='mientras')
+        self.consume(lex='(', msg="Falta '(' en 'mientras'")
+        yield ('CONDICION', (), {})
+        self.consume(lex=')', msg="Falta ')' en 'mientras'")
+        self.consume(lex='{', msg="Falta '{' en 'mientras'")
+        self.recuperar('ENCABEZADO')
+        while self.es_inicio_estatuto():
+            yield ('ESTATUTO', (), {})
+        self.consume(lex='}', msg="Falta '}' al final de 'mientras'")
+
+    def EJECUTAR(self):
+        self.consume(lex='ejecutar')
+        yield ('ID_ARREGLO', (), {'msg': "Se esperaba identificador de variable destino en 'ejecutar'"})
+        self.consume(lex='=', msg="Falta '=' en 'ejecutar'")
+        self.consume(type_='ID_ARROBA', msg="Falta nombre del método (@id) en 'ejecutar'")
+        self.consume(lex='(', msg="Falta '(' en llamada a método")
+        if not self.check_lex(')'):
+            yield ('EXP_ARIT', (), {})
+            while self.check_lex(','):
+                self.advance()
+                yield ('EXP_ARIT', (), {})
+        self.consume(lex=')', msg="Falta ')' en llamada a método")
+        self.consume(lex=';', msg="Falta ';' al final de 'ejecutar'")
+
+    def SWITCH(self):
+        self.consume(lex='switch')
+        self.consume(lex='(', msg="Falta '(' en 'switch'")
+        if not self.check_type('ID_AMP'):
+            self.reportar_error("Se esperaba identificador con '&' en switch")
+        else:
+            self.advance()
+        self.consume(lex=')', msg="Falta ')' en 'switch'")
+        self.consume(lex='{', msg="Falta '{' en 'switch'")
+        self.recuperar('ENCABEZADO')
+        while self.check_lex('encaso'):
+            self.advance()
+            if not self.check_type('CTE_ENT'):
+                self.reportar_error("Se esperaba constante entera después de 'encaso'")
+            else:
+                self.advance()
+            self.consume(lex=':', msg="Falta ':' después de 'encaso'")
+            self.recuperar('ENCASO')
+            while self.es_inicio_estatuto():
+                yield ('ESTATUTO', (), {})
+        if self.check_lex('default'):
+            self.advance()
+            self.consume(lex=':', msg="Falta ':' después de 'default'")
+            while self.es_inicio_estatuto():
+                yield ('ESTATUTO', (), {})
+        self.consume(lex='}', msg="Falta '}' al final de 'switch'")
+
+    def CONDICION(self):
+        if self.check_lex('!'):
+            self.advance()
+        yield ('EXP_ARIT', (), {})
+        if self.current.type in self.OP_REL_TYPES:
+            self.advance()
+        else:
+            self.reportar_error('Se esperaba operador relacional')
+        yield ('EXP_ARIT', (), {})
+        while self.current.type in self.OP_LOG_TYPES:
+            self.advance()
+            if self.check_lex('!'):
+                self.advance()
+            yield ('EXP_ARIT', (), {})
+            if self.current.type in self.OP_REL_TYPES:
+                self.advance()
+            else:
+                self.reportar_error('Se esperaba operador relacional')
+            yield ('EXP_ARIT', (), {})
+
+    def REGRESAR(self):
+        self.consume(lex='regresar')
+        self.consume(lex='(', msg="Falta '(' en 'regresar'")
+        if not self.check_lex(')'):
+            yield ('EXP_ARIT', (), {})
+        self.consume(lex=')', msg="Falta ')' en 'regresar'")
+        self.consume(lex=';', msg="Falta ';' al final de 'regresar'")
+
+
+class ProduccionesParserCodigos:
+    """Producciones de parser_codigos.ParserCodigos como generadores."""
+
+    def PROG(self):
+        self.consume_cod(C['clase'], "Se esperaba 'clase'")
+        self.consume_cod(ID_ARROBA, 'Se esperaba identificador de clase (@id)')
+        self.consume_cod(LLAVE_AP, "Falta '{' después de clase")
+        self.recuperar('ENCABEZADO')
+        while self.cod in PRIMEROS['VAR']:
+            yield ('VAR', (), {})
+        while self.cod in PRIMEROS['METODO']:
+            yield ('METODO', (), {})
+        self.consume_cod(LLAVE_CI, "Falta '}' al final de la clase")
+
+    def VAR(self):
+        self.consume_cod(C['var'], "Se esperaba 'var'")
+        yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador de variable'})
+        while self.cod == COMA:
+            self.advance()
+            yield ('ID_ARREGLO', (), {'msg': "Falta identificador después de ','"})
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de la declaración de variable")
+        self.recuperar('VAR')
+
+    def ID_ARREGLO(self, msg='Se esperaba identificador'):
+        if self.cod not in IDS:
+            self.reportar_error(msg)
+            return
+        self.advance()
+        if self.cod == COR_AP:
+            self.advance()
+            yield ('EXP_ARIT', (), {})
+            while self.cod == COMA:
+                self.advance()
+                yield ('EXP_ARIT', (), {})
+            self.consume_cod(COR_CI, "Falta ']' en índice de arreglo")
+
+    def METODO(self):
+        self.consume_cod(C['metodo'], "Se esperaba 'metodo'")
+        if self.cod in TIPOS_RETORNO:
+            self.advance()
+        else:
+            self.reportar_error("Tipo de retorno inválido, se esperaba 'entero', 'real', 'cadena' o 'vacio'")
+        self.consume_cod(ID_ARROBA, 'Falta nombre del método (@id)')
+        self.consume_cod(PAR_AP, "Falta '(' en definición de método")
+        if self.cod != PAR_CI:
+            yield ('PARAM', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en definición de método")
+        self.consume_cod(LLAVE_AP, "Falta '{' en cuerpo del método")
+        self.recuperar('ENCABEZADO')
+        while self.cod in PRIMEROS['VAR']:
+            yield ('VAR', (), {})
+        while self.cod in PRIMEROS['ESTATUTO']:
+            yield ('ESTATUTO', (), {})
+        self.consume_cod(LLAVE_CI, "Falta '}' al final del método")
+        self.recuperar('METODO')
+
+    def PARAM(self):
+        yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador de parámetro'})
+        while self.cod == COMA:
+            self.advance()
+            yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador de parámetro'})
+
+    def ESTATUTO(self):
+        cod = self.cod
+        if cod in IDS:
+            yield ('ASIGNA', (), {})
+        elif cod == C['leer']:
+            yield ('LEER', (), {})
+        elif cod == C['escribir']:
+            yield ('ESCRIBIR', (), {})
+        elif cod == C['si']:
+            yield ('SI', (), {})
+        elif cod == C['mientras']:
+            yield ('MIENTRAS', (), {})
+        elif cod == C['repite']:
+            yield ('REPITE', (), {})
+        elif cod == C['switch']:
+            yield ('SWITCH', (), {})
+        elif cod == C['ejecutar']:
+            yield ('EJECUTAR', (), {})
+        elif cod == C['salir']:
+            yield ('SALIR', (), {})
+        elif cod == C['regresar']:
+            yield ('REGRESAR', (), {})
+        else:
+            self.reportar_error('Estatuto no reconocido')
+            self.sincronizar_cod(SIGUIENTES['ESTATUTO'])
+        self.recuperar('ESTATUTO')
+
+    def ASIGNA(self):
+        yield ('ID_ARREGLO', (), {'msg': 'Se esperaba identificador en asignación'})
+        if self.cod in OP_ASIG:
+            self.advance()
+            yield ('EXP_ARIT', (), {})
+            self.consume_cod(PUNTOYCOMA, "Falta ';' al final de la asignación")
+        elif self.cod in INC_DEC:
+            self.advance()
+            self.consume_cod(PUNTOYCOMA, "Falta ';' al final de la expresión")
+        else:
+            self.reportar_error('Falta operador de asignación (=, +=, -=, *=, /=, ++ o --)')
+
+    def EXP_ARIT(self):
+        yield ('OPERANDO', (), {})
+        while self.cod in OP_ARIT:
+            self.advance()
+            yield ('OPERANDO', (), {})
+
+    def OPERANDO(self):
+        cod = self.cod
+        if cod == PAR_AP:
+            self.advance()
+            yield ('EXP_ARIT', (), {})
+            self.consume_cod(PAR_CI, "Falta ')' en expresión")
+        elif cod in IDS:
+            if cod == ID_ARROBA and self.pos + 1 < self.n and (self.codigos[self.pos + 1] == PAR_AP):
+                self.advance()
+                self.consume_cod(PAR_AP, "Falta '(' en llamada a método")
+                if self.cod != PAR_CI:
+                    yield ('EXP_ARIT', (), {})
+                    while self.cod == COMA:
+                        self.advance()
+                        yield ('EXP_ARIT', (), {})
+                self.consume_cod(PAR_CI, "Falta ')' en llamada a método")
+            else:
+                yield ('ID_ARREGLO', (), {})
+        elif cod in CTES:
+            self.advance()
+        else:
+            self.reportar_error("Se esperaba identificador, constante o '(' en expresión aritmética")
+
+    def LEER(self):
+        self.consume_cod(C['leer'])
+        self.consume_cod(PAR_AP, "Falta '(' en 'leer'")
+        yield ('ID_ARREGLO', (), {'msg': "Falta identificador válido en 'leer'"})
+        self.consume_cod(PAR_CI, "Falta ')' en 'leer'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'leer'")
+
+    def ESCRIBIR(self):
+        self.consume_cod(C['escribir'])
+        self.consume_cod(PAR_AP, "Falta '(' en 'escribir'")
+        if self.cod != PAR_CI:
+            yield ('EXP_ARIT', (), {})
+            while self.cod == COMA:
+                self.advance()
+                yield ('EXP_ARIT', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en 'escribir'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'escribir'")
+
+    def SI(self):
+        self.consume_cod(C['si'])
+        self.consume_cod(PAR_AP, "Falta '(' en 'si'")
+        yield ('CONDICION', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en 'si'")
+        self.consume_cod(LLAVE_AP, "Falta '{' en bloque 'si'")
+        self.recuperar('ENCABEZADO')
+        while self.cod in PRIMEROS['ESTATUTO']:
+            yield ('ESTATUTO', (), {})
+        self.consume_cod(LLAVE_CI, "Falta '}' al final del bloque 'si'")
+        if self.cod == C['sino']:
+            self.advance()
+            self.consume_cod(LLAVE_AP, "Falta '{' en bloque 'sino'")
+            self.recuperar('ENCABEZADO')
+            while self.cod in PRIMEROS['ESTATUTO']:
+                yield ('ESTATUTO', (), {})
+            self.consume_cod(LLAVE_CI, "Falta '}' al final de bloque 'sino'")
+
+    def REPITE(self):
+        self.consume_cod(C['repite'])
+        self.consume_cod(LLAVE_AP, "Falta '{' en 'repite'")
+        self.recuperar('ENCABEZADO')
+        while self.cod in PRIMEROS['ESTATUTO']:
+            yield ('ESTATUTO', (), {})
+        self.consume_cod(LLAVE_CI, "Falta '}' en 'repite'")
+        self.consume_cod(C['mientras'], "Falta 'mientras' después de 'repite'")
+        self.consume_cod(PAR_AP, "Falta '(' en condición de 'repite'")
+        yield ('CONDICION', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en condición de 'repite'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'repite'")
+
+    def MIENTRAS(self):
+        self.consume_cod(C['mientras'])
+        self.consume_cod(PAR_AP, "Falta '(' en 'mientras'")
+        yield ('CONDICION', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en 'mientras'")
+        self.consume_cod(LLAVE_AP, "Falta '{' en 'mientras'")
+        self.recuperar('ENCABEZADO')
+        while self.cod in PRIMEROS['ESTATUTO']:
+            yield ('ESTATUTO', (), {})
+        self.consume_cod(LLAVE_CI, "Falta '}' al final de 'mientras'")
+
+    def EJECUTAR(self):
+        self.consume_cod(C['ejecutar'])
+        yield ('ID_ARREGLO', (), {'msg': "Se esperaba identificador de variable destino en 'ejecutar'"})
+        self.consume_cod(IGUAL, "Falta '=' en 'ejecutar'")
+        self.consume_cod(ID_ARROBA, "Falta nombre del método (@id) en 'ejecutar'")
+        self.consume_cod(PAR_AP, "Falta '(' en llamada a método")
+        if self.cod != PAR_CI:
+            yield ('EXP_ARIT', (), {})
+            while self.cod == COMA:
+                self.advance()
+                yield ('EXP_ARIT', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en llamada a método")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'ejecutar'")
+
+    def SWITCH(self):
+        self.consume_cod(C['switch'])
+        self.consume_cod(PAR_AP, "Falta '(' en 'switch'")
+        if self.cod != ID_AMP:
+            self.reportar_error("Se esperaba identificador con '&' en switch")
+        else:
+            self.advance()
+        self.consume_cod(PAR_CI, "Falta ')' en 'switch'")
+        self.consume_cod(LLAVE_AP, "Falta '{' en 'switch'")
+        self.recuperar('ENCABEZADO')
+        while self.cod == C['encaso']:
+            self.advance()
+            if self.cod != CTE_ENT:
+                self.reportar_error("Se esperaba constante entera después de 'encaso'")
+            else:
+                self.advance()
+            self.consume_cod(DOS_PUNTOS, "Falta ':' después de 'encaso'")
+            self.recuperar('ENCASO')
+            while self.cod in PRIMEROS['ESTATUTO']:
+                yield ('ESTATUTO', (), {})
+        self.consume_cod(LLAVE_CI, "Falta '}' al final de 'switch'")
+
+    def CONDICION(self):
+        if self.cod == NOT:
+            self.advance()
+        yield ('EXP_ARIT', (), {})
+        if self.cod in OP_REL:
+            self.advance()
+        else:
+            self.reportar_error('Se esperaba operador relacional')
+        yield ('EXP_ARIT', (), {})
+        while self.cod in OP_LOG:
+            self.advance()
+            if self.cod == NOT:
+                self.advance()
+            yield ('EXP_ARIT', (), {})
+            if self.cod in OP_REL:
+                self.advance()
+            else:
+                self.reportar_error('Se esperaba operador relacional')
+            yield ('EXP_ARIT', (), {})
+
+    def REGRESAR(self):
+        self.consume_cod(C['regresar'])
+        self.consume_cod(PAR_AP, "Falta '(' en 'regresar'")
+        if self.cod != PAR_CI:
+            yield ('EXP_ARIT', (), {})
+        self.consume_cod(PAR_CI, "Falta ')' en 'regresar'")
+        self.consume_cod(PUNTOYCOMA, "Falta ';' al final de 'regresar'")
@@ -0,0 +1,269 @@
+# semantico.py
+# Análisis semántico sobre el árbol de ParserAST (arbol.py): declaraciones y
+# usos de identificadores, la variable del switch, casos repetidos y la
+# aridad de las llamadas a métodos (en expresiones y en 'ejecutar').
+#
+# La tabla de símbolos es una cadena de ámbitos: cada ámbito es un dict y
+# la búsqueda sube al ámbito padre si no encuentra el nombre. Solo hay dos
+# niveles (clase y método), así que cada búsqueda cuesta a lo más dos
+# consultas a un dict y el análisis es lineal en el número de nodos.
+from dataclasses import dataclass
+
+from arbol import Visitante, construir_arbol, NINGUNO
+from sintactic import TOKEN_MAP, MAX_ERRORES
+
+_NOMBRE_A_CODIGO = {nombre: codigo for codigo, nombre in TOKEN_MAP.items()}
+_IDS = frozenset(_NOMBRE_A_CODIGO[n] for n in ("ID_ARROBA", "ID_DOLAR", "ID_AMP", "ID_PORC"))
+_ID_ARROBA = _NOMBRE_A_CODIGO["ID_ARROBA"]
+_CTE_ENT = _NOMBRE_A_CODIGO["CTE_ENT"]
+_IGUAL = _NOMBRE_A_CODIGO["IGUAL"]
+
+CLASE, METODO, VARIABLE = "clase", "método", "variable"
+
+
+@dataclass
+class Simbolo:
+    nombre: str
+    categoria: str          # CLASE, METODO o VARIABLE
+    linea: int
+    aridad: int = 0         # parámetros, en métodos
+    dimensiones: int = 0    # índices declarados, en arreglos
+
+
+class Ambito:
+    """Tabla de símbolos de un ámbito; buscar() sigue la cadena de padres."""
+
+    def __init__(self, padre=None):
+        self.simbolos = {}
+        self.padre = padre
+
+    def declarar(self, simbolo):
+        """Agrega el símbolo; si el nombre ya existe en ESTE ámbito devuelve el previo."""
+        previo = self.simbolos.get(simbolo.nombre)
+        if previo is None:
+            self.simbolos[simbolo.nombre] = simbolo
+        return previo
+
+    def buscar(self, nombre):
+        ambito = self
+        while ambito is not None:
+            simbolo = ambito.simbolos.get(nombre)
+            if simbolo is not None:
+                return simbolo
+            ambito = ambito.padre
+        return None
+
+
+class AnalizadorSemantico(Visitante):
+    def __init__(self, avance=None):
+        self.errores = []
+        self.clase = Ambito()
+        self.ambito = self.clase
+        self.avance = avance    # avance(nodo) al entrar a cada método
+
+    def analizar(self, arbol):
+        if len(arbol):
+            self._declarar_metodos(arbol)
+            self.visitar(arbol)
+        return self.errores
+
+    def error(self, arbol, nodo, msg):
+        self.errores.append(f"[L{arbol.lineas[nodo]}] {msg}")
+
+    # ---------- Declaraciones ----------
+    def _declarar(self, arbol, nodo, simbolo):
+        previo = self.ambito.declarar(simbolo)
+        if previo is not None:
+            self.error(arbol, nodo, f"'{simbolo.nombre}' ya fue declarado ({previo.categoria}, "
+                                    f"línea {previo.linea})")
+
+    def _declarar_metodos(self, arbol):
+        """Primera pasada: los métodos se pueden llamar antes de su definición."""
+        for metodo in arbol.hijos(0):
+            if arbol.nombre(metodo) != "METODO":
+                continue
+            nombre = aridad = None
+            for h in arbol.hijos(metodo):
+                if nombre is None and arbol.tipos[h] == _ID_ARROBA:
+                    nombre = h
+                elif arbol.nombre(h) == "PARAM":
+                    aridad = sum(1 for _ in arbol.hijos(h))
+            if nombre is not None:
+                self._declarar(arbol, nombre, Simbolo(arbol.lexemas[nombre], METODO,
+                                                      arbol.lineas[nombre], aridad or 0))
+
+    def _declarar_variables(self, arbol, nodo):
+        """Hijos de VAR o PARAM: identificadores o ID_ARREGLO (id + dimensiones)."""
+        for h in arbol.hijos(nodo):
+            if arbol.tipos[h] in _IDS:
+                self._declarar(arbol, h, Simbolo(arbol.lexemas[h], VARIABLE, arbol.lineas[h]))
+            elif arbol.nombre(h) == "ID_ARREGLO" and arbol.primer_hijo[h] != NINGUNO:
+                ident, *indices = arbol.hijos(h)
+                # Las dimensiones se evalúan antes de que exista la variable
+                for i in indices:
+                    self.visitar(arbol, i)
+                if arbol.tipos[ident] in _IDS:
+                    self._declarar(arbol, ident, Simbolo(arbol.lexemas[ident], VARIABLE,
+                                                         arbol.lineas[ident], dimensiones=len(indices)))
+
+    def visitar_PROG(self, arbol, nodo):
+        h = arbol.primer_hijo[nodo]
+        if h != NINGUNO and arbol.tipos[h] == _ID_ARROBA:
+            self._declarar(arbol, h, Simbolo(arbol.lexemas[h], CLASE, arbol.lineas[h]))
+            # El resto de los hijos se visita normalmente; el nombre de la
+            # clase no es un uso
+            for h in list(arbol.hijos(nodo))[1:]:
+                self.visitar(arbol, h)
+            return False
+        return None
+
+    def visitar_VAR(self, arbol, nodo):
+        self._declarar_variables(arbol, nodo)
+        return False
+
+    def visitar_PARAM(self, arbol, nodo):
+        self._declarar_variables(arbol, nodo)
+        return False
+
+    def visitar_METODO(self, arbol, nodo):
+        if self.avance is not None:
+            self.avance(nodo)
+        self.ambito = Ambito(self.clase)
+        for h in arbol.hijos(nodo):
+            if arbol.tipos[h] == _ID_ARROBA:
+                continue  # el nombre del método ya se declaró
+            self.visitar(arbol, h)
+        self.ambito = self.clase
+        return False
+
+    # ---------- Usos ----------
+    def _usar(self, arbol, nodo):
+        nombre = arbol.lexemas[nodo]
+        simbolo = self.ambito.buscar(nombre)
+        if simbolo is None:
+            self.error(arbol, nodo, f"Identificador '{nombre}' no declarado")
+            # Se registra para no repetir el error en cada uso del ámbito
+            self.ambito.declarar(Simbolo(nombre, VARIABLE, arbol.lineas[nodo]))
+        elif simbolo.categoria != VARIABLE:
+            self.error(arbol, nodo, f"'{nombre}' es {'una' if simbolo.categoria == CLASE else 'un'} "
+                                    f"{simbolo.categoria}, no una variable")
+        return simbolo
+
+    def _llamar(self, arbol, nodo, argumentos):
+        nombre = arbol.lexemas[nodo]
+        simbolo = self.ambito.buscar(nombre)
+        if simbolo is None:
+            self.error(arbol, nodo, f"Método '{nombre}' no declarado")
+        elif simbolo.categoria != METODO:
+            self.error(arbol, nodo, f"'{nombre}' no es un método")
+        elif simbolo.aridad != len(argumentos):
+            self.error(arbol, nodo, f"El método '{nombre}' espera {simbolo.aridad} argumento(s), "
+                                    f"se pasaron {len(argumentos)}")
+        for a in argumentos:
+            self.visitar(arbol, a)
+
+    def visitar_ID_ARROBA(self, arbol, nodo):
+        self._usar(arbol, nodo)
+
+    visitar_ID_DOLAR = visitar_ID_AMP = visitar_ID_PORC = visitar_ID_ARROBA
+
+    def visitar_OPERANDO(self, arbol, nodo):
+        # Un OPERANDO que no colapsó es una llamada: @metodo(argumentos)
+        if arbol.primer_hijo[nodo] == NINGUNO:
+            return None
+        metodo, *argumentos = arbol.hijos(nodo)
+        if arbol.tipos[metodo] != _ID_ARROBA:
+            return None
+        self._llamar(arbol, metodo, argumentos)
+        return False
+
+    def visitar_EJECUTAR(self, arbol, nodo):
+        # destino = @metodo(argumentos)
+        hijos = list(arbol.hijos(nodo))
+        igual = next((k for k, h in enumerate(hijos) if arbol.tipos[h] == _IGUAL), None)
+        if igual is None or igual + 1 >= len(hijos) or arbol.tipos[hijos[igual + 1]] != _ID_ARROBA:
+            return None  # árbol incompleto por un error sintáctico
+        for h in hijos[:igual]:
+            self.visitar(arbol, h)
+        self._llamar(arbol, hijos[igual + 1], hijos[igual + 2:])
+        return False
+
+    def visitar_SWITCH(self, arbol, nodo):
+        casos = {}
+        for h in arbol.hijos(nodo):
+            tipo = arbol.tipos[h]
+            if tipo in _IDS:
+                simbolo = self._usar(arbol, h)
+                if simbolo is not None and simbolo.dimensiones:
+                    self.error(arbol, h, f"La variable del switch '{arbol.lexemas[h]}' es un arreglo")
+            elif tipo == _CTE_ENT:
+                valor = int(arbol.lexemas[h])
+                if valor in casos:
+                    self.error(arbol, h, f"Caso repetido en switch: encaso {arbol.lexemas[h]} "
+                                         f"(línea {casos[valor]})")
+                else:
+                    casos[valor] = arbol.lineas[h]
+            else:
+                self.visitar(arbol, h)
+        return False
+
+
+def analizar_semantica(arbol, avance=None):
+    """
+    Errores semánticos del árbol de ParserAST (lista de mensajes). avance,
+    si se da, se llama con el nodo de cada método antes de analizarlo.
+    """
+    return AnalizadorSemantico(avance).analizar(arbol)
+
+
+def analizar_tokens(tokens, max_errores=MAX_ERRORES):
+    """Construye el árbol y lo analiza: (errores sintácticos, errores semánticos)."""
+    arbol, errores = construir_arbol(tokens, max_errores)
+    return errores, analizar_semantica(arbol)
+
+
+def mostrar_reporte(errores):
+    """Imprime el resultado y genera Errores_Semánticos.txt."""
+    if not errores:
+        print("Analisis semantico completado SIN ERRORES\n")
+    else:
+        print(f"\n{'='*60}")
+        print(f"ANÁLISIS SEMÁNTICO - {len(errores)} error(es) encontrado(s)")
+        print(f"{'='*60}\n")
+        for err in errores:
+            print(err)
+        print()
+
+    escribir_reporte(errores)
+
+
+def texto_reporte(errores):
+    """Contenido de Errores_Semánticos.txt para la lista de errores dada."""
+    if not errores:
+        return "Análisis semántico completado SIN ERRORES\n"
+    partes = [f"ANÁLISIS SEMÁNTICO - {len(errores)} error(es) encontrado(s)\n",
+              "=" * 60 + "\n\n"]
+    partes.extend(err + "\n" for err in errores)
+    return "".join(partes)
+
+
+def escribir_reporte(errores, ruta="Errores_Semánticos.txt"):
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(texto_reporte(errores))
+
+
+def main():
+    import sys
+    from lexer import scan
+
+    if len(sys.argv) < 2:
+        print("Uso: python semantico.py <programa.txt>")
+        sys.exit(1)
+    with open(sys.argv[1], "r", encoding="utf-8") as f:
+        tokens, _ = scan(f.read(), motor="regex")
+    _, errores = analizar_tokens(tokens)
+    mostrar_reporte(errores)
+
+
+if __name__ == "__main__":
+    main()
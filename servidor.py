@@ -0,0 +1,254 @@
+# servidor.py
+# Servidor de análisis: un proceso que se queda corriendo con el lexer y el
+# parser ya cargados, para no pagar el arranque de Python por cada archivo.
+# Atiende peticiones JSON por HTTP local y/o por un socket Unix; el bucle
+# asyncio solo mueve bytes y el análisis (incluido decodificar la petición y
+# codificar la respuesta) corre en un grupo de procesos de trabajo.
+#
+#   HTTP:   POST /analizar  {"codigo": "...", "motor": "regex", "tokens": true,
+#                            "semantico": true}
+#           GET  /salud
+#   Socket: una petición JSON por línea, una respuesta JSON por línea.
+#
+# La respuesta tiene la forma de lote.analizar_ruta; con "tokens": true
+# incluye además los tokens en columnas (lexemas, codigos, lineas, columnas).
+import argparse
+import asyncio
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+
+from cache import analizar_con_cache
+from lexer import MOTORES
+
+HOST_DEFAULT = "127.0.0.1"
+PUERTO_DEFAULT = 8765
+MAX_PETICION = 64 * 1024 * 1024     # bytes de una petición (fuente incluido)
+
+_RAZONES = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def _json(datos):
+    return json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def resumen(res, tokens=False):
+    """Resultado de analyze() como diccionario serializable a JSON."""
+    datos = {
+        "tokens": len(res.tokens),
+        "errores_lexicos": [[e.lexema, e.descripcion, e.linea, e.columna]
+                            for e in res.errores_lexicos],
+        "errores_sintacticos": list(res.errores_sintacticos),
+    }
+    if res.errores_semanticos is not None:
+        datos["errores_semanticos"] = list(res.errores_semanticos)
+    if tokens:
+        t = res.tokens
+        if hasattr(t, "codigos"):
+            # token_stream.TokenStream (acierto de caché)
+            columnas = (list(t.lexemas()), list(t.codigos), list(t.lineas), list(t.columnas))
+        else:
+            columnas = ([x.lexema for x in t], [x.codigo for x in t],
+                        [x.linea for x in t], [x.columna for x in t])
+        datos["tabla"] = dict(zip(("lexemas", "codigos", "lineas", "columnas"), columnas))
+    return datos
+
+
+def atender_peticion(cuerpo, usar_cache=True):
+    """
+    Trabajo de un proceso: recibe la petición tal como llegó (bytes JSON) y
+    devuelve (estado HTTP, respuesta JSON en bytes).
+    """
+    try:
+        peticion = json.loads(cuerpo)
+        codigo = peticion["codigo"]
+        if not isinstance(codigo, str):
+            raise TypeError
+    except (ValueError, KeyError, TypeError):
+        return 400, _json({"error": 'Se esperaba un objeto JSON {"codigo": "..."}'})
+    motor = peticion.get("motor", "regex")
+    if motor not in MOTORES:
+        return 400, _json({"error": f"Motor desconocido: {motor}"})
+
+    try:
+        res = analizar_con_cache(codigo, None if usar_cache else False, motor=motor,
+                                 semantico=bool(peticion.get("semantico", False)))
+        return 200, _json(resumen(res, bool(peticion.get("tokens", False))))
+    except Exception as e:
+        return 500, _json({"error": f"Error en el análisis: {type(e).__name__}: {e}"})
+
+
+class ServidorAnalisis:
+    def __init__(self, trabajadores=None, usar_cache=True):
+        self.trabajadores = trabajadores
+        self.usar_cache = usar_cache
+        self.ejecutor = None
+        self.servidores = []
+        self.atendidas = 0
+        self.en_curso = 0
+
+    def estado(self):
+        return {"pid": os.getpid(), "trabajadores": self.ejecutor._max_workers,
+                "atendidas": self.atendidas, "en_curso": self.en_curso}
+
+    async def procesar(self, cuerpo):
+        self.en_curso += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.ejecutor, atender_peticion, cuerpo, self.usar_cache)
+        except Exception as e:
+            # Falla fuera del análisis (p. ej. un proceso de trabajo que murió)
+            return 500, _json({"error": f"Error del servidor: {type(e).__name__}: {e}"})
+        finally:
+            self.en_curso -= 1
+            self.atendidas += 1
+
+    # ---------- Socket Unix: JSON por líneas ----------
+    async def _atender_lineas(self, lector, escritor):
+        try:
+            while True:
+                try:
+                    linea = await lector.readline()
+                except ValueError:      # línea más larga que MAX_PETICION
+                    escritor.write(_json({"error": "Petición demasiado grande"}) + b"\n")
+                    break
+                if not linea:
+                    break
+                if linea.strip() == b"salud":
+                    respuesta = _json(self.estado())
+                else:
+                    _, respuesta = await self.procesar(linea)
+                escritor.write(respuesta + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    # ---------- HTTP/1.1 mínimo (con keep-alive) ----------
+    async def _atender_http(self, lector, escritor):
+        try:
+            while True:
+                inicio = await lector.readline()
+                if not inicio.strip():
+                    break
+                partes = inicio.decode("latin-1").split()
+                if len(partes) != 3:
+                    break
+                metodo, ruta, version = partes
+                encabezados = {}
+                while True:
+                    linea = await lector.readline()
+                    if linea in (b"\r\n", b"\n", b""):
+                        break
+                    nombre, _, valor = linea.decode("latin-1").partition(":")
+                    encabezados[nombre.strip().lower()] = valor.strip()
+
+                largo = int(encabezados.get("content-length", 0) or 0)
+                if largo > MAX_PETICION:
+                    self._responder(escritor, 413, _json({"error": "Petición demasiado grande"}), False)
+                    break
+                cuerpo = await lector.readexactly(largo)
+
+                if ruta == "/salud":
+                    estado, datos = 200, _json(self.estado())
+                elif ruta != "/analizar":
+                    estado, datos = 404, _json({"error": f"Ruta desconocida: {ruta}"})
+                elif metodo != "POST":
+                    estado, datos = 405, _json({"error": "Use POST"})
+                else:
+                    estado, datos = await self.procesar(cuerpo)
+
+                seguir = (encabezados.get("connection", "").lower() != "close"
+                          and version == "HTTP/1.1")
+                self._responder(escritor, estado, datos, seguir)
+                await escritor.drain()
+                if not seguir:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    @staticmethod
+    def _responder(escritor, estado, datos, seguir):
+        escritor.write(
+            f"HTTP/1.1 {estado} {_RAZONES[estado]}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(datos)}\r\n"
+            f"Connection: {'keep-alive' if seguir else 'close'}\r\n\r\n".encode("latin-1") + datos)
+
+    # ---------- Ciclo de vida ----------
+    async def iniciar(self, host=None, puerto=None, ruta_socket=None):
+        self.ejecutor = ProcessPoolExecutor(max_workers=self.trabajadores)
+        # Crea los procesos desde ya: la primera petición no paga el arranque
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.ejecutor, atender_peticion, b'{"codigo":""}', False)
+                               for _ in range(self.ejecutor._max_workers)))
+        if puerto is not None:
+            self.servidores.append(await asyncio.start_server(
+                self._atender_http, host or HOST_DEFAULT, puerto, limit=1 << 16))
+        if ruta_socket:
+            if os.path.exists(ruta_socket):
+                os.remove(ruta_socket)  # socket de una ejecución anterior
+            self.servidores.append(await asyncio.start_unix_server(
+                self._atender_lineas, ruta_socket, limit=MAX_PETICION))
+
+    async def cerrar(self, ruta_socket=None):
+        for s in self.servidores:
+            s.close()
+            await s.wait_closed()
+        self.servidores = []
+        if ruta_socket and os.path.exists(ruta_socket):
+            os.remove(ruta_socket)
+        if self.ejecutor:
+            self.ejecutor.shutdown(cancel_futures=True)
+
+
+async def servir(host=None, puerto=PUERTO_DEFAULT, ruta_socket=None, trabajadores=None,
+                 usar_cache=True):
+    """Atiende peticiones hasta recibir SIGINT/SIGTERM."""
+    servidor = ServidorAnalisis(trabajadores, usar_cache)
+    await servidor.iniciar(host, puerto, ruta_socket)
+    detener = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for senal in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(senal, detener.set)
+        except (NotImplementedError, AttributeError):
+            pass  # Windows: Ctrl+C llega como KeyboardInterrupt
+    if puerto is not None:
+        print(f"Escuchando en http://{host or HOST_DEFAULT}:{puerto}")
+    if ruta_socket:
+        print(f"Escuchando en {ruta_socket}")
+    try:
+        await detener.wait()
+    finally:
+        await servidor.cerrar(ruta_socket)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Servidor de análisis (léxico + sintáctico)")
+    ap.add_argument("--host", default=HOST_DEFAULT, help=f"Interfaz HTTP (default {HOST_DEFAULT})")
+    ap.add_argument("--puerto", type=int, default=PUERTO_DEFAULT,
+                    help=f"Puerto HTTP; 0 para no abrir HTTP (default {PUERTO_DEFAULT})")
+    ap.add_argument("--socket", help="Ruta de un socket Unix adicional")
+    ap.add_argument("--trabajadores", type=int, default=None,
+                    help="Procesos de análisis (por defecto, uno por núcleo)")
+    ap.add_argument("--sin-cache", action="store_true",
+                    help="No consultar ni llenar la caché de resultados")
+    args = ap.parse_args()
+
+    if not args.puerto and not args.socket:
+        ap.error("Se necesita --puerto o --socket")
+    try:
+        asyncio.run(servir(args.host, args.puerto or None, args.socket,
+                           args.trabajadores, not args.sin_cache))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -154,6 +154,66 @@ def cargar_tokens_desde_tabla(ruta):
     print(f"{len(tokens)} tokens cargados correctamente desde {ruta}\n")
     return tokens
 
+def tokens_desde_lexer(tokens_lex):
+    """
+    Adaptador directo lexer -> parser: convierte los lexer.Token (código
+    numérico) en Token del parser sin pasar por Tokens.txt.
+    """
+    return [Token(type=TOKEN_MAP.get(t.codigo, f"DESCONOCIDO_{t.codigo}"),
+                  lexeme=t.lexema, line=t.linea)
+            for t in tokens_lex]
+
+class _TokensDeStream:
+    """
+    Vista de un TokenStream (columnar) como la secuencia que usa el Parser:
+    cada Token se materializa al pedirlo y EOF se agrega sin copiar nada.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        self.n = len(stream)
+        self.eof = Token("EOF", "EOF", -1)
+
+    def __len__(self):
+        return self.n + 1
+
+    def __getitem__(self, i):
+        if i == self.n:
+            return self.eof
+        s = self.stream
+        codigo = s.codigos[i]
+        return Token(TOKEN_MAP.get(codigo, f"DESCONOCIDO_{codigo}"), s.lexema(i), s.lineas[i])
+
+
+# ================================================================
+# RECUPERACIÓN DE ERRORES
+# ================================================================
+# El primer error de un estatuto pone al parser en modo pánico: los errores
+# que ese mismo estatuto siga provocando se suprimen. Al terminar la
+# producción, recuperar() descarta tokens hasta su terminador (que se
+# consume) o hasta uno de sus SIGUIENTES, y sale del modo pánico. Los
+# identificadores no sirven para sincronizar: aparecen a media expresión.
+# Tampoco se reporta un error sobre el mismo token que el anterior (p. ej.
+# las '}' que faltan a cada bloque que encierra un token fuera de lugar).
+INICIO_ESTATUTO = ("leer", "escribir", "si", "mientras", "repite", "switch", "ejecutar",
+                   "salir", "regresar")
+
+# producción -> (terminador, siguientes)
+SINCRONIZACION = {
+    "ESTATUTO": (";", ("}", "encaso") + INICIO_ESTATUTO),
+    "VAR": (";", ("var", "metodo", "}") + INICIO_ESTATUTO),
+    "METODO": ("}", ("metodo",)),
+    # Encabezados de la clase, de un método o de un bloque: "... {"
+    "ENCABEZADO": ("{", ("var", "metodo", "}", "encaso") + INICIO_ESTATUTO),
+    "ENCASO": (":", ("encaso", "}") + INICIO_ESTATUTO),
+}
+
+MAX_ERRORES = 100   # errores sintácticos antes de detener el análisis
+
+
+class AnalisisDetenido(Exception):
+    """Se alcanzó el máximo de errores: parse() termina ahí."""
+
+
 class Parser:
     ID_TYPES = ("ID_ARROBA", "ID_DOLAR", "ID_AMP", "ID_PORC")
     CTE_TYPES = ("CTE_ENT", "CTE_REAL", "CTE_CADENA")
@@ -162,12 +222,24 @@ class Parser:
     OP_REL_TYPES = ("MENOR", "MENOR_IGUAL", "MAYOR", "MAYOR_IGUAL", "IGUALDAD", "DISTINTO")
     OP_LOG_TYPES = ("AND", "OR")
 
-    def __init__(self, tokens):
-        self.tokens = tokens + [Token("EOF", "EOF", -1)]
+    # Métodos que implementan producciones de la gramática
+    PRODUCCIONES = ("PROG", "VAR", "ID_ARREGLO", "METODO", "PARAM", "ESTATUTO", "ASIGNA",
+                    "EXP_ARIT", "OPERANDO", "LEER", "ESCRIBIR", "SI", "REPITE", "MIENTRAS",
+                    "EJECUTAR", "SWITCH", "CONDICION", "REGRESAR", "SALIR")
+
+    def __init__(self, tokens, max_errores=MAX_ERRORES):
+        if isinstance(tokens, list):
+            self.tokens = tokens + [Token("EOF", "EOF", -1)]
+        else:
+            # token_stream.TokenStream: se consume directamente, sin copiarlo
+            self.tokens = _TokensDeStream(tokens)
         self.pos = 0
         self.current = self.tokens[0]
         self.errores = []
-        self.en_panico = False
+        self.en_panico = False      # hay un error sin recuperar: no se reportan más
+        self.descartando = False    # recuperar/sincronizar están saltando tokens
+        self.pos_error = -1         # posición del último error reportado
+        self.max_errores = max_errores
 
     def advance(self):
         if self.pos < len(self.tokens) - 1:
@@ -195,27 +267,70 @@ class Parser:
         return self.current.type in types_
 
     def reportar_error(self, msg):
-        if not self.en_panico:
-            texto = f"[L{self.current.line}] {msg} — encontrado '{self.current.lexeme}'"
-            self.errores.append(texto)
+        if self.en_panico:
+            return
+        self.en_panico = True
+        if self.pos == self.pos_error:
+            return  # mismo token que el error anterior: es una cascada
+        self.pos_error = self.pos
+        texto = f"[L{self.current.line}] {msg} — encontrado '{self.current.lexeme}'"
+        self.errores.append(texto)
+        self.contar_error(self.current.line)
+
+    def contar_error(self, linea):
+        """Detiene el análisis (AnalisisDetenido) al llegar a max_errores."""
+        if self.max_errores and len(self.errores) >= self.max_errores:
+            self.errores.append(f"[L{linea}] Se alcanzó el máximo de {self.max_errores} errores; "
+                                f"análisis detenido")
+            raise AnalisisDetenido
 
     def sincronizar(self, *sync_tokens):
-        self.en_panico = True
+        self.en_panico = self.descartando = True
         while self.current.lexeme not in sync_tokens and self.current.type != "EOF":
             self.advance()
+        self.en_panico = self.descartando = False
+
+    def recuperar(self, produccion):
+        """
+        Fin de `produccion` (ver SINCRONIZACION): si quedó un error pendiente
+        y la producción no se cerró con su terminador, descarta tokens hasta
+        el terminador (y lo consume) o hasta uno de sus siguientes.
+        """
+        if not self.en_panico:
+            return
+        terminador, siguientes = SINCRONIZACION[produccion]
+        if self.pos == 0 or self.tokens[self.pos - 1].lexeme != terminador:
+            self.descartando = True
+            while (self.current.lexeme != terminador and self.current.lexeme not in siguientes
+                   and self.current.type != "EOF"):
+                self.advance()
+            if self.current.lexeme == terminador:
+                self.advance()
+            self.descartando = False
         self.en_panico = False
 
     # ============================================================
     # PROGRAMA PRINCIPAL - Página 1
     # ============================================================
-    def parse(self):
-        self.PROG()
-        self.mostrar_reporte()
+    def parse(self, reporte=True):
+        """
+        Analiza la lista de tokens. Con reporte=True (por defecto) imprime el
+        resultado y genera Errores_Sintácticos.txt; con reporte=False solo
+        deja los mensajes en self.errores (sin E/S).
+        """
+        try:
+            self.PROG()
+        except AnalisisDetenido:
+            pass
+        if reporte:
+            self.mostrar_reporte()
+        return self.errores
 
     def PROG(self):
         self.consume(lex="clase", msg="Se esperaba 'clase'")
         self.consume(type_="ID_ARROBA", msg="Se esperaba identificador de clase (@id)")
         self.consume(lex="{", msg="Falta '{' después de clase")
+        self.recuperar("ENCABEZADO")
 
         while self.check_lex("var"):
             self.VAR()
@@ -235,6 +350,7 @@ class Parser:
             self.advance()
             self.ID_ARREGLO(msg="Falta identificador después de ','")
         self.consume(lex=";", msg="Falta ';' al final de la declaración de variable")
+        self.recuperar("VAR")
 
     def ID_ARREGLO(self, msg="Se esperaba identificador"):
         if not self.check_type(*self.ID_TYPES):
@@ -269,6 +385,7 @@ class Parser:
 
         self.consume(lex=")", msg="Falta ')' en definición de método")
         self.consume(lex="{", msg="Falta '{' en cuerpo del método")
+        self.recuperar("ENCABEZADO")
 
         while self.check_lex("var"):
             self.VAR()
@@ -277,6 +394,7 @@ class Parser:
             self.ESTATUTO()
 
         self.consume(lex="}", msg="Falta '}' al final del método")
+        self.recuperar("METODO")
 
     def PARAM(self):
         self.ID_ARREGLO(msg="Se esperaba identificador de parámetro")
@@ -316,6 +434,7 @@ class Parser:
         else:
             self.reportar_error("Estatuto no reconocido")
             self.sincronizar(";", "}")
+        self.recuperar("ESTATUTO")
 
     def ASIGNA(self):
         self.ID_ARREGLO(msg="Se esperaba identificador en asignación")
@@ -399,6 +518,7 @@ class Parser:
         self.CONDICION()
         self.consume(lex=")", msg="Falta ')' en 'si'")
         self.consume(lex="{", msg="Falta '{' en bloque 'si'")
+        self.recuperar("ENCABEZADO")
         while self.es_inicio_estatuto():
             self.ESTATUTO()
         self.consume(lex="}", msg="Falta '}' al final del bloque 'si'")
@@ -406,6 +526,7 @@ class Parser:
         if self.check_lex("sino"):
             self.advance()
             self.consume(lex="{", msg="Falta '{' en bloque 'sino'")
+            self.recuperar("ENCABEZADO")
             while self.es_inicio_estatuto():
                 self.ESTATUTO()
             self.consume(lex="}", msg="Falta '}' al final de bloque 'sino'")
@@ -413,6 +534,7 @@ class Parser:
     def REPITE(self):
         self.consume(lex="repite")
         self.consume(lex="{", msg="Falta '{' en 'repite'")
+        self.recuperar("ENCABEZADO")
         while self.es_inicio_estatuto():
             self.ESTATUTO()
         self.consume(lex="}", msg="Falta '}' en 'repite'")
@@ -428,6 +550,7 @@ class Parser:
         self.CONDICION()
         self.consume(lex=")", msg="Falta ')' en 'mientras'")
         self.consume(lex="{", msg="Falta '{' en 'mientras'")
+        self.recuperar("ENCABEZADO")
         while self.es_inicio_estatuto():
             self.ESTATUTO()
         self.consume(lex="}", msg="Falta '}' al final de 'mientras'")
@@ -461,6 +584,7 @@ class Parser:
             self.advance()
         self.consume(lex=")", msg="Falta ')' en 'switch'")
         self.consume(lex="{", msg="Falta '{' en 'switch'")
+        self.recuperar("ENCABEZADO")
 
         while self.check_lex("encaso"):
             self.advance()
@@ -469,6 +593,7 @@ class Parser:
             else:
                 self.advance()
             self.consume(lex=":", msg="Falta ':' después de 'encaso'")
+            self.recuperar("ENCASO")
             while self.es_inicio_estatuto():
                 self.ESTATUTO()
 
@@ -523,38 +648,118 @@ class Parser:
         self.consume(lex=";", msg="Falta ';' al final de 'salir'")
 
     def mostrar_reporte(self):
-        if not self.errores:
-            print("Analisis sintactico completado SIN ERRORES\n")
-        else:
-            print(f"\n{'='*60}")
-            print(f"ANúLISIS SINTÁCTICO - {len(self.errores)} error(es) encontrado(s)")
-            print(f"{'='*60}\n")
-            for err in self.errores:
-                print(err)
-            print()
-
-        with open("Errores_Sintácticos.txt", "w", encoding="utf-8") as f:
-            if not self.errores:
-                f.write("Análisis sintáctico completado SIN ERRORES\n")
-            else:
-                f.write(f"ANÁLISIS SINTÁCTICO - {len(self.errores)} error(es) encontrado(s)\n")
-                f.write("=" * 60 + "\n\n")
-                for err in self.errores:
-                    f.write(err + "\n")
+        mostrar_reporte(self.errores)
+
+
+def mostrar_reporte(errores):
+    """Imprime el resultado y genera Errores_Sintácticos.txt."""
+    if not errores:
+        print("Analisis sintactico completado SIN ERRORES\n")
+    else:
+        print(f"\n{'='*60}")
+        print(f"ANúLISIS SINTÁCTICO - {len(errores)} error(es) encontrado(s)")
+        print(f"{'='*60}\n")
+        for err in errores:
+            print(err)
+        print()
+
+    escribir_reporte(errores)
+
+
+def texto_reporte(errores):
+    """Contenido de Errores_Sintácticos.txt para la lista de errores dada."""
+    if not errores:
+        return "Análisis sintáctico completado SIN ERRORES\n"
+    partes = [f"ANÁLISIS SINTÁCTICO - {len(errores)} error(es) encontrado(s)\n",
+              "=" * 60 + "\n\n"]
+    partes.extend(err + "\n" for err in errores)
+    return "".join(partes)
+
+
+def escribir_reporte(errores, ruta="Errores_Sintácticos.txt"):
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write(texto_reporte(errores))
 
 def main():
+    import argparse
     import sys
 
-    if len(sys.argv) < 2:
-        print("Uso: python analizador_sintactico.py <tokens.txt>")
-        sys.exit(1)
-
-    ruta = sys.argv[1]
+    ap = argparse.ArgumentParser(prog="analizador_sintactico.py", description="Analizador sintáctico")
+    ap.add_argument("ruta", metavar="tokens.txt|tokens.bin",
+                    help="Tabla de tokens (o, con --fuente, el programa fuente)")
+    ap.add_argument("--fuente", action="store_true",
+                    help="La ruta es un programa fuente: léxico y sintáctico en memoria, sin Tokens.txt")
+    ap.add_argument("--semantico", action="store_true",
+                    help="Hacer también el análisis semántico (Errores_Semánticos.txt)")
+    ap.add_argument("--max-errores", type=int, default=MAX_ERRORES, metavar="N",
+                    help=f"Errores sintácticos antes de detener el análisis (0: sin límite, default {MAX_ERRORES})")
+    ap.add_argument("--sin-cache", action="store_true",
+                    help="No consultar ni llenar la caché de resultados")
+    args = ap.parse_args()
+    if args.max_errores < 0:
+        ap.error("--max-errores debe ser 0 o mayor")
+
+    ruta = args.ruta
+    # La caché guarda resultados con el máximo por defecto
+    usar_cache = not args.sin_cache and args.max_errores == MAX_ERRORES
 
     try:
+        # Imports diferidos: estos módulos importan este
+        import semantico
+        from analizador import parsear
+        from tabla_binaria import es_tabla_binaria, TablaBinaria
+
+        def analizar(tokens):
+            # (errores sintácticos, errores semánticos o None)
+            if args.semantico:
+                return semantico.analizar_tokens(tokens, args.max_errores)
+            return parsear(tokens, max_errores=args.max_errores), None
+
+        def reportar(sintacticos, semanticos):
+            mostrar_reporte(sintacticos)
+            if semanticos is not None:
+                semantico.mostrar_reporte(semanticos)
+
+        if args.fuente:
+            # Léxico y sintáctico en memoria, sin pasar por Tokens.txt
+            with open(ruta, encoding="utf-8") as f:
+                codigo = f.read()
+            if usar_cache:
+                from cache import analizar_con_cache
+                res = analizar_con_cache(codigo, semantico=args.semantico)
+                reportar(res.errores_sintacticos, res.errores_semanticos)
+            else:
+                from lexer import scan
+                tokens, _ = scan(codigo, motor="regex")
+                reportar(*analizar(tokens))
+            return
+        if es_tabla_binaria(ruta):
+            # Tokens.bin: se mapea en memoria y se analiza sin convertir registros
+            with TablaBinaria(ruta) as tabla:
+                print(f"{len(tabla)} tokens cargados correctamente desde {ruta}\n")
+                resultado = analizar(tabla)
+            reportar(*resultado)
+            return
+
+        cache = None
+        tipo = "tabla-semantico" if args.semantico else "tabla"
+        if usar_cache:
+            # Import diferido: cache importa este módulo
+            from cache import CacheResultados, DESACTIVADA
+            from analizador import Resultado
+            if not DESACTIVADA:
+                cache = CacheResultados()
+                with open(ruta, encoding="utf-8") as f:
+                    tabla = f.read()
+                res = cache.obtener(tabla, tipo)
+                if res is not None:
+                    reportar(res.errores_sintacticos, res.errores_semanticos)
+                    return
         tokens = cargar_tokens_desde_tabla(ruta)
-        parser = Parser(tokens)
-        parser.parse()
+        sintacticos, semanticos = analizar(tokens)
+        reportar(sintacticos, semanticos)
+        if cache is not None:
+            cache.guardar(tabla, Resultado([], [], sintacticos, semanticos), tipo)
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo '{ruta}'")
         sys.exit(1)
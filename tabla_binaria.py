@@ -0,0 +1,191 @@
+# tabla_binaria.py
+# Tabla de tokens binaria (Tokens.bin): encabezado, un registro fijo de
+# 4 int32 por token (código, línea, columna, inicio del lexema) y al final el
+# pool de lexemas en UTF-8. Se carga con mmap: los arreglos son vistas sobre
+# el archivo, sin copiar ni convertir registro por registro.
+import mmap
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import chain, islice
+
+from token_stream import TokenStream
+
+MAGIA = b"TOKB"
+VERSION = 1
+# magia, versión, reservado, número de tokens, bytes del pool
+ENCABEZADO = struct.Struct("<4sHHQQ")
+CAMPOS = 4                       # int32 por registro
+TAM_REGISTRO = 4 * CAMPOS
+_LIMITE_POOL = 2 ** 31 - 1       # los desplazamientos son int32
+
+_GRANDE = sys.byteorder == "big"  # el archivo siempre es little-endian
+
+
+def es_tabla_binaria(ruta):
+    with open(ruta, "rb") as f:
+        return f.read(len(MAGIA)) == MAGIA
+
+
+class EscritorTablaBinaria:
+    """
+    Escribe Tokens.bin conforme llegan los tokens: los registros van directo
+    al archivo y el pool de lexemas a un temporal que se anexa al cerrar.
+    """
+
+    def __init__(self, ruta, tam_buffer=1 << 16):
+        self.ruta = ruta
+        self.f = open(ruta, "wb")
+        self.f.write(ENCABEZADO.pack(MAGIA, VERSION, 0, 0, 0))
+        self.pool = tempfile.TemporaryFile()
+        self.n = 0
+        self.tam_pool = 0
+        self.tam_buffer = tam_buffer
+        self._registros = array('i')
+
+    def agregar(self, codigo, linea, columna, lexema):
+        datos = lexema.encode("utf-8", "surrogatepass")
+        if self.tam_pool + len(datos) > _LIMITE_POOL:
+            raise ValueError("El pool de lexemas excede 2 GB")
+        self._registros.extend((codigo, linea, columna, self.tam_pool))
+        self.pool.write(datos)
+        self.tam_pool += len(datos)
+        self.n += 1
+        if len(self._registros) >= self.tam_buffer:
+            self._vaciar()
+
+    def agregar_token(self, t):
+        self.agregar(t.codigo, t.linea, t.columna, t.lexema)
+
+    def _vaciar(self):
+        if _GRANDE:
+            self._registros.byteswap()
+        self._registros.tofile(self.f)
+        self._registros = array('i')
+
+    def cerrar(self):
+        self._vaciar()
+        self.pool.seek(0)
+        while True:
+            bloque = self.pool.read(1 << 20)
+            if not bloque:
+                break
+            self.f.write(bloque)
+        self.pool.close()
+        self.f.seek(0)
+        self.f.write(ENCABEZADO.pack(MAGIA, VERSION, 0, self.n, self.tam_pool))
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
+
+
+def escribir_tabla_binaria(tokens, ruta="Tokens.bin"):
+    with EscritorTablaBinaria(ruta) as esc:
+        for t in tokens:
+            esc.agregar_token(t)
+
+
+class TablaBinaria(TokenStream):
+    """
+    Tokens.bin abierto con mmap: un token_stream.TokenStream cuyas columnas
+    (codigos, lineas, columnas, inicios) son vistas sobre el archivo y cuyos
+    lexemas salen del pool, así que Parser, ParserCodigos y las tablas lo
+    consumen directamente.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self._f = open(ruta, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magia, version, _, n, tam_pool = ENCABEZADO.unpack_from(self._mm, 0)
+        if magia != MAGIA or version != VERSION:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es una tabla de tokens binaria (versión {VERSION})")
+        self.n = n
+        inicio_pool = ENCABEZADO.size + n * TAM_REGISTRO
+        if inicio_pool + tam_pool > len(self._mm):
+            self.cerrar()
+            raise ValueError(f"{ruta} está truncado")
+
+        vista = memoryview(self._mm)
+        if _GRANDE:
+            # Único caso con copia: la plataforma no es little-endian
+            registros = array('i', vista[ENCABEZADO.size:inicio_pool])
+            registros.byteswap()
+            registros = memoryview(registros)
+        else:
+            registros = vista[ENCABEZADO.size:inicio_pool].cast('i')
+        # Columnas como vistas con paso: registros[k::4] no copia datos
+        self.codigos = registros[0::CAMPOS]
+        self.lineas = registros[1::CAMPOS]
+        self.columnas = registros[2::CAMPOS]
+        self.inicios = registros[3::CAMPOS]
+        self._pool = vista[inicio_pool:inicio_pool + tam_pool]
+        self._vistas = [vista, registros]
+
+    def __len__(self):
+        return self.n
+
+    def lexema(self, i):
+        a = self.inicios[i]
+        b = self.inicios[i + 1] if i + 1 < self.n else len(self._pool)
+        return str(self._pool[a:b], "utf-8", "surrogatepass")
+
+    def lexemas(self):
+        # Cada lexema termina donde empieza el siguiente
+        pool = self._pool
+        finales = chain(islice(self.inicios, 1, None), (len(pool),))
+        return (str(pool[a:b], "utf-8", "surrogatepass") for a, b in zip(self.inicios, finales))
+
+    def cerrar(self):
+        if getattr(self, "_mm", None) is None:
+            return
+        # Las vistas deben soltarse antes de cerrar el mmap
+        for nombre in ("codigos", "lineas", "columnas", "inicios", "_pool"):
+            v = self.__dict__.pop(nombre, None)
+            if v is not None:
+                v.release()
+        for v in reversed(getattr(self, "_vistas", [])):
+            v.release()
+        self._vistas = []
+        self._mm.close()
+        self._mm = None
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
+
+
+def exportar_texto(tabla, ruta="Tokens.txt"):
+    """Exporta la tabla binaria al formato de texto de siempre (Tokens.txt)."""
+    from analizador import escribir_tabla_tokens
+    escribir_tabla_tokens(tabla, ruta)
+
+
+def main():
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Tabla de tokens binaria")
+    ap.add_argument("tabla", help="Archivo Tokens.bin")
+    ap.add_argument("--texto", metavar="RUTA", help="Exportar como tabla de texto (Tokens.txt)")
+    args = ap.parse_args()
+
+    with TablaBinaria(args.tabla) as tabla:
+        print(f"{len(tabla)} tokens en {args.tabla}")
+        if args.texto:
+            exportar_texto(tabla, args.texto)
+            print(f"Tabla de texto exportada a {args.texto}")
+
+
+if __name__ == "__main__":
+    main()
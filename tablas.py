@@ -0,0 +1,194 @@
+# tablas.py
+# Escritura de Tokens.txt y Errores.txt compartida por main.py, el GUI y
+# analizador.exportar. El formato es exactamente el de siempre (mismas
+# f-strings); lo que cambia es cómo se produce:
+#   - el prefijo "lexema + código + PTS" de cada lexema se formatea una vez
+#     y se reutiliza (las palabras reservadas y operadores vienen listos),
+#   - el sufijo de línea se reutiliza mientras no cambie la línea,
+#   - las filas se juntan en lotes y se escriben con writelines sobre un
+#     buffer grande.
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from token_type import TokenCodes
+
+ENCABEZADO_TOKENS = f"{'Lexema':<25}{'Token':<15}{'PTS':<10}{'Línea':<10}\n"
+ENCABEZADO_ERRORES = f"{'Lexema':<25}{'Descripción':<80}{'Línea':<10}\n"
+
+TAM_LOTE = 1 << 14          # filas por writelines
+TAM_BUFFER = 1 << 20        # buffer del archivo
+MAX_PREFIJOS = 1 << 18      # lexemas distintos recordados antes de vaciar la memo
+
+_CODIGOS_ID = frozenset((-55, -56, -57, -58))
+
+
+def prefijo_token(lexema, codigo):
+    """Primeras tres columnas de una fila de Tokens.txt."""
+    # Identificar si es un identificador (según el código de token)
+    pts = -2 if codigo in _CODIGOS_ID else -1
+    return f"{lexema:<25}{codigo:<15}{pts:<10}"
+
+
+# Lexemas fijos (palabras reservadas, operadores y delimitadores) ya formateados
+PREFIJOS_FIJOS = {lex: (cod, prefijo_token(lex, cod))
+                  for lex, cod in TokenCodes.MAP.items() if -50 <= cod <= -1}
+
+
+def ternas(tokens):
+    """Iterador de (lexema, código, línea) de una secuencia de tokens."""
+    if hasattr(tokens, "codigos"):
+        # Columnar (token_stream.TokenStream): sin materializar Token
+        return zip(tokens.lexemas(), tokens.codigos, tokens.lineas)
+    return ((t.lexema, t.codigo, t.linea) for t in tokens)
+
+
+class FormateadorTokens:
+    """Convierte tokens en filas de Tokens.txt reutilizando lo ya formateado."""
+
+    def __init__(self):
+        self.prefijos = dict(PREFIJOS_FIJOS)   # lexema -> (código, prefijo)
+        self._linea = None
+        self._sufijo = None
+
+    def filas(self, tokens):
+        """Lista de filas para lexer.Token (o cualquier objeto con lexema/codigo/linea)."""
+        return self.filas_de(ternas(tokens))
+
+    def filas_de(self, datos):
+        """Lista de filas para un iterable de (lexema, código, línea)."""
+        prefijos = self.prefijos
+        if len(prefijos) > MAX_PREFIJOS:
+            prefijos.clear()
+            prefijos.update(PREFIJOS_FIJOS)
+        linea_previa, sufijo = self._linea, self._sufijo
+        salida = []
+        agregar = salida.append
+        for lexema, codigo, linea in datos:
+            par = prefijos.get(lexema)
+            if par is None or par[0] != codigo:
+                par = prefijos[lexema] = (codigo, prefijo_token(lexema, codigo))
+            if linea != linea_previa:
+                linea_previa = linea
+                sufijo = f"{linea:<10}\n"
+            agregar(par[1] + sufijo)
+        self._linea, self._sufijo = linea_previa, sufijo
+        return salida
+
+
+class FormateadorErrores:
+    """Filas de Errores.txt; las descripciones se repiten y se rellenan una vez."""
+
+    def __init__(self):
+        self.descripciones = {}
+
+    def filas(self, errores):
+        descripciones = self.descripciones
+        salida = []
+        for e in errores:
+            desc = descripciones.get(e.descripcion)
+            if desc is None:
+                desc = descripciones[e.descripcion] = f"{e.descripcion:<80}"
+            salida.append(f"{e.lexema:<25}{desc}{e.linea:<10}\n")
+        return salida
+
+
+def _abrir(ruta):
+    return open(ruta, "w", encoding="utf-8", buffering=TAM_BUFFER)
+
+
+def escribir_tabla_tokens(tokens, ruta="Tokens.txt", avance=None):
+    """avance, si se da, se llama con las filas escritas tras cada lote."""
+    formateador = FormateadorTokens()
+    with _abrir(ruta) as f:
+        f.write(ENCABEZADO_TOKENS)
+        pendientes = ternas(tokens)
+        escritas = 0
+        while True:
+            lote = formateador.filas_de(islice(pendientes, TAM_LOTE))
+            if not lote:
+                break
+            f.writelines(lote)
+            if avance is not None:
+                escritas += len(lote)
+                avance(escritas)
+
+
+def escribir_tabla_errores(errores, ruta="Errores.txt"):
+    with _abrir(ruta) as f:
+        f.write(ENCABEZADO_ERRORES)
+        f.writelines(FormateadorErrores().filas(errores))
+
+
+def escribir_tablas(tokens, errores, ruta_tokens="Tokens.txt", ruta_errores="Errores.txt",
+                    concurrente=True, avance=None):
+    """
+    Escribe ambas tablas. Con concurrente=True la de errores se escribe en
+    otro hilo mientras se forma la de tokens (se solapa la E/S). avance: ver
+    escribir_tabla_tokens.
+    """
+    if not concurrente:
+        escribir_tabla_tokens(tokens, ruta_tokens, avance)
+        escribir_tabla_errores(errores, ruta_errores)
+        return
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        pendiente = ex.submit(escribir_tabla_errores, errores, ruta_errores)
+        escribir_tabla_tokens(tokens, ruta_tokens, avance)
+        pendiente.result()
+
+
+class EscritorTablas:
+    """
+    Escritura incremental de las tablas (main.py, por bloques): los tokens y
+    errores se acumulan y se vuelcan en lotes de TAM_LOTE filas. Una ruta en
+    None omite esa tabla.
+    """
+
+    def __init__(self, ruta_tokens="Tokens.txt", ruta_errores="Errores.txt"):
+        # Si no se puede abrir la segunda tabla, la primera no queda abierta
+        with contextlib.ExitStack() as pila:
+            self.f_tok = pila.enter_context(_abrir(ruta_tokens)) if ruta_tokens else None
+            self.f_err = pila.enter_context(_abrir(ruta_errores)) if ruta_errores else None
+            self._archivos = pila.pop_all()
+        if self.f_tok:
+            self.f_tok.write(ENCABEZADO_TOKENS)
+        if self.f_err:
+            self.f_err.write(ENCABEZADO_ERRORES)
+        self._fmt_tok = FormateadorTokens()
+        self._fmt_err = FormateadorErrores()
+        self._tokens = []
+        self._errores = []
+
+    def agregar_token(self, t):
+        if self.f_tok:
+            self._tokens.append(t)
+            if len(self._tokens) >= TAM_LOTE:
+                self._vaciar_tokens()
+
+    def agregar_error(self, e):
+        if self.f_err:
+            self._errores.append(e)
+            if len(self._errores) >= TAM_LOTE:
+                self._vaciar_errores()
+
+    def _vaciar_tokens(self):
+        self.f_tok.writelines(self._fmt_tok.filas(self._tokens))
+        self._tokens = []
+
+    def _vaciar_errores(self):
+        self.f_err.writelines(self._fmt_err.filas(self._errores))
+        self._errores = []
+
+    def cerrar(self):
+        with self._archivos:
+            if self.f_tok:
+                self._vaciar_tokens()
+            if self.f_err:
+                self._vaciar_errores()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
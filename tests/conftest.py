@@ -0,0 +1,28 @@
+# Los módulos del analizador viven en la raíz del repositorio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _anidado(n):
+    """Programa válido con una expresión de n paréntesis anidados."""
+    return ("clase @P\n{\n var %x ;\n metodo vacio @main ( )\n {\n  %x = "
+            + "(" * n + "1" + ")" * n + " ;\n }\n}\n")
+
+
+@pytest.fixture
+def anidado():
+    return _anidado
+
+
+@pytest.fixture
+def sin_cache(monkeypatch, tmp_path):
+    """Caché por omisión en un directorio temporal (nunca la del usuario)."""
+    import cache
+    monkeypatch.setattr(cache, "DIR_DEFAULT", str(tmp_path / "cache"))
+    monkeypatch.setattr(cache, "DESACTIVADA", False)
+    monkeypatch.setattr(cache, "_tamanos", {})
+    return cache
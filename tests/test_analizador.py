@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+import analizador
+import sintactic
+from lexer import scan
+
+CODIGO = ("clase @P\n{\n var %x ;\n metodo vacio @main ( )\n {\n  %x = 1 +\n"
+          "  si ( %x > ) { }\n }\n}\n")
+
+
+def test_analyze_igual_a_la_tabla(tmp_path):
+    # Léxico -> sintáctico en memoria da lo mismo que pasar por Tokens.txt
+    res = analizador.analyze(CODIGO)
+    ruta = str(tmp_path / "Tokens.txt")
+    analizador.escribir_tabla_tokens(res.tokens, ruta)
+    parser = sintactic.Parser(sintactic.cargar_tokens_desde_tabla(ruta))
+    assert res.errores_sintacticos == parser.parse(reporte=False) != []
+
+
+def test_parsear_max_errores():
+    tokens, _ = scan(CODIGO * 5, motor="regex")
+    assert len(analizador.parsear(tokens, max_errores=2)) == 3   # + aviso de detención
+    assert analizador.parsear(tokens, max_errores=2) == \
+           analizador.parsear(tokens, iterativo=True, max_errores=2)
+
+
+def _main(monkeypatch, *args):
+    monkeypatch.setattr(sys, "argv", ["sintactic.py", *args])
+    sintactic.main()
+
+
+def test_main_sin_semantico_por_omision(tmp_path, monkeypatch, sin_cache):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "p.txt").write_text(CODIGO, encoding="utf-8")
+    _main(monkeypatch, "--fuente", "p.txt")
+    assert os.path.exists("Errores_Sintácticos.txt")
+    assert not os.path.exists("Errores_Semánticos.txt")
+    _main(monkeypatch, "--fuente", "p.txt", "--semantico", "--max-errores", "1", "--sin-cache")
+    assert os.path.exists("Errores_Semánticos.txt")
+    with open("Errores_Sintácticos.txt", encoding="utf-8") as f:
+        assert "máximo de 1 errores" in f.read()
+
+
+@pytest.mark.parametrize("valor", ["x", "-1"])
+def test_main_max_errores_invalido(monkeypatch, valor):
+    with pytest.raises(SystemExit) as salida:
+        _main(monkeypatch, "Tokens.txt", f"--max-errores={valor}")
+    assert salida.value.code == 2
@@ -0,0 +1,36 @@
+from arbol import NINGUNO, ParserAST, ParserASTIterativo, construir_arbol
+from lexer import scan
+
+CODIGO = "clase @P\n{\n var %x ;\n metodo vacio @m ( )\n {\n  %x = 1 + 2 ;\n }\n}\n"
+# Más anidado que el límite de recursión de Python
+PROFUNDO = 5000
+
+
+def test_arena():
+    arbol, errores = construir_arbol(scan(CODIGO, motor="regex")[0])
+    assert errores == []
+    assert arbol.a_texto().splitlines()[:4] == [
+        "PROG  [L1]", "  ID_ARROBA @P  [L1]", "  VAR  [L3]", "    ID_PORC %x  [L3]"]
+    # Un arreglo por campo; el preorden visita cada nodo una vez
+    assert arbol.tipos.typecode == "b" and arbol.primer_hijo.typecode == "i"
+    assert sorted(arbol.recorrer()) == list(range(len(arbol)))
+    hojas = [n for n in arbol.recorrer() if arbol.es_hoja(n)]
+    assert all(arbol.primer_hijo[n] == NINGUNO for n in hojas)
+    assert [arbol.lexemas[n] for n in hojas][-3:] == ["1", "+", "2"]
+
+
+def test_construir_arbol_sin_limite(anidado):
+    tokens, _ = scan(anidado(PROFUNDO), motor="regex")
+    arbol, errores = construir_arbol(tokens)
+    assert errores == []
+    assert len(arbol) > 0
+
+
+def test_arbol_iterativo_igual_al_recursivo(anidado):
+    for codigo in (anidado(40), anidado(40).replace(")", "", 3)):
+        tokens, _ = scan(codigo, motor="regex")
+        a, b = ParserAST(tokens), ParserASTIterativo(tokens)
+        a.parse(reporte=False)
+        b.parse(reporte=False)
+        assert a.errores == b.errores
+        assert a.arbol.a_texto() == b.arbol.a_texto()
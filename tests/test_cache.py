@@ -0,0 +1,65 @@
+from analizador import analyze
+
+
+def _fuente(i):
+    return f"clase @P {{ var %x ; metodo vacio @m() {{ %x = {i} ; }} }}\n" * 20
+
+
+def test_acierto_igual_al_analisis(tmp_path, sin_cache):
+    almacen = sin_cache.CacheResultados(str(tmp_path))
+    codigo = _fuente(1) + "%x = = ;"
+    esperado = analyze(codigo)
+    primero = sin_cache.analizar_con_cache(codigo, almacen)
+    segundo = sin_cache.analizar_con_cache(codigo, almacen)
+    assert (almacen.fallos, almacen.aciertos) == (1, 1)
+    for res in (primero, segundo):
+        assert [(t.lexema, t.codigo, t.linea, t.columna) for t in res.tokens] == \
+               [(t.lexema, t.codigo, t.linea, t.columna) for t in esperado.tokens]
+        assert res.errores_sintacticos == esperado.errores_sintacticos
+
+
+def test_solo_lexico_no_parsea(tmp_path, sin_cache, monkeypatch):
+    def falla(*args, **kwargs):
+        raise AssertionError("no debe parsear")
+
+    monkeypatch.setattr(sin_cache, "analyze", falla)
+    almacen = sin_cache.CacheResultados(str(tmp_path))
+    res = sin_cache.analizar_con_cache("clase @P {", almacen, sintactico=False)
+    assert len(res.tokens) == 3 and res.errores_sintacticos == []
+
+
+def test_poda_sin_recorrer_en_cada_escritura(tmp_path, sin_cache):
+    almacen = sin_cache.CacheResultados(str(tmp_path), tam_maximo=64 * 1024)
+    recorridos = []
+    entradas = almacen.entradas
+    almacen.entradas = lambda: recorridos.append(1) or entradas()
+    n = 400
+    for i in range(n):
+        codigo = _fuente(i)
+        almacen.guardar(codigo, analyze(codigo))
+    total = sum(tam for _, tam, _ in entradas())
+    assert total <= almacen.tam_maximo
+    assert sin_cache._tamanos[str(tmp_path)][0] == total
+    assert len(recorridos) < n // 2
+
+
+def test_version_cubre_los_modulos_del_analisis():
+    import os
+    import subprocess
+    import sys
+    import cache
+
+    # Módulos del repositorio que carga analyze() con análisis semántico, en
+    # un proceso limpio (aquí ya están importados los de otras pruebas)
+    raiz = os.path.dirname(os.path.abspath(cache.__file__))
+    programa = ("import os, sys, analizador\n"
+                "analizador.analyze('clase @P { }', semantico=True)\n"
+                "raiz = os.path.abspath('.')\n"
+                "print(' '.join(n for n, m in list(sys.modules.items()) if getattr(m, '__file__', None)"
+                " and os.path.dirname(os.path.abspath(m.__file__)) == raiz))\n")
+    salida = subprocess.run([sys.executable, "-c", programa], cwd=raiz, capture_output=True,
+                            text=True, check=True).stdout
+    # Solo miden o dan formato: no cambian el resultado guardado
+    ajenos = {"instrumentacion", "tablas"}
+    assert set(salida.split()) - ajenos <= set(cache.MODULOS_ANALISIS)
+    assert {"parser_iterativo", "analizador", "lexer_numpy"} <= set(cache.MODULOS_ANALISIS)
@@ -0,0 +1,28 @@
+import random
+
+import fuzz
+
+
+def test_implementaciones_coinciden():
+    rnd = random.Random(3)
+    for tam in (50, 400):
+        for entrada in (fuzz.entrada_aleatoria(rnd, tam), fuzz.entrada_gramatica(rnd, tam)):
+            assert fuzz.diferencias(entrada) == []
+            assert fuzz.diferencias(fuzz.mutar(rnd, entrada)) == []
+
+
+def test_detecta_discrepancias(monkeypatch):
+    # Un motor que pierde el error de '¿' es una discrepancia "<motor>:errores"
+    def roto(texto, primera_linea, tokens, errores):
+        fuzz.MOTORES["clasico"](texto, primera_linea, tokens, errores)
+        errores[:] = [e for e in errores if e.lexema != "¿"]
+
+    monkeypatch.setitem(fuzz.MOTORES, "roto", roto)
+    claves = [clave for clave, _ in fuzz.diferencias("clase @P { ¿ }", motores=["roto"])]
+    assert claves == ["roto:errores"]
+
+
+def test_minimizar():
+    texto = "clase @P\n{\n var %x ;\n ¿\n metodo vacio @m ( ) { }\n}\n"
+    assert fuzz.minimizar(texto, lambda t: "¿" in t) == "¿"
+    assert fuzz.ddmin(list(range(20)), lambda xs: {3, 17} <= set(xs)) == [3, 17]
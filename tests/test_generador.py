@@ -0,0 +1,24 @@
+from analizador import analyze
+from benchmark import comparar_con_base
+from generador import generar_programa
+
+
+def test_programa_valido_y_reproducible():
+    codigo = generar_programa(metodos=5, profundidad=4, semilla=2)
+    assert codigo == generar_programa(metodos=5, profundidad=4, semilla=2)
+    res = analyze(codigo)
+    assert res.errores_lexicos == [] and res.errores_sintacticos == []
+    assert {"si", "mientras", "repite", "switch", "ejecutar"} <= {t.lexema for t in res.tokens}
+
+
+def test_tasa_de_errores():
+    res = analyze(generar_programa(metodos=5, tasa_errores=0.3, semilla=2))
+    assert res.errores_lexicos and res.errores_sintacticos
+
+
+def test_comparar_con_base():
+    base = {"fases": {"lexer": {"tokens_seg": 1000.0}, "parser": {"tokens_seg": 500.0}}}
+    resultado = {"fases": {"lexer": {"tokens_seg": 950.0}, "parser": {"tokens_seg": 300.0},
+                           "nueva": {"tokens_seg": 1.0}}}
+    regresiones = comparar_con_base(resultado, base, tolerancia=0.1)
+    assert len(regresiones) == 1 and regresiones[0].startswith("parser:")
@@ -0,0 +1,81 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import parser_codigos
+
+pytest.importorskip("tkinter")
+import gui_analizador_bonito as gui  # noqa: E402
+
+CODIGO = "clase @P\n{\n var %x ;\n metodo vacio @m ( )\n {\n  %x = 1 ;\n }\n}\n"
+
+
+def _ventana(tmp_path):
+    # Solo los atributos que usa el trabajo en segundo plano (sin Tk)
+    return SimpleNamespace(ruta_tokens=str(tmp_path / "Tokens.txt"),
+                           ruta_errores_lex=str(tmp_path / "Errores.txt"))
+
+
+def test_analisis_lexico_no_parsea(tmp_path, sin_cache, monkeypatch):
+    def falla(*args, **kwargs):
+        raise AssertionError("la opción 1 no debe parsear")
+
+    monkeypatch.setattr(parser_codigos.ParserCodigos, "parse", falla)
+    ruta = tmp_path / "p.txt"
+    ruta.write_text(CODIGO, encoding="utf-8")
+    for _ in range(2):  # fallo y acierto de caché
+        res = gui.AnalizadorGUI._analizar_en_hilo(_ventana(tmp_path), str(ruta),
+                                                 lambda *a: None, threading.Event())
+        assert len(res.tokens) == 18 and res.errores_semanticos is None
+    assert (tmp_path / "Tokens.txt").exists()
+
+
+class _Alto(Exception):
+    pass
+
+
+def _detener(llamadas):
+    def avance(pos):
+        llamadas.append(pos)
+        raise _Alto()
+    return avance
+
+
+def test_cancelar_escritura(tmp_path, sin_cache):
+    ruta = tmp_path / "p.txt"
+    ruta.write_text(CODIGO, encoding="utf-8")
+    cancelado = threading.Event()
+    fases = []
+
+    def avisar(fase, fraccion, tokens):
+        fases.append(fase)
+        cancelado.set()     # se cancela en cuanto termina el léxico
+
+    with pytest.raises(gui.Cancelado):
+        gui.AnalizadorGUI._analizar_en_hilo(_ventana(tmp_path), str(ruta), avisar, cancelado)
+    assert fases == ["Análisis léxico"]
+
+
+@pytest.mark.parametrize("iterativo", [False, True])
+def test_cancelar_parse(monkeypatch, anidado, iterativo):
+    import arbol
+    from lexer import scan
+    monkeypatch.setattr(arbol, "PASO_AVANCE", 8)
+    tokens, _ = scan(anidado(10), motor="regex")
+    llamadas = []
+    clase = arbol.ParserASTIterativo if iterativo else arbol.ParserAST
+    with pytest.raises(_Alto):
+        clase(tokens, avance=_detener(llamadas)).parse(reporte=False)
+    assert llamadas == [8]
+
+
+def test_cancelar_semantico():
+    import semantico
+    from arbol import construir_arbol
+    from lexer import scan
+    arbol_, _ = construir_arbol(scan(CODIGO * 3, motor="regex")[0])
+    llamadas = []
+    with pytest.raises(_Alto):
+        semantico.analizar_semantica(arbol_, avance=_detener(llamadas))
+    assert len(llamadas) == 1
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from generador import generar_programa
+from incremental import LexerIncremental
+from lexer import scan
+
+
+def _tuplas(tokens, errores):
+    return ([(t.lexema, t.codigo, t.linea, t.columna) for t in tokens],
+            [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores])
+
+
+def test_ediciones_igual_a_scan_completo():
+    rnd = random.Random(5)
+    lineas = generar_programa(metodos=4, tasa_errores=0.2, semilla=5).splitlines()
+    lex = LexerIncremental("\n".join(lineas[:20]))
+    for _ in range(40):
+        inicio = rnd.randint(1, len(lex) + 1)
+        fin = rnd.randint(inicio - 1, min(len(lex), inicio + 3))
+        nuevas = "\n".join(rnd.sample(lineas, rnd.randint(0, 3)))
+        assert lex.editar(inicio, fin, nuevas) == len(nuevas.splitlines())
+        assert _tuplas(*lex.scan()) == _tuplas(*scan(lex.texto(), motor="regex"))
+    tokens, _ = lex.scan()
+    assert [(t.lexema, t.linea) for t in lex.columnas()] == [(t.lexema, t.linea) for t in tokens]
+
+
+def test_lineas_sueltas():
+    lex = LexerIncremental("clase @P\n{\n var %x ;\n}")
+    lex.editar(3, 3, " var %x ¿ ;")
+    assert [t.lexema for t in lex.tokens_linea(3)] == ["var", "%x", ";"]
+    assert [(e.lexema, e.linea) for e in lex.errores_linea(3)] == [("¿", 3)]
+    assert lex.linea(4) == "}"
+
+
+def test_rango_invalido():
+    lex = LexerIncremental("clase @P")
+    with pytest.raises(IndexError):
+        lex.editar(3, 3, "x")
+    with pytest.raises(ValueError):
+        LexerIncremental("", motor="nada")
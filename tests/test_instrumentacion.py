@@ -0,0 +1,64 @@
+from analizador import analyze
+from instrumentacion import Instrumentos
+
+PROGRAMA = "clase @P\n{\n var %x ;\n metodo vacio @m ( )\n {\n  %x = (1 + 2) * 3 ;\n }\n}\n"
+
+
+def test_producciones_de_analyze():
+    with Instrumentos() as ins:
+        analyze(PROGRAMA)
+    producciones = ins.a_dict()["producciones"]
+    assert producciones["PROG"]["llamadas"] == 1
+    assert producciones["OPERANDO"]["llamadas"] > 0
+
+
+def test_producciones_iterativas():
+    with Instrumentos() as ins:
+        analyze(PROGRAMA, iterativo=True)
+    producciones = ins.a_dict()["producciones"]
+    assert producciones["PROG"]["llamadas"] == 1
+    assert producciones["EXP_ARIT"]["llamadas"] > 0
+
+
+def test_restaura_las_clases():
+    from parser_codigos import ParserCodigos
+    antes = ParserCodigos.PROG
+    with Instrumentos():
+        assert ParserCodigos.PROG is not antes
+    assert ParserCodigos.PROG is antes
+
+
+def test_otros_hilos_no_se_miden():
+    import threading
+
+    errores = []
+
+    def otro_hilo():
+        try:
+            for _ in range(20):
+                assert analyze(PROGRAMA, iterativo=True).errores_sintacticos == []
+        except Exception as e:  # noqa: BLE001 - se revisa en el hilo principal
+            errores.append(e)
+
+    with Instrumentos() as ins:
+        hilo = threading.Thread(target=otro_hilo)
+        hilo.start()
+        analyze(PROGRAMA)
+        hilo.join()
+        assert ins._pila == []
+    assert errores == []
+    producciones = ins.a_dict()["producciones"]
+    assert producciones["PROG"]["llamadas"] == 1
+
+
+def test_perfilar_archivo_no_escribe_en_el_directorio_actual(tmp_path, monkeypatch):
+    from instrumentacion import perfilar_archivo
+
+    fuente = tmp_path / "p.txt"
+    fuente.write_text(PROGRAMA, encoding="utf-8")
+    trabajo = tmp_path / "trabajo"
+    trabajo.mkdir()
+    monkeypatch.chdir(trabajo)
+    ins = perfilar_archivo(str(fuente))
+    assert list(trabajo.iterdir()) == []
+    assert ins.a_dict()["fases"]["parse"]["llamadas"] == 1
@@ -0,0 +1,119 @@
+import io
+from itertools import product
+
+import pytest
+
+from generador import generar_programa
+import lexer
+from lexer import _FIJOS, MOTORES, ErrorLexico, iter_scan, scan, scan_bloques
+
+# Casos difíciles a mano: saltos de línea raros, comentarios, cadenas sin
+# cerrar, números mal formados, identificadores largos, caracteres inválidos
+CODIGO = ("clase @P\r\n{\n var %x , $y , &abcdefghi , @a1 ;\x0c metodo vacio @main ( )\n {\n"
+          "  %x = \"hola mundo\" + 3.5 - -2 + 1.e3 + 12.5.3 ; // comentario\n"
+          "  ¿ $y = 7 ; \"sin cerrar\n  %x += %x >= 3 && !( %x != 2 ) || %x == 1 ;\n"
+          "  %x = .5 + 5. + 007 + 1_2 # ;\n }\n}")
+
+FUENTES = [CODIGO, "", "\n\n", generar_programa(metodos=5, tasa_errores=0.2, semilla=7)]
+
+
+def _tuplas(tokens, errores):
+    return ([(t.lexema, t.codigo, t.linea, t.columna) for t in tokens],
+            [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores])
+
+
+@pytest.mark.parametrize("motor", sorted(set(MOTORES) - {"clasico"}))
+@pytest.mark.parametrize("fuente", FUENTES)
+def test_motores_iguales_al_clasico(motor, fuente):
+    assert _tuplas(*scan(fuente, motor=motor)) == _tuplas(*scan(fuente, motor="clasico"))
+
+
+def test_motor_desconocido():
+    with pytest.raises(ValueError):
+        scan("clase @P { }", motor="nada")
+    with pytest.raises(ValueError):
+        next(iter_scan(["clase @P { }"], motor="nada"))
+
+
+def _en_orden(tokens, errores):
+    return sorted(tokens + errores, key=lambda x: (x.linea, x.columna))
+
+
+@pytest.mark.parametrize("tam_bloque", [1, 40, 1 << 16])
+def test_iter_scan_igual_a_scan(tam_bloque):
+    fuente = FUENTES[-1]
+    tokens, errores = scan(fuente)
+    salida = list(iter_scan(io.StringIO(fuente), tam_bloque=tam_bloque))
+    assert [(type(x), x.lexema, x.linea, x.columna) for x in salida] == \
+           [(type(x), x.lexema, x.linea, x.columna) for x in _en_orden(tokens, errores)]
+    assert sum(isinstance(x, ErrorLexico) for x in salida) == len(errores)
+
+
+def test_iter_scan_no_lee_todo_el_archivo():
+    def lineas():
+        yield "clase @P\n"
+        yield "{\n" * (1 << 16)
+        raise AssertionError("se leyó más allá del primer bloque")
+
+    primero = next(iter_scan(lineas(), tam_bloque=8))
+    assert (primero.lexema, primero.linea) == ("clase", 1)
+
+
+@pytest.mark.parametrize("tam_bloque", [1, 40, 1 << 16])
+def test_scan_bloques_igual_a_scan(tam_bloque):
+    fuente = CODIGO
+    tokens, errores, avance = [], [], []
+    for t, e, fin in scan_bloques(fuente, tam_bloque=tam_bloque):
+        tokens += t
+        errores += e
+        avance.append(fin)
+    assert _tuplas(tokens, errores) == _tuplas(*scan(fuente))
+    assert avance == sorted(avance) and avance[-1] == len(fuente)
+
+
+@pytest.mark.parametrize("motor", sorted(MOTORES))
+def test_lexemas_internados(motor):
+    # Los lexemas se arman rebanando el texto: sin internado, cada aparición
+    # sería una cadena distinta
+    fuente = "".join(f"clase %abc {10 + 5} 1.5 <= ;\n" for _ in range(3))
+    tokens, _ = scan(fuente, motor=motor)
+    por_lexema = {}
+    for t in tokens:
+        por_lexema.setdefault(t.lexema, set()).add(id(t.lexema))
+    assert set(por_lexema) == {"clase", "%abc", "15", "1.5", "<=", ";"}
+    assert all(len(ids) == 1 for ids in por_lexema.values())
+    assert all(t.lexema is _FIJOS[t.lexema][0] for t in tokens if t.lexema in _FIJOS)
+
+
+def test_motor_numpy():
+    lexer_numpy = pytest.importorskip("lexer_numpy")
+    assert "numpy" in MOTORES
+    inicios, clases = lexer_numpy.corridas("ab  12+¿\n")
+    assert inicios == [0, 2, 4, 6, 7, 8, 9] and len(clases) == len(inicios) - 1
+    fuente = generar_programa(metodos=20, tasa_errores=0.1, semilla=21)
+    for tam_bloque in (64, 1 << 16):
+        assert [(x.lexema, x.linea, x.columna) for x in iter_scan(io.StringIO(fuente), "numpy", tam_bloque)] == \
+               [(x.lexema, x.linea, x.columna) for x in iter_scan(io.StringIO(fuente), "clasico", tam_bloque)]
+
+
+def test_trie_de_simbolos_igual_al_recorrido_por_longitud():
+    from token_type import TokenCodes
+
+    # Referencia: probar los símbolos del más largo al más corto
+    simbolos = sorted(TokenCodes.ARITMETICOS | TokenCodes.RELACIONALES | TokenCodes.LOGICOS
+                      | TokenCodes.ESPECIALES, key=len, reverse=True)
+    caracteres = sorted(set("".join(simbolos))) + ["a", " "]
+    for n in (1, 2, 3):
+        for texto in map("".join, product(caracteres, repeat=n)):
+            esperado = next(((s, _FIJOS[s][1]) for s in simbolos if texto.startswith(s)), None)
+            assert lexer._simbolo(texto, 0) == esperado, texto
+
+
+def test_categoria_del_primer_caracter():
+    assert lexer.categoria("a") == lexer.CAT_LETRA
+    assert lexer.categoria("ñ") == lexer.CAT_LETRA
+    assert lexer.categoria("٣") == lexer.CAT_DIGITO
+    assert lexer.categoria("¿") == lexer.CAT_SIMBOLO
+    assert all(lexer.categoria(c) == lexer.CAT_OPERADOR for c in "*<>=!|;,()[]{}")
+    assert [lexer.categoria(c) for c in "&+/.\""] == [lexer.CAT_PREFIJO, lexer.CAT_SIGNO, lexer.CAT_BARRA,
+                                                   lexer.CAT_PUNTO, lexer.CAT_COMILLA]
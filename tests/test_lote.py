@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+import lote
+
+
+def test_carpeta_salida_no_escapa():
+    base = os.path.abspath("salida")
+    for ruta in ("../otros/p.txt", "../../p.txt", "/abs/dir/p.txt", "x/../../p.txt"):
+        carpeta = os.path.abspath(lote.carpeta_salida(ruta, "salida"))
+        assert os.path.commonpath([base, carpeta]) == base, ruta
+    assert lote.carpeta_salida("../otros/p.txt", "salida") == os.path.join("salida", "otros", "p.txt")
+
+
+def test_carpeta_salida_conserva_extension():
+    assert lote.carpeta_salida("a.txt", "salida") != lote.carpeta_salida("a.md", "salida")
+
+
+def test_carpeta_salida_sin_nombre():
+    with pytest.raises(ValueError):
+        lote.carpeta_salida("..", "salida")
+
+
+def test_falla_de_un_archivo_no_detiene_el_lote(tmp_path, monkeypatch, sin_cache):
+    rutas = []
+    for nombre, codigo in (("a.txt", "clase @A { }"), ("b.txt", "clase @B { }")):
+        ruta = tmp_path / nombre
+        ruta.write_text(codigo, encoding="utf-8")
+        rutas.append(str(ruta))
+
+    original = lote.analizar_con_cache
+
+    def analizar(codigo, *args, **kwargs):
+        if "@A" in codigo:
+            raise RecursionError("maximum recursion depth exceeded")
+        return original(codigo, *args, **kwargs)
+
+    monkeypatch.setattr(lote, "analizar_con_cache", analizar)
+    resumenes = list(lote.analizar_lote(rutas, trabajadores=1, usar_cache=False))
+    assert resumenes[0] == {"archivo": rutas[0],
+                            "error": "RecursionError: maximum recursion depth exceeded"}
+    assert resumenes[1]["tokens"] == 4
+
+
+def test_tablas_por_archivo(tmp_path, sin_cache):
+    fuente = tmp_path / "src" / "p.txt"
+    fuente.parent.mkdir()
+    fuente.write_text("clase @P { }", encoding="utf-8")
+    salida = tmp_path / "salida"
+    (r,) = lote.analizar_lote([str(fuente)], trabajadores=1, dir_salida=str(salida))
+    assert "error" not in r
+    carpeta = lote.carpeta_salida(str(fuente), str(salida))
+    assert sorted(os.listdir(carpeta)) == ["Errores.txt", "Errores_Sintácticos.txt", "Tokens.txt"]
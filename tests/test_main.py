@@ -0,0 +1,26 @@
+import main
+
+# Más anidado que el límite de recursión de Python
+PROFUNDO = 5000
+
+
+def test_main_escribe_tablas(anidado, tmp_path, monkeypatch, sin_cache):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "p.txt").write_text(anidado(PROFUNDO), encoding="utf-8")
+    for _ in range(2):  # fallo y acierto de caché
+        main.analizar_archivo("p.txt")
+        with open("Tokens.txt", encoding="utf-8") as f:
+            assert sum(1 for _ in f) == 2 * PROFUNDO + 18 + 1  # + encabezado
+
+
+def test_main_en_bloques_igual_que_sin_cache(tmp_path, monkeypatch, sin_cache):
+    from generador import generar_programa
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "p.txt").write_text(generar_programa(metodos=3, tasa_errores=0.2, semilla=3),
+                                    encoding="utf-8")
+    tablas = []
+    for usar_cache in (False, True, True):  # en bloques, fallo y acierto de caché
+        main.analizar_archivo("p.txt", usar_cache=usar_cache)
+        tablas.append([(tmp_path / n).read_bytes() for n in ("Tokens.txt", "Errores.txt")])
+    assert tablas[0] == tablas[1] == tablas[2]
@@ -0,0 +1,41 @@
+import pytest
+
+import paralelo
+from generador import generar_programa
+from lexer import scan
+
+# Saltos CRLF y raros entre fragmentos para comprobar la numeración de líneas
+FUENTE = (generar_programa(metodos=6, tasa_errores=0.2, semilla=13)
+          .replace("{\n", "{\r\n").replace("}\n", "}\x0c\n", 40) + " var %x ; \"ñandú\" ¿\n")
+
+
+def _tuplas(tokens, errores):
+    return ([(t.lexema, t.codigo, t.linea, t.columna) for t in tokens],
+            [(e.lexema, e.descripcion, e.linea, e.columna) for e in errores])
+
+
+def test_fragmentos_terminan_en_salto():
+    datos = FUENTE.encode("utf-8")
+    rangos = paralelo.fragmentos(datos, 7)
+    assert len(rangos) == 7
+    assert rangos[0][0] == 0 and rangos[-1][1] == len(datos)
+    assert all(b == c for (_, b), (c, _) in zip(rangos, rangos[1:]))
+    assert all(datos[b - 1:b] == b"\n" for _, b in rangos[:-1])
+
+
+@pytest.mark.parametrize("trabajadores", [1, 3])
+def test_igual_al_serial(tmp_path, monkeypatch, trabajadores):
+    monkeypatch.setattr(paralelo, "MIN_FRAGMENTO", 256)
+    ruta = tmp_path / "p.txt"
+    ruta.write_bytes(FUENTE.encode("utf-8"))
+    tokens, errores = paralelo.scan_paralelo(str(ruta), trabajadores)
+    esperado = scan(FUENTE, motor="regex")
+    assert _tuplas(tokens, errores) == _tuplas(*esperado)
+    assert list(tokens.lexemas()) == [t.lexema for t in esperado[0]]
+
+
+def test_archivo_vacio(tmp_path):
+    ruta = tmp_path / "vacio.txt"
+    ruta.write_bytes(b"")
+    tokens, errores = paralelo.scan_paralelo(str(ruta), 2)
+    assert len(tokens) == 0 and errores == []
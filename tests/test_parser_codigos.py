@@ -0,0 +1,33 @@
+import pytest
+
+from lexer import scan
+from parser_codigos import ParserCodigos
+from sintactic import Parser, tokens_desde_lexer
+from tabla_binaria import TablaBinaria, escribir_tabla_binaria
+from token_stream import TokenStream
+
+CODIGOS = [
+    "clase @P\n{\n var %x ;\n metodo vacio @main ( )\n {\n  %x = @f ( 1 , 2 ) ;\n }\n}\n",
+    "clase @P\n{\n metodo vacio @main ( )\n {\n  %x = ( 1 + ;\n  si ( ) { }\n }\n",
+    "clase @P { metodo vacio @m ( ) { %x = @f",     # llamada cortada por el EOF
+    "",
+]
+
+
+@pytest.mark.parametrize("codigo", CODIGOS)
+def test_mismos_errores_que_parser(codigo, tmp_path):
+    tokens, _ = scan(codigo, motor="regex")
+    esperado = Parser(tokens_desde_lexer(tokens)).parse(reporte=False)
+    stream, _ = TokenStream.desde_codigo(codigo)
+    assert ParserCodigos(tokens).parse(reporte=False) == esperado
+    assert ParserCodigos(stream).parse(reporte=False) == esperado
+
+    ruta = str(tmp_path / "Tokens.bin")
+    escribir_tabla_binaria(tokens, ruta)
+    with TablaBinaria(ruta) as tabla:
+        assert ParserCodigos(tabla).parse(reporte=False) == esperado
+
+
+def test_columnas_sin_copia():
+    stream, _ = TokenStream.desde_codigo(CODIGOS[0])
+    assert ParserCodigos(stream).codigos is stream.codigos
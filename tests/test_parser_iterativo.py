@@ -0,0 +1,71 @@
+import ast
+import sys
+
+import pytest
+
+import analizador
+import parser_iterativo
+import sintactic
+from lexer import scan
+from parser_codigos import ParserCodigos
+from parser_iterativo import ParserIterativo, ParserCodigosIterativo, _LlamadasAYield
+from sintactic import Parser, tokens_desde_lexer
+
+CODIGO = ("clase @P\n{\n var %x ;\n metodo vacio @main ( )\n {\n"
+          "  %x = ( 1 + @f ( 2 ) ;\n  si ( %x > ) { mientras ( %x < 3 ) { %x++ ; } }\n }\n")
+# Más anidado que el límite de recursión de Python
+PROFUNDO = 5000
+
+
+def test_generado_al_dia():
+    # Si falla: python parser_iterativo.py --generar
+    with open(parser_iterativo.ARCHIVO_GENERADO, encoding="utf-8") as f:
+        guardado = f.read()
+    assert ast.dump(ast.parse(guardado)) == ast.dump(ast.parse(parser_iterativo.generar()))
+
+
+def test_mismos_errores_que_el_recursivo():
+    tokens, _ = scan(CODIGO, motor="regex")
+    assert ParserCodigosIterativo(tokens).parse(reporte=False) == \
+           ParserCodigos(tokens).parse(reporte=False) != []
+    parser_tokens = tokens_desde_lexer(tokens)
+    assert ParserIterativo(parser_tokens).parse(reporte=False) == \
+           Parser(parser_tokens).parse(reporte=False)
+
+
+def test_sin_limite_de_recursion(anidado):
+    n = sys.getrecursionlimit() * 2
+    tokens, _ = scan(anidado(n), motor="regex")
+    assert ParserIterativo(tokens_desde_lexer(tokens)).parse(reporte=False) == []
+
+
+@pytest.mark.parametrize("fuente", [
+    "def EXP(self):\n    if self.OPERANDO():\n        pass\n",
+    "def EXP(self):\n    x = self.OPERANDO()\n",
+    "def EXP(self):\n    self.OPERANDO()\n    return True\n",
+])
+def test_generacion_rechaza_valores(fuente):
+    with pytest.raises(ValueError):
+        _LlamadasAYield({"EXP", "OPERANDO"}, "EXP").visit(ast.parse(fuente))
+
+
+def test_analyze_sin_limite(anidado):
+    res = analizador.analyze(anidado(PROFUNDO))
+    assert res.errores_sintacticos == []
+    assert len(res.tokens) == 2 * PROFUNDO + 18
+
+
+def test_parsear_mismos_errores(anidado):
+    codigo = anidado(50).replace("%x =", "%x")
+    tokens, _ = scan(codigo, motor="regex")
+    assert analizador.parsear(tokens) == analizador.parsear(tokens, iterativo=True)
+
+
+def test_sintactic_main_tabla(anidado, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    tokens, _ = scan(anidado(300), motor="regex")
+    analizador.escribir_tabla_tokens(tokens, "Tokens.txt")
+    monkeypatch.setattr(sys, "argv", ["sintactic.py", "Tokens.txt", "--sin-cache"])
+    sintactic.main()
+    salida = capsys.readouterr().out
+    assert "SIN ERRORES" in salida and "inesperado" not in salida
@@ -0,0 +1,56 @@
+import pytest
+
+from arbol import ParserAST, ParserASTIterativo
+from lexer import scan
+from parser_codigos import ParserCodigos
+from parser_iterativo import ParserCodigosIterativo, ParserIterativo
+from sintactic import MAX_ERRORES, AnalisisDetenido, Parser, tokens_desde_lexer
+
+# Un token fuera de lugar dentro de bloques anidados
+ANIDADO = ("clase @P\n{\n var %x ;\n metodo vacio @m ( )\n {\n  si ( %x > 1 ) {\n"
+           "   mientras ( %x < 3 ) {\n    %x = 1 ;\n    var\n   }\n  }\n }\n}\n")
+# Expresiones cortadas (sin las ')' que faltan) y un error aparte después
+CORTADAS = ("clase @P\n{\n var %x ;\n metodo vacio @m ( )\n {\n  si ( %x > ) {\n"
+            "   %x = ( 1 + ;\n   %x = 1 ;\n  }\n  %x 2 ;\n }\n}\n")
+
+
+def _repetido(n):
+    return "clase @P\n{\n metodo vacio @m ( )\n {\n" + "  %x = ;\n" * n + " }\n}\n"
+
+
+def _parsers(tokens, **opciones):
+    lista = tokens_desde_lexer(tokens)
+    return [Parser(lista, **opciones), ParserIterativo(lista, **opciones)] + [
+        cls(tokens, **opciones) for cls in (ParserCodigos, ParserCodigosIterativo,
+                                            ParserAST, ParserASTIterativo)]
+
+
+@pytest.mark.parametrize("codigo, esperado", [
+    # Las '}' que faltan a cada bloque que encierra el 'var' no se reportan
+    (ANIDADO, ["[L9] Falta '}' al final de 'mientras' — encontrado 'var'"]),
+    (CORTADAS, ["[L6] Se esperaba identificador, constante o '(' en expresión aritmética — encontrado ')'",
+                "[L7] Se esperaba identificador, constante o '(' en expresión aritmética — encontrado ';'",
+                "[L10] Falta operador de asignación (=, +=, -=, *=, /=, ++ o --) — encontrado '2'"]),
+])
+def test_sin_cascadas(codigo, esperado):
+    tokens, _ = scan(codigo)
+    for parser in _parsers(tokens):
+        assert parser.parse(reporte=False) == esperado, type(parser).__name__
+
+
+def test_maximo_de_errores():
+    tokens, _ = scan(_repetido(30))
+    for parser in _parsers(tokens, max_errores=5):
+        errores = parser.parse(reporte=False)
+        assert len(errores) == 6, type(parser).__name__
+        assert errores[-1] == "[L9] Se alcanzó el máximo de 5 errores; análisis detenido"
+    for parser in _parsers(tokens, max_errores=0):   # 0: sin límite
+        assert len(parser.parse(reporte=False)) == 30
+
+
+def test_analisis_detenido():
+    tokens, _ = scan(_repetido(MAX_ERRORES + 10))
+    parser = ParserCodigos(tokens)
+    with pytest.raises(AnalisisDetenido):
+        parser.PROG()
+    assert len(parser.errores) == MAX_ERRORES + 1
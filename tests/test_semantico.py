@@ -0,0 +1,59 @@
+from analizador import analyze
+from lexer import scan
+from semantico import analizar_tokens
+
+PROGRAMA = """clase @P
+{
+ var %x ;
+ metodo vacio @main ( )
+ {
+  %y = 1 ;
+  %x = 2 ;
+ }
+}
+"""
+
+
+def test_no_declarado():
+    res = analyze(PROGRAMA, semantico=True)
+    assert res.errores_sintacticos == []
+    assert res.errores_semanticos == ["[L6] Identificador '%y' no declarado"]
+
+
+def test_sin_errores():
+    res = analyze(PROGRAMA.replace("%y", "%x"), semantico=True)
+    assert res.errores_semanticos == []
+
+
+def test_sin_semantico_no_hay_lista():
+    assert analyze(PROGRAMA).errores_semanticos is None
+
+AMBITOS = """clase @P
+{
+ var %x ;
+ metodo vacio @a ( %p )
+ {
+  var %x , %l ;
+  var %l ;
+  %l = %p ;
+ }
+ metodo vacio @b ( )
+ {
+  %l = %x ;
+ }
+}
+"""
+
+
+def test_ambitos():
+    # %x del método oculta al de la clase; %l no es visible fuera de @a
+    res = analyze(AMBITOS, semantico=True)
+    assert res.errores_sintacticos == []
+    assert res.errores_semanticos == ["[L7] '%l' ya fue declarado (variable, línea 6)",
+                                      "[L12] Identificador '%l' no declarado"]
+
+
+def test_semantico_sin_limite(anidado):
+    tokens, _ = scan(anidado(5000), motor="regex")
+    sintacticos, semanticos = analizar_tokens(tokens)
+    assert sintacticos == [] and semanticos == []
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import json
+
+import servidor
+
+
+def test_peticion_invalida():
+    estado, datos = servidor.atender_peticion(b'{"fuente": 1}')
+    assert estado == 400 and "error" in json.loads(datos)
+
+
+def test_peticion_valida():
+    estado, datos = servidor.atender_peticion(b'{"codigo": "clase @P { }"}', usar_cache=False)
+    assert estado == 200 and json.loads(datos)["tokens"] == 4
+
+
+def test_falla_del_analisis_da_500(monkeypatch):
+    def falla(*args, **kwargs):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(servidor, "analizar_con_cache", falla)
+    estado, datos = servidor.atender_peticion(b'{"codigo": "x"}')
+    assert estado == 500 and "RecursionError" in json.loads(datos)["error"]
+    assert servidor._RAZONES[500]
+
+
+def test_procesar_responde_si_falla_el_trabajador():
+    class EjecutorRoto:
+        def submit(self, *args, **kwargs):
+            raise RuntimeError("proceso de trabajo caído")
+
+    s = servidor.ServidorAnalisis()
+    s.ejecutor = EjecutorRoto()
+    estado, datos = asyncio.run(s.procesar(b'{"codigo": ""}'))
+    assert estado == 500 and "caído" in json.loads(datos)["error"]
+    assert s.en_curso == 0
+
+
+def test_cliente_no_importa_el_analizador():
+    import subprocess
+    import sys
+
+    raiz = os.path.dirname(os.path.abspath(servidor.__file__))
+    programa = ("import sys, cliente\n"
+                "print(' '.join(n for n in ('lexer', 'sintactic', 'parser_codigos', 'tablas')"
+                " if n in sys.modules))\n")
+    salida = subprocess.run([sys.executable, "-c", programa], cwd=raiz, capture_output=True,
+                            text=True, check=True).stdout
+    assert salida.split() == []
+
+
+def test_tablas_remotas_iguales_a_las_locales(tmp_path, monkeypatch):
+    import cliente
+    from analizador import analyze, exportar
+
+    codigo = "clase @P\n{\n var %x ;\n ¿\n metodo vacio @m ( )\n {\n  %x = ;\n }\n}\n"
+    estado, datos = servidor.atender_peticion(
+        json.dumps({"codigo": codigo, "tokens": True, "semantico": True}).encode("utf-8"),
+        usar_cache=False)
+    assert estado == 200
+    remoto, local = tmp_path / "remoto", tmp_path / "local"
+    remoto.mkdir()
+    local.mkdir()
+    monkeypatch.chdir(remoto)
+    cliente.escribir_tablas_remotas(json.loads(datos))
+    monkeypatch.chdir(local)
+    exportar(analyze(codigo, semantico=True))
+    for nombre in sorted(os.listdir(local)):
+        assert (remoto / nombre).read_bytes() == (local / nombre).read_bytes(), nombre
@@ -0,0 +1,41 @@
+import pytest
+
+from analizador import escribir_tabla_tokens, parsear
+from lexer import scan
+from tabla_binaria import TablaBinaria, es_tabla_binaria, escribir_tabla_binaria, exportar_texto
+
+CODIGO = ("clase @P\n{\n var %x , $y ;\n metodo vacio @main ( )\n {\n"
+          "  %x = \"hola ñandú\" + 3.5 ;\n  si ( %x > ) { $y = 7 ; }\n }\n}\n")
+
+
+def test_ida_y_vuelta(tmp_path):
+    tokens, _ = scan(CODIGO)
+    ruta = str(tmp_path / "Tokens.bin")
+    escribir_tabla_binaria(tokens, ruta)
+    assert es_tabla_binaria(ruta)
+    with TablaBinaria(ruta) as tabla:
+        assert len(tabla) == len(tokens)
+        assert [(t.lexema, t.codigo, t.linea, t.columna) for t in tabla] == \
+               [(t.lexema, t.codigo, t.linea, t.columna) for t in tokens]
+        assert list(tabla.lexemas()) == [t.lexema for t in tokens]
+        assert tabla.lexema(len(tabla) - 1) == "}"
+        # El parser lee las columnas mapeadas directamente
+        assert parsear(tabla) == parsear(tokens) != []
+        exportar_texto(tabla, str(tmp_path / "desde_bin.txt"))
+    escribir_tabla_tokens(tokens, str(tmp_path / "Tokens.txt"))
+    assert (tmp_path / "desde_bin.txt").read_bytes() == (tmp_path / "Tokens.txt").read_bytes()
+
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / "Tokens.txt"
+    escribir_tabla_tokens(scan(CODIGO)[0], str(ruta))
+    assert not es_tabla_binaria(str(ruta))
+    with pytest.raises(ValueError):
+        TablaBinaria(str(ruta))
+
+    binaria = str(tmp_path / "Tokens.bin")
+    escribir_tabla_binaria(scan(CODIGO)[0], binaria)
+    with open(binaria, "rb+") as f:
+        f.truncate(40)
+    with pytest.raises(ValueError):
+        TablaBinaria(binaria)
@@ -0,0 +1,64 @@
+import pytest
+
+import tablas
+from generador import generar_programa
+from lexer import scan
+from token_stream import TokenStream
+
+# Lexemas de más de 25 caracteres, muchos errores y líneas con varios tokens
+CODIGO = (generar_programa(metodos=4, tasa_errores=0.3, semilla=11)
+          + '\n%x = "una cadena bastante más larga que la columna" ¿ ;\n')
+
+
+def _referencia(tokens, errores, ruta_tokens, ruta_errores):
+    """Las tablas tal como las escribía main.py originalmente, fila por fila."""
+    with open(ruta_tokens, "w", encoding="utf-8") as f:
+        f.write(f"{'Lexema':<25}{'Token':<15}{'PTS':<10}{'Línea':<10}\n")
+        for t in tokens:
+            pts = -2 if t.codigo in [-55, -56, -57, -58] else -1
+            f.write(f"{t.lexema:<25}{t.codigo:<15}{pts:<10}{t.linea:<10}\n")
+    with open(ruta_errores, "w", encoding="utf-8") as f:
+        f.write(f"{'Lexema':<25}{'Descripción':<80}{'Línea':<10}\n")
+        for e in errores:
+            f.write(f"{e.lexema:<25}{e.descripcion:<80}{e.linea:<10}\n")
+
+
+def _escribir_con_escritor(tokens, errores, ruta_tokens, ruta_errores):
+    with tablas.EscritorTablas(ruta_tokens, ruta_errores) as escritor:
+        for t in tokens:
+            escritor.agregar_token(t)
+        for e in errores:
+            escritor.agregar_error(e)
+
+
+@pytest.mark.parametrize("escribir", [
+    tablas.escribir_tablas,
+    lambda *a: tablas.escribir_tablas(*a, concurrente=False),
+    lambda t, *a: tablas.escribir_tablas(TokenStream.desde_tokens(t, CODIGO), *a),
+    _escribir_con_escritor,
+])
+def test_mismos_bytes_que_el_formato_original(escribir, tmp_path, monkeypatch):
+    # Lotes y memo de prefijos pequeños para cruzar varios vaciados
+    monkeypatch.setattr(tablas, "TAM_LOTE", 7)
+    monkeypatch.setattr(tablas, "MAX_PREFIJOS", len(tablas.PREFIJOS_FIJOS) + 5)
+    tokens, errores = scan(CODIGO)
+    assert errores
+    _referencia(tokens, errores, tmp_path / "ref_tok.txt", tmp_path / "ref_err.txt")
+    escribir(tokens, errores, str(tmp_path / "Tokens.txt"), str(tmp_path / "Errores.txt"))
+    assert (tmp_path / "Tokens.txt").read_bytes() == (tmp_path / "ref_tok.txt").read_bytes()
+    assert (tmp_path / "Errores.txt").read_bytes() == (tmp_path / "ref_err.txt").read_bytes()
+
+
+def test_escritor_cierra_la_primera_tabla_si_falla_la_segunda(tmp_path, monkeypatch):
+    abiertos = []
+    abrir = tablas._abrir
+
+    def registrar(ruta):
+        f = abrir(ruta)
+        abiertos.append(f)
+        return f
+
+    monkeypatch.setattr(tablas, "_abrir", registrar)
+    with pytest.raises(OSError):
+        tablas.EscritorTablas(str(tmp_path / "Tokens.txt"), str(tmp_path / "no" / "Errores.txt"))
+    assert len(abiertos) == 1 and abiertos[0].closed
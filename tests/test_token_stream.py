@@ -0,0 +1,37 @@
+import pytest
+
+from lexer import scan
+from token_stream import TokenStream
+
+CODIGO = ("clase @P\r\n{\n var %x , $y ;\x0c metodo vacio @main ( )\n {\n"
+          "  %x = \"hola mundo\" + 3.5 ; // comentario\n  ¿ $y = 7 ;\n }\n}")
+
+
+def _tuplas(tokens):
+    return [(t.lexema, t.codigo, t.linea, t.columna) for t in tokens]
+
+
+@pytest.mark.parametrize("tam_bloque", [1, 16, 1 << 16])
+def test_desde_codigo_igual_a_scan(tam_bloque):
+    tokens, errores = scan(CODIGO, motor="regex")
+    stream, errores_stream = TokenStream.desde_codigo(CODIGO, tam_bloque=tam_bloque)
+    assert _tuplas(stream) == _tuplas(tokens)
+    assert list(stream.lexemas()) == [t.lexema for t in tokens]
+    assert [(e.lexema, e.linea) for e in errores_stream] == [(e.lexema, e.linea) for e in errores]
+
+
+def test_desde_tokens_e_indices():
+    tokens, _ = scan(CODIGO, motor="regex")
+    stream = TokenStream.desde_tokens(tokens, CODIGO)
+    assert _tuplas(stream) == _tuplas(tokens)
+    assert len(stream) == len(tokens)
+    assert stream.lexema(3) == tokens[3].lexema
+    assert _tuplas([stream[-1]]) == _tuplas([tokens[-1]])
+    # Las columnas son arreglos compactos, no listas de objetos
+    assert stream.codigos.typecode == "b" and stream.inicios.typecode == "q"
+
+
+def test_vacio():
+    stream, errores = TokenStream.desde_codigo("")
+    assert len(stream) == 0 and list(stream) == [] and errores == []
+    assert len(TokenStream.desde_tokens([], "texto")) == 0
@@ -0,0 +1,48 @@
+import vigilar
+
+
+def test_error_de_analisis_no_detiene_la_vigilancia(tmp_path, monkeypatch):
+    ruta = tmp_path / "p.txt"
+    ruta.write_text("clase @P { }", encoding="utf-8")
+    mensajes = []
+    v = vigilar.Vigilante([str(ruta)], informar=mensajes.append)
+    v.procesar(v.cambios())
+
+    original = vigilar.ArchivoVigilado._analizar
+
+    def falla(self):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(vigilar.ArchivoVigilado, "_analizar", falla)
+    ruta.write_text("clase @P { var %x ; }", encoding="utf-8")
+    v.procesar(v.cambios())
+    assert "ERROR RecursionError" in mensajes[-1]
+    assert str(ruta) not in v.archivos
+
+    # El siguiente cambio vuelve a analizar el archivo desde cero
+    monkeypatch.setattr(vigilar.ArchivoVigilado, "_analizar", original)
+    ruta.write_text("clase @P { var %x }", encoding="utf-8")
+    v.procesar(v.cambios())
+    assert v.archivos[str(ruta)].resultado.errores_sintacticos
+
+
+def test_delta_de_errores(tmp_path):
+    ruta = tmp_path / "p.txt"
+    ruta.write_text("clase @P\n{\n var %x ;\n}\n", encoding="utf-8")
+    v = vigilar.Vigilante([str(ruta)], informar=lambda m: None)
+    v.procesar(v.cambios())
+    delta = v.archivos[str(ruta)].actualizar("clase @P\n{\n var %x\n}\n")
+    assert [(linea, tipo) for linea, tipo, _ in delta.nuevos] == [(4, "sintáctico")]
+    assert delta.corregidos == []
+
+
+def test_vigilar_archivo_profundo(anidado, tmp_path):
+    ruta = tmp_path / "p.txt"
+    ruta.write_text(anidado(10), encoding="utf-8")
+    mensajes = []
+    v = vigilar.Vigilante([str(ruta)], informar=mensajes.append)
+    v.procesar(v.cambios())
+    ruta.write_text(anidado(5000), encoding="utf-8")
+    v.procesar(v.cambios())
+    assert not any("ERROR" in m for m in mensajes)
+    assert v.archivos[str(ruta)].resultado.errores_sintacticos == []
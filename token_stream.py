@@ -0,0 +1,101 @@
+# token_stream.py
+# Almacenamiento columnar de tokens: en lugar de un objeto Token por lexema,
+# cinco arreglos compactos y los lexemas como desplazamientos en el fuente.
+# Es la forma en que viajan los tokens por la tubería (analyze, la caché, el
+# léxico incremental y el paralelo); Parser, ParserCodigos y las tablas lo
+# leen sin materializar un Token por lexema.
+from array import array
+
+from lexer import MOTORES, TAM_BLOQUE, Token
+
+
+def _inicios_de_linea(texto):
+    """Desplazamiento en `texto` del inicio de cada línea (según splitlines)."""
+    inicios = [0]
+    for linea in texto.splitlines(keepends=True):
+        inicios.append(inicios[-1] + len(linea))
+    return inicios
+
+
+class TokenStream:
+    def __init__(self, fuente="", codigos=None, lineas=None, columnas=None,
+                 inicios=None, longitudes=None):
+        self.fuente = fuente                                         # texto del que salen los lexemas
+        self.codigos = array('b') if codigos is None else codigos    # código de token (TokenCodes.MAP)
+        self.lineas = array('i') if lineas is None else lineas
+        self.columnas = array('i') if columnas is None else columnas
+        self.inicios = array('q') if inicios is None else inicios    # desplazamiento del lexema en fuente
+        self.longitudes = array('i') if longitudes is None else longitudes
+
+    @classmethod
+    def desde_codigo(cls, codigo, motor="regex", tam_bloque=TAM_BLOQUE):
+        """
+        Analiza `codigo` y devuelve (stream, errores). Se procesa por bloques
+        de líneas: solo los tokens de un bloque existen como objetos a la vez.
+        """
+        try:
+            scan_texto = MOTORES[motor]
+        except KeyError:
+            raise ValueError(f"Motor de análisis léxico desconocido: {motor!r}") from None
+
+        stream = cls(codigo)
+        errores = []
+        num_linea = 1
+        base = 0  # desplazamiento del inicio del bloque en codigo
+        while base < len(codigo):
+            # El bloque termina justo después de un '\n' (o al final del texto)
+            fin = codigo.find('\n', base + tam_bloque) + 1 or len(codigo)
+            bloque = codigo[base:fin]
+            tokens = []
+            scan_texto(bloque, num_linea, tokens, errores)
+            inicios_linea = _inicios_de_linea(bloque)
+            stream._extender(tokens, inicios_linea, base, num_linea)
+            num_linea += len(inicios_linea) - 1
+            base = fin
+        return stream, errores
+
+    @classmethod
+    def desde_tokens(cls, tokens, fuente, primera_linea=1):
+        """Stream de los lexer.Token que el lexer produjo sobre `fuente` (desde la línea primera_linea)."""
+        stream = cls(fuente)
+        if tokens:
+            stream._extender(tokens, _inicios_de_linea(fuente), 0, primera_linea)
+        return stream
+
+    def _extender(self, tokens, inicios_linea, base, primera_linea):
+        # Columna por columna con listas por comprensión: mucho más rápido
+        # que agregar() token por token
+        self.codigos.extend([t.codigo for t in tokens])
+        self.lineas.extend([t.linea for t in tokens])
+        self.columnas.extend([t.columna for t in tokens])
+        self.inicios.extend([base + inicios_linea[t.linea - primera_linea] + t.columna - 1
+                             for t in tokens])
+        self.longitudes.extend([len(t.lexema) for t in tokens])
+
+    def agregar(self, codigo, linea, columna, inicio, longitud):
+        self.codigos.append(codigo)
+        self.lineas.append(linea)
+        self.columnas.append(columna)
+        self.inicios.append(inicio)
+        self.longitudes.append(longitud)
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def lexema(self, i):
+        a = self.inicios[i]
+        return self.fuente[a:a + self.longitudes[i]]
+
+    def lexemas(self):
+        """Iterador de los lexemas en orden."""
+        fuente = self.fuente
+        return (fuente[a:a + n] for a, n in zip(self.inicios, self.longitudes))
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return Token(self.lexema(i), self.codigos[i], self.lineas[i], self.columnas[i])
+
+    def __iter__(self):
+        for lexema, codigo, linea, columna in zip(self.lexemas(), self.codigos, self.lineas, self.columnas):
+            yield Token(lexema, codigo, linea, columna)
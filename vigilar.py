@@ -0,0 +1,257 @@
+# vigilar.py
+# Modo --watch: vigila archivos fuente (rutas, directorios o globs, como
+# --lote) y vuelve a analizar solo los que cambian. No usa servicios
+# externos: sondea os.stat (mtime y tamaño) cada `intervalo` segundos, y una
+# ráfaga de cambios (un editor que guarda en varios pasos, un checkout) se
+# agrupa hasta que pasan `espera` segundos sin cambios nuevos.
+#
+# Cada archivo guarda su LexerIncremental: al cambiar, se recortan las líneas
+# iguales del principio y del final y solo el bloque de en medio se vuelve a
+# analizar léxicamente; el parser corre sobre todos los tokens. Se imprime
+# el delta de errores léxicos y sintácticos: los nuevos y los corregidos,
+# comparando las líneas viejas ya desplazadas a su número nuevo.
+import os
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from analizador import Resultado, exportar, parsear
+from incremental import LexerIncremental
+from lote import expandir_entradas, carpeta_salida
+
+_LINEA_SINTACTICO = re.compile(r"\[L(-?\d+)\] ")
+
+
+def bloque_cambiado(viejas, nuevas):
+    """
+    (inicio, fin_viejo, fin_nuevo): las líneas viejas[inicio:fin_viejo]
+    pasaron a ser nuevas[inicio:fin_nuevo]; el resto es el mismo prefijo y
+    sufijo en ambas.
+    """
+    n = min(len(viejas), len(nuevas))
+    inicio = 0
+    while inicio < n and viejas[inicio] == nuevas[inicio]:
+        inicio += 1
+    sufijo = 0
+    while sufijo < n - inicio and viejas[-1 - sufijo] == nuevas[-1 - sufijo]:
+        sufijo += 1
+    return inicio, len(viejas) - sufijo, len(nuevas) - sufijo
+
+
+def _mapa_lineas(inicio, fin_viejo, fin_nuevo):
+    """Número nuevo de cada línea vieja (1-based), o None si ya no existe."""
+    def mapa(linea):
+        if linea <= inicio:
+            return linea
+        if linea > fin_viejo:
+            return linea + fin_nuevo - fin_viejo
+        # Dentro del bloque cambiado se compara por posición
+        return linea if linea <= fin_nuevo else None
+    return mapa
+
+
+@dataclass
+class Delta:
+    nuevos: list = field(default_factory=list)       # (línea, tipo, mensaje)
+    corregidos: list = field(default_factory=list)   # (línea vieja, tipo, mensaje)
+    lineas_analizadas: int = 0
+
+
+def _errores(resultado):
+    """(línea, tipo, mensaje) de cada error léxico y sintáctico del resultado."""
+    for e in resultado.errores_lexicos:
+        yield e.linea, "léxico", f"{e.descripcion.strip()} '{e.lexema}' (col {e.columna})"
+    for msg in resultado.errores_sintacticos:
+        m = _LINEA_SINTACTICO.match(msg)
+        if m:
+            yield int(m.group(1)), "sintáctico", msg[m.end():]
+        else:
+            yield None, "sintáctico", msg
+
+
+def comparar_errores(anterior, actual, mapa=lambda linea: linea):
+    """
+    Delta entre los errores de dos resultados. `mapa` lleva cada línea del
+    resultado anterior a su número actual: un error que solo se desplazó
+    con las líneas de arriba no cuenta como corregido ni como nuevo.
+    """
+    delta = Delta()
+    pendientes = Counter()
+    for linea, tipo, msg in _errores(anterior):
+        pendientes[(linea if linea is None else mapa(linea), tipo, msg)] += 1
+    for linea, tipo, msg in _errores(actual):
+        clave = (linea, tipo, msg)
+        if pendientes[clave]:
+            pendientes[clave] -= 1
+        else:
+            delta.nuevos.append(clave)
+    for linea, tipo, msg in _errores(anterior):
+        clave = (linea if linea is None else mapa(linea), tipo, msg)
+        if pendientes[clave]:
+            pendientes[clave] -= 1
+            delta.corregidos.append((linea, tipo, msg))
+    return delta
+
+
+class ArchivoVigilado:
+    """Un fuente vigilado: su LexerIncremental y el resultado del último análisis."""
+
+    def __init__(self, texto, motor="regex"):
+        self.lineas = texto.splitlines()
+        self.lexer = LexerIncremental(texto, motor)
+        self.resultado = self._analizar()
+
+    def _analizar(self):
+        tokens = self.lexer.columnas()
+        return Resultado(tokens, list(self.lexer.errores()), parsear(tokens))
+
+    def actualizar(self, texto):
+        """Aplica el contenido nuevo del archivo y devuelve el Delta de errores."""
+        nuevas = texto.splitlines()
+        inicio, fin_viejo, fin_nuevo = bloque_cambiado(self.lineas, nuevas)
+        bloque = nuevas[inicio:fin_nuevo]
+        # "\n" final: editar() usa splitlines() y [""] debe seguir siendo una línea
+        self.lexer.editar(inicio + 1, fin_viejo, "\n".join(bloque) + "\n" if bloque else "")
+        self.lineas = nuevas
+        anterior, self.resultado = self.resultado, self._analizar()
+        delta = comparar_errores(anterior, self.resultado, _mapa_lineas(inicio, fin_viejo, fin_nuevo))
+        delta.lineas_analizadas = len(bloque)
+        return delta
+
+
+def firma(ruta):
+    """(mtime_ns, tamaño) del archivo, o None si no se puede consultar."""
+    try:
+        st = os.stat(ruta)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Vigilante:
+    """
+    Vigila `entradas` (rutas, directorios o globs) y re-analiza los archivos
+    que cambian. Con dir_salida escribe las tablas de cada archivo en su
+    carpeta (como --lote); con tablas_locales, las de siempre (Tokens.txt,
+    Errores.txt, Errores_Sintácticos.txt) en el directorio actual.
+    """
+
+    def __init__(self, entradas, motor="regex", intervalo=0.5, espera=0.3, dir_salida=None,
+                 tablas_locales=False, informar=print):
+        self.entradas = entradas
+        self.motor = motor
+        self.intervalo = intervalo
+        self.espera = espera
+        self.dir_salida = dir_salida
+        self.tablas_locales = tablas_locales
+        self.informar = informar
+        self.archivos = {}   # ruta -> ArchivoVigilado
+        self.firmas = {}     # ruta -> firma con la que se analizó por última vez
+
+    def sondear(self):
+        """Firma actual de cada archivo que coincide con las entradas."""
+        firmas = {}
+        for ruta in expandir_entradas(self.entradas):
+            f = firma(ruta)
+            if f is not None:
+                firmas[ruta] = f
+        return firmas
+
+    def cambios(self):
+        """{ruta: firma nueva} de lo que cambió desde el último análisis (None: borrado)."""
+        actuales = self.sondear()
+        cambios = {r: f for r, f in actuales.items() if self.firmas.get(r) != f}
+        cambios.update((r, None) for r in self.firmas if r not in actuales)
+        return cambios
+
+    def esperar_cambios(self):
+        """Bloquea hasta que haya cambios y lleven `espera` segundos quietos."""
+        pendientes = {}
+        desde = 0.0
+        while True:
+            time.sleep(min(self.intervalo, self.espera) if pendientes else self.intervalo)
+            cambios = self.cambios()
+            if cambios != pendientes:
+                # Algo se movió (o volvió a su estado): reiniciar la espera
+                pendientes, desde = cambios, time.monotonic()
+            elif pendientes and time.monotonic() - desde >= self.espera:
+                return pendientes
+
+    def procesar(self, cambios, detallar=True):
+        """
+        Re-analiza los archivos cambiados e informa el delta de errores de
+        cada uno. De un archivo nuevo se da el resumen y, con detallar,
+        también sus errores.
+        """
+        hora = time.strftime("%H:%M:%S")
+        for ruta in sorted(cambios):
+            f = cambios[ruta]
+            if f is None:
+                self.archivos.pop(ruta, None)
+                self.firmas.pop(ruta, None)
+                self.informar(f"[{hora}] {ruta}: eliminado")
+                continue
+            self.firmas[ruta] = f
+            try:
+                with open(ruta, "r", encoding="utf-8") as fuente:
+                    texto = fuente.read()
+            except (OSError, UnicodeDecodeError) as e:
+                self.informar(f"[{hora}] {ruta}: ERROR {e}")
+                continue
+
+            archivo = self.archivos.get(ruta)
+            try:
+                if archivo is None:
+                    archivo = ArchivoVigilado(texto, self.motor)
+                    delta = None
+                else:
+                    delta = archivo.actualizar(texto)
+            except Exception as e:
+                # Un archivo que no se puede analizar no detiene la vigilancia;
+                # su estado incremental quedó a medias y se rehace al cambiar
+                self.archivos.pop(ruta, None)
+                self.informar(f"[{hora}] {ruta}: ERROR {type(e).__name__}: {e}")
+                continue
+
+            if delta is None:
+                self.archivos[ruta] = archivo
+                res = archivo.resultado
+                self.informar(f"[{hora}] {ruta}: {len(res.tokens)} tokens, "
+                              f"{len(res.errores_lexicos)} errores léxicos, "
+                              f"{len(res.errores_sintacticos)} errores sintácticos")
+                delta = comparar_errores(Resultado([], []), res) if detallar else Delta()
+            else:
+                self.informar(f"[{hora}] {ruta}: " + self._resumen(archivo, delta))
+            for linea, tipo, msg in delta.nuevos:
+                self.informar(f"  + [L{linea}] {tipo}: {msg}")
+            for linea, tipo, msg in delta.corregidos:
+                self.informar(f"  - [L{linea}] {tipo}: {msg}")
+            try:
+                self._exportar(ruta, archivo.resultado)
+            except (OSError, ValueError) as e:
+                self.informar(f"[{hora}] {ruta}: ERROR {e}")
+
+    def _resumen(self, archivo, delta):
+        res = archivo.resultado
+        return (f"{delta.lineas_analizadas} línea(s) analizadas, {len(delta.nuevos)} error(es) nuevos, "
+                f"{len(delta.corregidos)} corregidos (quedan {len(res.errores_lexicos)} léxicos, "
+                f"{len(res.errores_sintacticos)} sintácticos)")
+
+    def _exportar(self, ruta, resultado):
+        if self.dir_salida:
+            carpeta = carpeta_salida(ruta, self.dir_salida)
+            os.makedirs(carpeta, exist_ok=True)
+            exportar(resultado,
+                     os.path.join(carpeta, "Tokens.txt"),
+                     os.path.join(carpeta, "Errores.txt"),
+                     os.path.join(carpeta, "Errores_Sintácticos.txt"))
+        elif self.tablas_locales:
+            exportar(resultado)
+
+    def ejecutar(self):
+        """Análisis inicial de todo y luego re-análisis a cada cambio (hasta Ctrl+C)."""
+        self.procesar(self.cambios(), detallar=False)
+        self.informar(f"Vigilando {len(self.firmas)} archivo(s) cada {self.intervalo:g} s (Ctrl+C para salir)")
+        while True:
+            self.procesar(self.esperar_cambios())